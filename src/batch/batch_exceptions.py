@@ -0,0 +1,19 @@
+from utils.exceptions import MisnomerException
+
+
+class MisnomerBatchException(MisnomerException):
+    def __init__(self, message: str = ""):
+        message = f"Exception during batch run.\n{message}"
+        super(MisnomerBatchException, self).__init__(message)
+
+
+class MisnomerBatchInputVectorException(MisnomerBatchException):
+    def __init__(self, path: str, line_number: int):
+        message = f"Line {line_number} of file '{path}' is not a JSON array of input lines."
+        super(MisnomerBatchInputVectorException, self).__init__(message)
+
+
+class MisnomerBatchWorkersException(MisnomerBatchException):
+    def __init__(self, workers: int):
+        message = f"The number of worker processes has to be positive, not {workers}."
+        super(MisnomerBatchWorkersException, self).__init__(message)
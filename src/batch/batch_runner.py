@@ -0,0 +1,108 @@
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from batch.batch_exceptions import MisnomerBatchInputVectorException, MisnomerBatchWorkersException
+from embedding.compiled_program import CompiledProgram
+from parser.syntax_tree.syntax_tree import Program
+from utils.exceptions import MisnomerException
+
+# Jobs sent to a worker at once per worker, so that short jobs do not wait on the pool's queues
+CHUNKS_PER_WORKER = 4
+
+
+class JobResult:
+    def __init__(self, exit_code=None, output: str = "", error: str or None = None):
+        self.exit_code = exit_code
+        self.output = output
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {"exit_code": self.exit_code, "output": self.output, "error": self.error}
+
+    def __eq__(self, other):
+        return isinstance(other, JobResult) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"JobResult({self.exit_code!r}, {self.output!r}, {self.error!r})"
+
+
+def load_input_vectors(path: str) -> list[list[str]]:
+    """
+    Reads a file with one JSON array of stdin lines per job. Empty lines are skipped.
+    """
+    input_vectors = []
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                input_vector = json.loads(line)
+            except json.JSONDecodeError:
+                raise MisnomerBatchInputVectorException(path, line_number)
+            if not isinstance(input_vector, list):
+                raise MisnomerBatchInputVectorException(path, line_number)
+            input_vectors.append([str(value) for value in input_vector])
+    return input_vectors
+
+
+# Program run by a worker process, compiled once when the process starts
+_worker_program: CompiledProgram or None = None
+_worker_recursion_limit = 0
+
+
+def _initialise_worker(program: Program, engine, recursion_limit: int):
+    global _worker_program, _worker_recursion_limit
+    _worker_program = CompiledProgram(program, engine)
+    _worker_recursion_limit = recursion_limit
+
+
+def _run_job(input_vector: list[str]) -> JobResult:
+    return run_job(_worker_program, _worker_recursion_limit, input_vector)
+
+
+def run_job(program: CompiledProgram, recursion_limit: int, input_vector: list[str]) -> JobResult:
+    """
+    Runs the program with given lines on its stdin and captures what it prints.
+    Errors other than MisnomerException, like running out of input, are reported with their type.
+    """
+    stdin = io.StringIO("".join(f"{line}\n" for line in input_vector))
+    output = io.StringIO()
+    try:
+        exit_code = program.run(stdin, output, recursion_limit)
+        return JobResult(exit_code, output.getvalue())
+    except MisnomerException as error:
+        return JobResult(None, output.getvalue(), str(error))
+    except Exception as error:
+        return JobResult(None, output.getvalue(), f"{error.__class__.__name__}: {error}")
+
+
+class BatchRunner:
+    """
+    Runs one parsed program with many input vectors on a pool of worker processes. Every worker receives
+    and compiles the program once, when it starts, so a job costs only its execution. Results are given in input
+    order. The program is compiled here as well, so that invalid programs are reported before starting workers.
+    """
+    def __init__(self, program: Program, engine, recursion_limit: int, workers: int or None = None):
+        if workers is not None and workers < 1:
+            raise MisnomerBatchWorkersException(workers)
+        self._program = CompiledProgram(program, engine)
+        self._recursion_limit = recursion_limit
+        self._workers = workers or os.cpu_count() or 1
+
+    def run(self, input_vectors: list[list[str]]) -> list[JobResult]:
+        if not input_vectors:
+            return []
+        workers = min(self._workers, len(input_vectors))
+        chunk_size = max(1, len(input_vectors) // (workers * CHUNKS_PER_WORKER))
+        initargs = (self._program.program, self._program.engine, self._recursion_limit)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialise_worker, initargs=initargs) as executor:
+            return list(executor.map(_run_job, input_vectors, chunksize=chunk_size))
+
+
+def format_job_results(results: list[JobResult]) -> str:
+    """
+    One JSON object per job, in input order.
+    """
+    return "\n".join(json.dumps({"job": number, **result.to_dict()}) for number, result in enumerate(results))
@@ -0,0 +1,49 @@
+from utils.exceptions import MisnomerException
+from utils.position import Position
+
+
+def get_types_names(types) -> str:
+    return " or ".join(sorted(value_type.__name__ for value_type in types))
+
+
+class MisnomerCheckerException(MisnomerException):
+    def __init__(self, position: Position, message: str = "", give_position=True):
+        if give_position:
+            message = f"Exception during type checking at: {position}.\n{message}"
+        else:
+            message = f"Exception during type checking.\n{message}"
+        super(MisnomerCheckerException, self).__init__(message)
+
+
+class MisnomerCheckerVariableTypeException(MisnomerCheckerException):
+    def __init__(self, value_types, variable_types, name: str, position: Position):
+        message = f"Variable {name} of type {variable_types} " \
+                  f"may be given a value of type {get_types_names(value_types)}."
+        super(MisnomerCheckerVariableTypeException, self).__init__(position, message, give_position=True)
+
+
+class MisnomerCheckerParameterTypeException(MisnomerCheckerException):
+    def __init__(self, value_types, parameter_type: str, parameter_name: str, function_name: str, position: Position):
+        message = f"Parameter {parameter_name} of function {function_name} has type {parameter_type}, " \
+                  f"but may be given a value of type {get_types_names(value_types)}."
+        super(MisnomerCheckerParameterTypeException, self).__init__(position, message, give_position=True)
+
+
+class MisnomerCheckerReturnTypeException(MisnomerCheckerException):
+    def __init__(self, value_types, return_type: str, name: str, position: Position):
+        message = f"Function {name} returns {return_type}, " \
+                  f"but may return a value of type {get_types_names(value_types)}."
+        super(MisnomerCheckerReturnTypeException, self).__init__(position, message, give_position=True)
+
+
+class MisnomerCheckerOperandTypeException(MisnomerCheckerException):
+    def __init__(self, operation: str, operands_types, position: Position):
+        operands = ", ".join(get_types_names(types) for types in operands_types)
+        message = f"Operation {operation} may be applied to values of types: {operands}."
+        super(MisnomerCheckerOperandTypeException, self).__init__(position, message, give_position=True)
+
+
+class MisnomerCheckerArgumentsNumberException(MisnomerCheckerException):
+    def __init__(self, got_arguments_number: int, name: str, position: Position):
+        message = f"Function {name} can not be called with {got_arguments_number} arguments."
+        super(MisnomerCheckerArgumentsNumberException, self).__init__(position, message, give_position=True)
@@ -0,0 +1,307 @@
+from types import NoneType
+
+from checker.checker_exceptions import MisnomerCheckerVariableTypeException, MisnomerCheckerParameterTypeException, \
+    MisnomerCheckerReturnTypeException, MisnomerCheckerOperandTypeException, MisnomerCheckerArgumentsNumberException, \
+    get_types_names
+from interpreter.dictionaries import misnomer_types_to_python_types
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression, \
+    EqualExpression, NotEqualExpression, BinaryExpression
+from parser.syntax_tree.literals import Literal
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, FunctionCall, Identifier, Condition, \
+    IfStatement, WhileStatement, ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+from parser.types import Type
+
+INTEGER_TYPES = (int, bool)
+NUMBER_TYPES = (int, bool, float)
+
+BUILTIN_RETURN_TYPES = {
+    "print": frozenset({NoneType}),
+    "input": frozenset({str}),
+    "to_int": frozenset({int}),
+    "to_float": frozenset({float}),
+    "to_string": frozenset({str}),
+}
+
+# Minimal and maximal (None if unlimited) numbers of arguments
+BUILTIN_ARGUMENTS_NUMBERS = {
+    "print": (0, None),
+    "input": (0, 1),
+    "find_max": (1, None),
+    "find_min": (1, None),
+    "to_int": (1, 1),
+    "to_float": (1, 1),
+    "to_string": (1, 1),
+}
+
+
+def add_types(left: type, right: type) -> type or None:
+    """
+    :return: type of the sum of values of given types, None if they can not be added
+    """
+    if left in INTEGER_TYPES and right in INTEGER_TYPES:
+        return int
+    if left in NUMBER_TYPES and right in NUMBER_TYPES:
+        return float
+    return None
+
+
+def multiply_types(left: type, right: type) -> type or None:
+    """
+    :return: type of the product of values of given types, None if they can not be multiplied
+    """
+    if (left is str and right in INTEGER_TYPES) or (right is str and left in INTEGER_TYPES):
+        return str
+    return add_types(left, right)
+
+
+def are_comparable(left: type, right: type) -> bool:
+    return (left in NUMBER_TYPES and right in NUMBER_TYPES) or (left is str and right is str)
+
+
+def get_allowed_types(misnomer_type: Type) -> frozenset:
+    return frozenset(misnomer_types_to_python_types[misnomer_type])
+
+
+class StaticTypeChecker:
+    """
+    Infers the Python types values of the program may have at run time. Type checks which are proven to pass
+    are disabled in the syntax tree. In the strict mode, the program is rejected instead if any check may fail
+    or any operation may be given operands of wrong types.
+
+    Variables keep the type of their initial value, as assignments may not change it, so a variable may have
+    any type its initialisations give it. Values returned by functions and given to parameters have the
+    declared types, as they are either checked or proven to have them.
+    """
+    def __init__(self, program: Program, strict=False):
+        self._program = program
+        self._strict = strict
+        self._function: FunctionDefinition or None = None
+        self._variables: dict[str, frozenset] = {}
+        self._failures = []
+
+    def check(self):
+        """
+        :raises MisnomerCheckerException: in the strict mode, when the program may be ill-typed
+        """
+        for function in self._program.function_definitions.values():
+            self.check_function(function)
+            if self._strict and self._failures:
+                raise self._failures[0]
+        self._program.type_checked = True
+        # Calls linked before the checks were disabled choose their paths again
+        self._program.calls_linked = False
+
+    def check_function(self, function: FunctionDefinition):
+        self._function = function
+        self._variables = {name: get_allowed_types(parameter.argument_type)
+                           for name, parameter in function.parameters.items()}
+        initialisations = [node for node in function.statement_block.iterate_nodes()
+                           if isinstance(node, VariableInitialisationStatement)]
+
+        # Initial values may depend on other variables, so types are propagated until they do not change
+        changed = True
+        while changed:
+            changed = False
+            for initialisation in initialisations:
+                value_types = self.infer(initialisation.value) & get_allowed_types(initialisation.variable_type)
+                variable_types = self._variables.get(initialisation.name, frozenset())
+                if not value_types <= variable_types:
+                    self._variables[initialisation.name] = variable_types | value_types
+                    changed = True
+
+        self._failures = []
+        self.check_statement(function.statement_block)
+        self.check_return_type(function)
+
+    def fail(self, exception):
+        self._failures.append(exception)
+
+    # Statements
+
+    def check_statement(self, statement):
+        if isinstance(statement, StatementBlock):
+            for sub_statement in statement.statements:
+                self.check_statement(sub_statement)
+        elif isinstance(statement, IfStatement):
+            self.infer(statement.condition)
+            self.check_statement(statement.instructions)
+            if statement.else_statement:
+                self.check_statement(statement.else_statement)
+        elif isinstance(statement, WhileStatement):
+            self.infer(statement.condition)
+            self.check_statement(statement.instructions)
+        elif isinstance(statement, ReturnStatement):
+            if statement.value is not None:
+                self.infer(statement.value)
+        elif isinstance(statement, VariableInitialisationStatement):
+            self.check_variable_initialisation(statement)
+        elif isinstance(statement, AssignmentStatement):
+            self.check_assignment(statement)
+        else:
+            self.infer(statement)
+
+    def check_variable_initialisation(self, statement: VariableInitialisationStatement):
+        value_types = self.infer(statement.value)
+        statement.check_type = not value_types <= get_allowed_types(statement.variable_type)
+        if statement.check_type:
+            self.fail(MisnomerCheckerVariableTypeException(value_types, statement.variable_type.name,
+                                                           statement.name, statement.position))
+
+    def check_assignment(self, statement: AssignmentStatement):
+        value_types = self.infer(statement.value)
+        # Assigning to a variable which is never initialised fails before checking the type
+        if not (variable_types := self._variables.get(statement.name, frozenset())):
+            statement.check_type = False
+            return
+        statement.check_type = len(variable_types) > 1 or not value_types <= variable_types
+        if statement.check_type:
+            self.fail(MisnomerCheckerVariableTypeException(value_types, get_types_names(variable_types),
+                                                           statement.name, statement.position))
+
+    def check_return_type(self, function: FunctionDefinition):
+        statements = list(function.statement_block.iterate_nodes())
+        return_statements = [statement for statement in statements if isinstance(statement, ReturnStatement)]
+        result_types = frozenset()
+        for return_statement in return_statements:
+            if return_statement.value is not None:
+                result_types |= self.infer(return_statement.value) - {NoneType}
+        if return_statements:
+            # Once the return flag is set, any value a called function returns may end the function
+            for statement in statements:
+                if isinstance(statement, (StatementBlock, IfStatement, WhileStatement)):
+                    for sub_statement in statement.get_children():
+                        if isinstance(sub_statement, FunctionCall):
+                            result_types |= self.infer(sub_statement) - {NoneType}
+        if not self.always_returns(function.statement_block):
+            result_types |= {NoneType}
+
+        function.check_return_type = not result_types <= get_allowed_types(function.return_type)
+        if function.check_return_type:
+            self.fail(MisnomerCheckerReturnTypeException(result_types, function.return_type.name, function.name,
+                                                         function.position))
+
+    def always_returns(self, statement) -> bool:
+        """
+        Checks whether the statement always returns from the function, instead of finishing normally.
+        """
+        if isinstance(statement, StatementBlock):
+            return any(self.always_returns(sub_statement) for sub_statement in statement.statements)
+        elif isinstance(statement, ReturnStatement):
+            return statement.value is not None and NoneType not in self.infer(statement.value)
+        elif isinstance(statement, IfStatement):
+            return bool(statement.else_statement) and self.always_returns(statement.instructions) \
+                and self.always_returns(statement.else_statement)
+        elif isinstance(statement, WhileStatement):
+            # A block ends an endless loop only by returning from the function
+            condition = statement.condition.expression
+            return isinstance(condition, Literal) and bool(condition.value) \
+                and isinstance(statement.instructions, StatementBlock)
+        return False
+
+    # Expressions
+
+    def infer(self, expression) -> frozenset:
+        """
+        :return: set of Python types the value of the expression may have
+        """
+        if isinstance(expression, Literal):
+            return frozenset({type(expression.value)})
+        elif isinstance(expression, Identifier):
+            return self._variables.get(expression.name, frozenset())
+        elif isinstance(expression, FunctionCall):
+            return self.infer_function_call(expression)
+        elif isinstance(expression, Condition):
+            return self.infer(expression.expression)
+        elif isinstance(expression, UnaryExpression):
+            return self.infer(expression.expressions)
+        elif isinstance(expression, (EqualExpression, NotEqualExpression)):
+            self.infer(expression.left)
+            self.infer(expression.right)
+            return frozenset({bool})
+        elif isinstance(expression, BinaryExpression):
+            left_types = self.infer(expression.left)
+            right_types = self.infer(expression.right)
+            if not all(are_comparable(left, right) for left in left_types for right in right_types):
+                self.fail(MisnomerCheckerOperandTypeException("comparison", [left_types, right_types],
+                                                              expression.position))
+            return frozenset({bool})
+        elif isinstance(expression, AdditiveExpression):
+            return self.infer_folded_expression(expression, "+", add_types)
+        elif isinstance(expression, MultiplicativeExpression):
+            return self.infer_folded_expression(expression, "*", multiply_types)
+        elif isinstance(expression, AdditiveInvertedExpression):
+            return self.infer_single_operand_expression(expression, "-", lambda value_type: add_types(int, value_type))
+        elif isinstance(expression, MultiplicativeInvertedExpression):
+            return self.infer_single_operand_expression(
+                expression, "/", lambda value_type: float if value_type in NUMBER_TYPES else None)
+        elif isinstance(expression, (OrExpression, AndExpression, NotExpression)):
+            for sub_expression in expression.get_children():
+                self.infer(sub_expression)
+            return frozenset({bool})
+        raise TypeError(f"Cannot infer type of {expression.__class__.__name__}.")
+
+    def infer_folded_expression(self, expression, operator_sign: str, operation) -> frozenset:
+        # Misnomer adds to 0 and multiplies 1 by all operands
+        result_types = frozenset({int})
+        operands_types = []
+        for sub_expression in expression.expressions:
+            operand_types = self.infer(sub_expression)
+            operands_types.append(operand_types)
+            combinations = [operation(left, right) for left in result_types for right in operand_types]
+            if None in combinations:
+                self.fail(MisnomerCheckerOperandTypeException(operator_sign, operands_types, expression.position))
+            result_types = frozenset(combination for combination in combinations if combination is not None)
+        return result_types
+
+    def infer_single_operand_expression(self, expression, operator_sign: str, operation) -> frozenset:
+        operand_types = self.infer(expression.expressions)
+        combinations = [operation(operand_type) for operand_type in operand_types]
+        if None in combinations:
+            self.fail(MisnomerCheckerOperandTypeException(operator_sign, [operand_types], expression.position))
+        return frozenset(combination for combination in combinations if combination is not None)
+
+    def infer_function_call(self, call: FunctionCall) -> frozenset:
+        arguments_types = [self.infer(argument) for argument in call.arguments]
+
+        if function := self._program.function_definitions.get(call.identifier):
+            parameters = list(function.parameters.values())
+            if len(arguments_types) != len(parameters):
+                self.fail(MisnomerCheckerArgumentsNumberException(len(arguments_types), function.name, call.position))
+                call.check_arguments = True
+            else:
+                call.check_arguments = False
+                for argument_types, parameter in zip(arguments_types, parameters):
+                    if not argument_types <= get_allowed_types(parameter.argument_type):
+                        call.check_arguments = True
+                        self.fail(MisnomerCheckerParameterTypeException(
+                            argument_types, parameter.argument_type.name, parameter.name, function.name,
+                            call.position))
+            return get_allowed_types(function.return_type)
+
+        if (arguments_numbers := BUILTIN_ARGUMENTS_NUMBERS.get(call.identifier)) is None:
+            # Unknown functions are reported when linking
+            return frozenset()
+        minimal_arguments_number, maximal_arguments_number = arguments_numbers
+        if len(arguments_types) < minimal_arguments_number or \
+                maximal_arguments_number is not None and len(arguments_types) > maximal_arguments_number:
+            self.fail(MisnomerCheckerArgumentsNumberException(len(arguments_types), call.identifier, call.position))
+
+        if call.identifier in ("find_max", "find_min"):
+            return self.infer_extremum(call, arguments_types)
+        if call.identifier in ("to_int", "to_float") and any(NoneType in types for types in arguments_types):
+            self.fail(MisnomerCheckerOperandTypeException(call.identifier, arguments_types, call.position))
+        return BUILTIN_RETURN_TYPES[call.identifier]
+
+    def infer_extremum(self, call: FunctionCall, arguments_types: list[frozenset]) -> frozenset:
+        if len(arguments_types) == 1:
+            # A single argument is iterated over
+            if arguments_types[0] - {str}:
+                self.fail(MisnomerCheckerOperandTypeException(call.identifier, arguments_types, call.position))
+            return arguments_types[0] & {str}
+
+        result_types = frozenset().union(*arguments_types)
+        if not all(are_comparable(left, right) for left in result_types for right in result_types):
+            self.fail(MisnomerCheckerOperandTypeException(call.identifier, arguments_types, call.position))
+        return result_types
@@ -0,0 +1,5 @@
+from embedding.compiled_program import (
+    CompiledProgram,
+    compile,
+    compiled_programs
+)
@@ -0,0 +1,76 @@
+import io
+import sys
+import threading
+
+from checker.type_checker import StaticTypeChecker
+from interpreter.input_output import BufferedInputOutput, DEFAULT_OUTPUT_BUFFER_SIZE
+from interpreter.interpreter import Interpreter
+from interpreter.memoization import MemoCache, MISSING
+from lexer.lexer import Lexer
+from optimizer.pipeline import optimise_program
+from parser.parser import Parser
+from parser.syntax_tree.syntax_tree import Program
+from utils.source_hash import hash_source
+from utils.source_reader.source_reader import StringSourceReader
+
+DEFAULT_RECURSION_LIMIT = 900
+DEFAULT_MAX_STRING_LENGTH = 1000
+# Number of compiled programs kept in memory, the least recently used one is dropped first
+COMPILED_PROGRAMS_CACHE_SIZE = 128
+
+
+class CompiledProgram:
+    """
+    Parsed program which can be run any number of times. Types are checked and the program is compiled by the engine
+    once, here, instead of on every run.
+
+    Runs may be made from many threads at the same time: every run gets a new engine, whose context keeps the
+    run's builtins, input, output and recursion limit, and the program itself is only read. Memo caches installed
+    on the program are shared by all runs and are not safe to use from many threads.
+    """
+    def __init__(self, program: Program, engine=Interpreter):
+        if not program.type_checked:
+            StaticTypeChecker(program).check()
+        self.program = program
+        self.engine = engine
+        self._execute = engine.compile(program)
+
+    def run(self, stdin: str or io.TextIOBase or None = None, stdout: io.TextIOBase or None = None,
+            recursion_limit: int = DEFAULT_RECURSION_LIMIT, buffer_size: int = DEFAULT_OUTPUT_BUFFER_SIZE):
+        """
+        Runs the program, reading input from stdin (given as text or a file) and printing to stdout.
+        The process' own streams are used for the ones not given. Prompts are shown for interactive input only.
+
+        :return: exit code of the program
+        """
+        if isinstance(stdin, str):
+            stdin = io.StringIO(stdin)
+        with BufferedInputOutput(sys.stdin if stdin is None else stdin, sys.stdout if stdout is None else stdout,
+                                 buffer_size) as input_output:
+            return self._execute(recursion_limit, input_output)
+
+
+compiled_programs = MemoCache(COMPILED_PROGRAMS_CACHE_SIZE, "lru")
+_compiled_programs_lock = threading.Lock()
+
+
+def compile(source: str, max_string_length: int = DEFAULT_MAX_STRING_LENGTH, engine=Interpreter,
+            optimise: bool = False) -> CompiledProgram:
+    """
+    Parses the source, unless a program compiled from the same source with the same settings is cached.
+    Exceptions are raised for invalid sources, which are not cached.
+    """
+    key = (hash_source(source), max_string_length, engine, optimise)
+    with _compiled_programs_lock:
+        compiled_program = compiled_programs.get(key)
+    if compiled_program is not MISSING:
+        return compiled_program
+
+    with StringSourceReader(source) as source_reader:
+        program = Parser(Lexer(source_reader, max_string_length)).parse_program()
+    if optimise:
+        optimise_program(program)
+    compiled_program = CompiledProgram(program, engine)
+    with _compiled_programs_lock:
+        compiled_programs.store(key, compiled_program)
+    return compiled_program
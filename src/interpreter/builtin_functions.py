@@ -33,4 +33,14 @@ builtin_functions = {
     "to_int": convert_to_int,
     "to_float": convert_to_float,
     "to_string": convert_to_string,
-}
\ No newline at end of file
+}
+
+
+def get_builtin_functions(input_output=None) -> dict:
+    """
+    :param input_output: object whose print and input methods replace Python's builtins, e.g. BufferedInputOutput
+    :return: builtin functions printing and reading with given object, or builtin_functions if not given
+    """
+    if input_output is None:
+        return builtin_functions
+    return {**builtin_functions, "print": input_output.print, "input": input_output.input}
@@ -0,0 +1,416 @@
+from interpreter.builtin_functions import builtin_functions, get_builtin_functions
+from interpreter.dictionaries import misnomer_types_to_python_types
+from interpreter.interpreter_exceptions import MisnomerInterpreterVariableAlreadyExistsException, \
+    MisnomerInterpreterNoMainFunctionException, MisnomerInterpreterExceededMaximumDepthException, \
+    MisnomerInterpreterArgumentsNumberDoesNotMatchException, MisnomerInterpreterFunctionDoesNotExistException, \
+    MisnomerInterpreterVariableDoesNotExistException, MisnomerInterpreterCastingException, \
+    MisnomerInterpreterCastingBuiltinException, MisnomerInterpreterVariableAssignmentTypeException, \
+    MisnomerInterpreterFunctionReturnTypeException, MisnomerInterpreterFunctionCallParameterTypeException, \
+    MisnomerInterpreterCouldNotNegateExpressionException, MisnomerInterpreterBadOperandTypeException, \
+    MisnomerInterpreterZeroDivisionException
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression, \
+    EqualExpression, NotEqualExpression, LessExpression, LessEqualExpression, GreaterExpression, \
+    GreaterEqualExpression
+from parser.syntax_tree.literals import NumericLiteral, StringLiteral
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, FunctionCall, Identifier, Condition, \
+    IfStatement, WhileStatement, ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+
+
+class CallContext:
+    """
+    Variables of a single function call, a lightweight counterpart of Context. Builtin functions and the recursion
+    limit are passed from call to call, so the same closures may be executed with different ones.
+    """
+    __slots__ = ("variables", "return_flag", "available_calls", "builtin_functions", "recursion_limit")
+
+    def __init__(self, variables: dict, available_calls: int, builtin_functions: dict, recursion_limit: int):
+        self.variables = variables
+        self.return_flag = False
+        self.available_calls = available_calls
+        self.builtin_functions = builtin_functions
+        self.recursion_limit = recursion_limit
+
+
+class ClosureCompiler:
+    """
+    Turns every node of the syntax tree into a Python closure over the closures of its children, which executes
+    the node just like its execute method does. Everything known before execution is resolved once, here.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._functions = {}
+        self._node_compilers = {
+            StatementBlock: self.compile_statement_block,
+            IfStatement: self.compile_if_statement,
+            WhileStatement: self.compile_while_statement,
+            ReturnStatement: self.compile_return_statement,
+            VariableInitialisationStatement: self.compile_variable_initialisation,
+            AssignmentStatement: self.compile_assignment,
+            FunctionCall: self.compile_function_call,
+            Identifier: self.compile_identifier,
+            Condition: lambda condition: self.compile(condition.expression),
+            UnaryExpression: lambda expression: self.compile(expression.expressions),
+            NumericLiteral: self.compile_literal,
+            StringLiteral: self.compile_literal,
+            OrExpression: self.compile_or_expression,
+            AndExpression: self.compile_and_expression,
+            NotExpression: self.compile_not_expression,
+            AdditiveInvertedExpression: self.compile_additive_inverted_expression,
+            MultiplicativeInvertedExpression: self.compile_multiplicative_inverted_expression,
+            AdditiveExpression: self.compile_additive_expression,
+            MultiplicativeExpression: self.compile_multiplicative_expression,
+            EqualExpression: self.compile_equal_expression,
+            NotEqualExpression: self.compile_not_equal_expression,
+            LessExpression: self.compile_less_expression,
+            LessEqualExpression: self.compile_less_equal_expression,
+            GreaterExpression: self.compile_greater_expression,
+            GreaterEqualExpression: self.compile_greater_equal_expression,
+        }
+
+    def compile_program(self):
+        """
+        :return: closure executing the main function with given recursion limit and builtin functions, which gives
+            the exit code
+        """
+        for function_name, function_definition in self._program.function_definitions.items():
+            if function_name in builtin_functions or function_name in self._functions:
+                raise MisnomerInterpreterVariableAlreadyExistsException(function_name, function_definition.position)
+            self._functions[function_name] = None
+
+        if "main" not in self._functions:
+            raise MisnomerInterpreterNoMainFunctionException(self._program.position)
+
+        for function_name, function_definition in self._program.function_definitions.items():
+            self._functions[function_name] = self.compile_function_definition(function_definition)
+
+        main = self.compile(self._program.function_definitions["main"].statement_block)
+
+        def execute_main(recursion_limit: int, builtin_functions: dict):
+            if (exit_code := main(CallContext({}, recursion_limit, builtin_functions, recursion_limit))) is not None:
+                return exit_code
+            return 0
+        return execute_main
+
+    def compile(self, node):
+        return self._node_compilers[type(node)](node)
+
+    # Functions
+
+    def compile_function_definition(self, definition: FunctionDefinition):
+        name = definition.name
+        position = definition.position
+        expected_arguments_number = len(definition.parameters)
+        parameters = [
+            (parameter_name, misnomer_types_to_python_types[parameter.argument_type], parameter.argument_type.name)
+            for parameter_name, parameter in definition.parameters.items()
+        ]
+        return_types = misnomer_types_to_python_types[definition.return_type]
+        return_type_name = definition.return_type.name
+        statement_block = self.compile(definition.statement_block)
+
+        def call_function(context, arguments):
+            if (got_arguments_number := len(arguments)) != expected_arguments_number:
+                raise MisnomerInterpreterArgumentsNumberDoesNotMatchException(expected_arguments_number,
+                                                                              got_arguments_number, name, position)
+            if (available_calls := context.available_calls - 1) <= 0:
+                raise MisnomerInterpreterExceededMaximumDepthException(context.recursion_limit)
+
+            variables = {}
+            for (parameter_name, allowed_types, type_name), argument in zip(parameters, arguments):
+                if type(argument) not in allowed_types:
+                    raise MisnomerInterpreterFunctionCallParameterTypeException(type(argument), type_name,
+                                                                                parameter_name, position)
+                variables[parameter_name] = argument
+
+            result = statement_block(CallContext(variables, available_calls, context.builtin_functions,
+                                                 context.recursion_limit))
+            if type(result) not in return_types:
+                raise MisnomerInterpreterFunctionReturnTypeException(type(result), return_type_name, name, position)
+            return result
+        return call_function
+
+    def compile_function_call(self, call: FunctionCall):
+        identifier = call.identifier
+        position = call.position
+        if identifier not in self._functions and identifier not in builtin_functions:
+            # Reported when compiling, just like Program links function calls before executing
+            raise MisnomerInterpreterFunctionDoesNotExistException(identifier, position)
+        arguments = [self.compile(argument) for argument in call.arguments]
+
+        if identifier in self._functions:
+            functions = self._functions
+
+            def user_function_call(context):
+                # Looked up at run time, as the function may not be compiled yet
+                return functions[identifier](context, [argument(context) for argument in arguments])
+            return user_function_call
+
+        else:
+            def builtin_function_call(context):
+                argument_values = [argument(context) for argument in arguments]
+                try:
+                    return context.builtin_functions[identifier](*argument_values)
+                except MisnomerInterpreterCastingBuiltinException as e:
+                    raise MisnomerInterpreterCastingException(e.cast_type, e.expression, position)
+            return builtin_function_call
+
+    # Statements
+
+    def compile_statement_block(self, block: StatementBlock):
+        statements = [self.compile(statement) for statement in block.statements]
+
+        def statement_block(context):
+            for statement in statements:
+                if (exit_code := statement(context)) is not None and context.return_flag:
+                    return exit_code
+        return statement_block
+
+    def compile_if_statement(self, statement: IfStatement):
+        condition = self.compile(statement.condition)
+        instructions = self.compile(statement.instructions)
+        if not statement.else_statement:
+            def if_statement(context):
+                if condition(context):
+                    return instructions(context)
+            return if_statement
+
+        else_statement = self.compile(statement.else_statement)
+
+        def if_else_statement(context):
+            if condition(context):
+                return instructions(context)
+            return else_statement(context)
+        return if_else_statement
+
+    def compile_while_statement(self, statement: WhileStatement):
+        condition = self.compile(statement.condition)
+        instructions = self.compile(statement.instructions)
+
+        def while_statement(context):
+            while condition(context):
+                if (exit_code := instructions(context)) is not None:
+                    return exit_code
+        return while_statement
+
+    def compile_return_statement(self, statement: ReturnStatement):
+        if statement.value is None:
+            def empty_return_statement(context):
+                context.return_flag = True
+            return empty_return_statement
+
+        value = self.compile(statement.value)
+
+        def return_statement(context):
+            context.return_flag = True
+            return value(context)
+        return return_statement
+
+    def compile_variable_initialisation(self, statement: VariableInitialisationStatement):
+        name = statement.name
+        position = statement.position
+        value = self.compile(statement.value)
+        allowed_types = misnomer_types_to_python_types[statement.variable_type]
+        type_name = statement.variable_type.name
+
+        def variable_initialisation(context):
+            if name in context.variables:
+                raise MisnomerInterpreterVariableAlreadyExistsException(name, position)
+            result = value(context)
+            if type(result) not in allowed_types:
+                raise MisnomerInterpreterVariableAssignmentTypeException(type(result), type_name, name, position)
+            context.variables[name] = result
+        return variable_initialisation
+
+    def compile_assignment(self, statement: AssignmentStatement):
+        name = statement.name
+        position = statement.position
+        value = self.compile(statement.value)
+
+        def assignment(context):
+            variables = context.variables
+            if name not in variables:
+                raise MisnomerInterpreterVariableDoesNotExistException(name, position)
+            result = value(context)
+            if type(result) != (variable_type := type(variables[name])):
+                raise MisnomerInterpreterVariableAssignmentTypeException(type(result), variable_type, name, position)
+            variables[name] = result
+        return assignment
+
+    # Expressions
+
+    @staticmethod
+    def compile_literal(literal):
+        value = literal.value
+        return lambda context: value
+
+    @staticmethod
+    def compile_identifier(identifier: Identifier):
+        name = identifier.name
+        position = identifier.position
+
+        def get_variable(context):
+            # Values of variables are never None
+            if (variable := context.variables.get(name)) is not None:
+                return variable
+            raise MisnomerInterpreterVariableDoesNotExistException(name, position)
+        return get_variable
+
+    def compile_or_expression(self, expression: OrExpression):
+        expressions = [self.compile(sub_expression) for sub_expression in expression.expressions]
+
+        def or_expression(context):
+            for sub_expression in expressions:
+                if sub_expression(context):
+                    return True
+            return False
+        return or_expression
+
+    def compile_and_expression(self, expression: AndExpression):
+        expressions = [self.compile(sub_expression) for sub_expression in expression.expressions]
+
+        def and_expression(context):
+            for sub_expression in expressions:
+                if not sub_expression(context):
+                    return False
+            return True
+        return and_expression
+
+    def compile_not_expression(self, expression: NotExpression):
+        negated_expression = expression.expressions
+        sub_expression = self.compile(negated_expression)
+
+        def not_expression(context):
+            try:
+                return not sub_expression(context)
+            except ValueError:
+                raise MisnomerInterpreterCouldNotNegateExpressionException(negated_expression,
+                                                                           negated_expression.position)
+        return not_expression
+
+    def compile_additive_inverted_expression(self, expression: AdditiveInvertedExpression):
+        inverted_expression = expression.expressions
+        sub_expression = self.compile(inverted_expression)
+
+        def additive_inverted_expression(context):
+            try:
+                return -sub_expression(context)
+            except TypeError:
+                raise MisnomerInterpreterBadOperandTypeException("-", inverted_expression,
+                                                                 inverted_expression.position)
+        return additive_inverted_expression
+
+    def compile_multiplicative_inverted_expression(self, expression: MultiplicativeInvertedExpression):
+        inverted_expression = expression.expressions
+        position = expression.position
+        sub_expression = self.compile(inverted_expression)
+
+        def multiplicative_inverted_expression(context):
+            try:
+                if result := sub_expression(context):
+                    return 1.0 / result
+                raise MisnomerInterpreterZeroDivisionException(position)
+            except TypeError:
+                raise MisnomerInterpreterBadOperandTypeException("/", inverted_expression,
+                                                                 inverted_expression.position)
+        return multiplicative_inverted_expression
+
+    def compile_additive_expression(self, expression: AdditiveExpression):
+        first_expression = expression.expressions[0]
+        position = expression.position
+        expressions = [self.compile(sub_expression) for sub_expression in expression.expressions]
+
+        if len(expressions) == 2:
+            left, right = expressions
+
+            def binary_additive_expression(context):
+                try:
+                    return 0 + left(context) + right(context)
+                except TypeError:
+                    raise MisnomerInterpreterBadOperandTypeException("+", first_expression, position)
+            return binary_additive_expression
+
+        def additive_expression(context):
+            result = 0
+            try:
+                for sub_expression in expressions:
+                    result += sub_expression(context)
+                return result
+            except TypeError:
+                raise MisnomerInterpreterBadOperandTypeException("+", first_expression, position)
+        return additive_expression
+
+    def compile_multiplicative_expression(self, expression: MultiplicativeExpression):
+        sub_expressions = expression.expressions
+        expressions = [self.compile(sub_expression) for sub_expression in sub_expressions]
+
+        def multiplicative_expression(context):
+            result = 1
+            try:
+                for sub_expression in expressions:
+                    result *= sub_expression(context)
+                return result
+            except TypeError:
+                # Fails with AttributeError, just like MultiplicativeExpression does
+                raise MisnomerInterpreterBadOperandTypeException("*", sub_expressions, sub_expressions.position)
+        return multiplicative_expression
+
+    def compile_equal_expression(self, expression: EqualExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) == right(context)
+
+    def compile_not_equal_expression(self, expression: NotEqualExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) != right(context)
+
+    def compile_less_expression(self, expression: LessExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) < right(context)
+
+    def compile_less_equal_expression(self, expression: LessEqualExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) <= right(context)
+
+    def compile_greater_expression(self, expression: GreaterExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) > right(context)
+
+    def compile_greater_equal_expression(self, expression: GreaterEqualExpression):
+        left, right = self.compile(expression.left), self.compile(expression.right)
+        return lambda context: left(context) >= right(context)
+
+
+class ClosureInterpreter:
+    """
+    Executes the program compiled to closures by ClosureCompiler, giving the same results as Interpreter.
+    """
+    def __init__(self, program: Program, recursion_limit=1000, input_output=None, execute_main=None):
+        """
+        :param execute_main: closure compiled from the program, compiled when executing if not given
+        """
+        self.program = program
+        self.recursion_limit = recursion_limit
+        self.input_output = input_output
+        self.execute_main = execute_main
+        if recursion_limit <= 0:
+            raise MisnomerInterpreterExceededMaximumDepthException(recursion_limit)
+
+    @classmethod
+    def compile(cls, program: Program):
+        """
+        Compiles the program once for many executions.
+
+        :return: function executing the program with given recursion limit and input and output
+        """
+        execute_main = ClosureCompiler(program).compile_program()
+        return lambda recursion_limit, input_output=None: \
+            cls(program, recursion_limit, input_output, execute_main).execute()
+
+    def execute(self):
+        execute_main = self.execute_main or ClosureCompiler(self.program).compile_program()
+        try:
+            return execute_main(self.recursion_limit, get_builtin_functions(self.input_output))
+        finally:
+            if self.input_output:
+                self.input_output.flush()
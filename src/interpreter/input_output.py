@@ -0,0 +1,130 @@
+import queue
+import threading
+
+# Number of characters printed before the output is written to its stream
+DEFAULT_OUTPUT_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedInputOutput:
+    """
+    Implements print and input builtins over given streams. Printed text is kept in a buffer, written when it is
+    full, before reading input and when the program ends, optionally by a background thread.
+
+    Non-interactive input is read whole on the first input call and prompts are not shown for it,
+    as nobody would read them.
+    """
+    def __init__(self, stdin, stdout, buffer_size: int = DEFAULT_OUTPUT_BUFFER_SIZE, writer_thread: bool = False,
+                 echo_prompts: bool or None = None):
+        """
+        :param buffer_size: number of characters kept before writing them, 0 writes every print at once
+        :param echo_prompts: whether input prompts are printed, by default only for interactive input
+        """
+        self._stdin = stdin
+        self._stdout = stdout
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._buffered_length = 0
+        self._interactive = stdin.isatty()
+        self._echo_prompts = self._interactive if echo_prompts is None else echo_prompts
+        # Lines of non-interactive input, read on the first input call
+        self._lines: list[str] or None = None
+        self._next_line = 0
+
+        self._queue: queue.Queue or None = None
+        self._writer: threading.Thread or None = None
+        self._writer_error: Exception or None = None
+        if writer_thread:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self.write_queued, name="misnomer-writer", daemon=True)
+            self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Builtins
+
+    def print(self, *values):
+        text = " ".join(map(str, values)) + "\n"
+        self._buffer.append(text)
+        self._buffered_length += len(text)
+        if self._buffered_length >= self._buffer_size:
+            self.write_buffer()
+
+    def input(self, prompt=""):
+        if self._echo_prompts:
+            self._buffer.append(str(prompt))
+        self.flush()
+        if self._interactive:
+            line = self._stdin.readline()
+            if not line:
+                raise EOFError("EOF when reading a line")
+            return line.removesuffix("\n")
+
+        if self._lines is None:
+            self._lines = self.read_lines()
+        if self._next_line >= len(self._lines):
+            raise EOFError("EOF when reading a line")
+        self._next_line += 1
+        return self._lines[self._next_line - 1]
+
+    def read_lines(self) -> list[str]:
+        text = self._stdin.read()
+        lines = text.split("\n")
+        # Text ending with a new line has no line after it
+        if not lines[-1]:
+            lines.pop()
+        return lines
+
+    # Writing
+
+    def write_buffer(self):
+        """
+        Passes the buffered text to the stream or to the writer thread.
+        """
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_length = 0
+        if self._queue is None:
+            self._stdout.write(text)
+        else:
+            self.raise_writer_error()
+            self._queue.put(text)
+
+    def flush(self):
+        """
+        Writes all buffered text to the stream, waiting for the writer thread to write it.
+        """
+        self.write_buffer()
+        if self._queue is not None:
+            self._queue.join()
+            self.raise_writer_error()
+        self._stdout.flush()
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._queue = self._writer = None
+
+    def write_queued(self):
+        while (text := self._queue.get()) is not None:
+            try:
+                if self._writer_error is None:
+                    self._stdout.write(text)
+            except Exception as error:
+                # Raised in the interpreter's thread, when it writes or flushes next time
+                self._writer_error = error
+            finally:
+                self._queue.task_done()
+        self._queue.task_done()
+
+    def raise_writer_error(self):
+        if (error := self._writer_error) is not None:
+            self._writer_error = None
+            raise error
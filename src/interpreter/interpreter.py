@@ -1,34 +1,54 @@
+from checker.type_checker import StaticTypeChecker
 from interpreter.builtin_functions import builtin_functions
 from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException
 
 
 class Context:
-    recursion_limit = 0
-
-    def __init__(self, available_calls):
-        self.functions = builtin_functions.copy()
-        self.variables = {}
+    def __init__(self, available_calls, variables_number=0, functions=builtin_functions, input_output=None,
+                 profiler=None, recursion_limit=None):
+        # Function table is shared by all contexts of an execution and never modified
+        self.functions = functions
+        # Reported when no calls are available, the number of calls given to the execution
+        self.recursion_limit = available_calls if recursion_limit is None else recursion_limit
+        # Print and input builtins of the execution, Python's own if None
+        self.input_output = input_output
+        # Measures function calls, if profiling
+        self.profiler = profiler
+        # Variables are kept in slots assigned by VariableResolver, None marks a variable which does not exist
+        self.variables = [None] * variables_number
         self._available_calls = available_calls
         if available_calls <= 0:
-            raise MisnomerInterpreterExceededMaximumDepthException(Context.recursion_limit)
+            raise MisnomerInterpreterExceededMaximumDepthException(self.recursion_limit)
         self._return_flag = False
 
-    def add_function(self, function_name, function):
-        self.functions[function_name] = function
+    def set_functions(self, functions):
+        self.functions = functions
 
     def get_function(self, function_name):
         return self.functions.get(function_name)
 
-    def set_variable(self, variable_name, variable_value):
-        self.variables[variable_name] = variable_value
+    def set_variable(self, slot, variable_value):
+        self.variables[slot] = variable_value
+
+    def get_variable(self, slot):
+        return self.variables[slot]
+
+    def allocate_variables(self, variables_number):
+        self.variables = [None] * variables_number
 
-    def get_variable(self, name):
-        return self.variables.get(name)
+    def get_available_calls(self):
+        return self._available_calls
 
-    def get_new_context(self):
-        new_context = Context(self._available_calls - 1)
-        new_context.functions = self.functions
-        return new_context
+    def check_call_depth(self, depth: int):
+        """
+        Raises the exception which calls nested depth times, made in this context, would raise.
+        """
+        if self._available_calls <= depth:
+            raise MisnomerInterpreterExceededMaximumDepthException(self.recursion_limit)
+
+    def get_new_context(self, variables_number):
+        return Context(self._available_calls - 1, variables_number, self.functions, self.input_output, self.profiler,
+                       self.recursion_limit)
 
     def set_return_flag(self, new_value: bool):
         self._return_flag = new_value
@@ -38,11 +58,30 @@ class Context:
 
 
 class Interpreter:
-    def __init__(self, program, recursion_limit=1000):
+    def __init__(self, program, recursion_limit=1000, input_output=None, profiler=None):
         self.program = program
-        self.context = Context(recursion_limit)
-        Context.recursion_limit = recursion_limit
+        self.input_output = input_output
+        self.context = Context(recursion_limit, input_output=input_output, profiler=profiler)
+        if not program.type_checked:
+            # Disables type checks which can never fail
+            StaticTypeChecker(program).check()
+
+    @classmethod
+    def compile(cls, program):
+        """
+        Links the program once for many executions.
+
+        :return: function executing the program with given recursion limit and input and output
+        """
+        if not program.type_checked:
+            StaticTypeChecker(program).check()
+        program.link_function_calls()
+        return lambda recursion_limit, input_output=None: cls(program, recursion_limit, input_output).execute()
 
     def execute(self):
-        exit_code = self.program.execute(self.context)
+        try:
+            exit_code = self.program.execute(self.context)
+        finally:
+            if self.input_output:
+                self.input_output.flush()
         return exit_code
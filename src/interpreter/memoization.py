@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+
+from interpreter.builtin_functions import builtin_functions
+from parser.syntax_tree.statements import FunctionCall
+from parser.syntax_tree.syntax_tree import Program
+
+EVICTION_POLICIES = ("lru", "fifo")
+IMPURE_BUILTIN_FUNCTIONS = ("print", "input")
+MISSING = object()
+
+_thread_state = threading.local()
+
+
+def get_lowest_available_calls() -> list[int]:
+    """
+    :return: lowest numbers of available calls reached by the memoized calls of this thread which are being
+        computed, the innermost one last
+    """
+    if (lowest_available_calls := getattr(_thread_state, "lowest_available_calls", None)) is None:
+        lowest_available_calls = _thread_state.lowest_available_calls = []
+    return lowest_available_calls
+
+
+class MemoCache:
+    """
+    Bounded cache of results of a function, keyed by its arguments. When full, either the least recently used
+    or the oldest entry is evicted.
+    """
+    def __init__(self, max_entries: int, eviction_policy: str = "lru"):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}.")
+        self.max_entries = max_entries
+        self.eviction_policy = eviction_policy
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def call(self, function, context, arguments: list):
+        """
+        Calls the function, unless its result for given arguments is cached. Results are cached with the depth
+        of nested calls computing them took, so a cached result raises the same depth error as the call it replaces.
+        """
+        # Types are a part of the key, as e.g. 1 and 1.0 are equal, but may give different results
+        key = (*arguments, *map(type, arguments))
+        available_calls = context.get_available_calls()
+        lowest_available_calls = get_lowest_available_calls()
+        if (entry := self.get(key)) is MISSING:
+            lowest_available_calls.append(available_calls - 1)
+            try:
+                result = function(context, *arguments)
+            finally:
+                lowest = lowest_available_calls.pop()
+            depth = available_calls - lowest
+            self.store(key, (result, depth))
+        else:
+            result, depth = entry
+            context.check_call_depth(depth)
+        # Pure functions call only memoized functions, so the calling one reached at least the same depth
+        if lowest_available_calls and available_calls - depth < lowest_available_calls[-1]:
+            lowest_available_calls[-1] = available_calls - depth
+        return result
+
+    def get(self, key):
+        """
+        :return: cached result or MISSING
+        """
+        if (result := self._entries.get(key, MISSING)) is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if self.eviction_policy == "lru":
+                self._entries.move_to_end(key)
+        return result
+
+    def store(self, key, result):
+        self._entries[key] = result
+        if 0 < self.max_entries < len(self._entries):
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def find_pure_functions(program: Program) -> set[str]:
+    """
+    Finds functions which neither print nor read input, directly or through called functions. As they only take
+    numbers and strings, their results depend on their arguments only.
+    """
+    called_functions = {
+        name: {node.identifier for node in function.statement_block.iterate_nodes() if isinstance(node, FunctionCall)}
+        for name, function in program.function_definitions.items()
+    }
+    pure_functions = set(program.function_definitions)
+
+    # Calling an impure function, or an unknown one, makes the caller impure as well
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure_functions):
+            if any(function_name in IMPURE_BUILTIN_FUNCTIONS
+                   or function_name not in builtin_functions and function_name not in pure_functions
+                   for function_name in called_functions[name]):
+                pure_functions.remove(name)
+                changed = True
+    return pure_functions
+
+
+def install_memo_caches(program: Program, max_entries: int, eviction_policy: str = "lru") -> dict[str, MemoCache]:
+    """
+    Gives every pure function of the program its own cache, used by the interpreter when calling it.
+
+    :param max_entries: maximal number of results cached per function, 0 for no limit
+    :return: caches by function names
+    """
+    memo_caches = {}
+    for name in find_pure_functions(program):
+        program.function_definitions[name].memo_cache = memo_caches[name] = MemoCache(max_entries, eviction_policy)
+    # Calls of the functions have to be linked to their caches
+    program.calls_linked = False
+    return memo_caches
+
+
+def format_memo_statistics(memo_caches: dict[str, MemoCache]) -> str:
+    """
+    :return: numbers of cache hits and misses of the functions which have been called
+    """
+    return "\n".join(f"Memoized function {name}: {memo_cache.hits} hits, {memo_cache.misses} misses, "
+                     f"{len(memo_cache)} cached results." for name, memo_cache in sorted(memo_caches.items())
+                     if memo_cache.hits or memo_cache.misses)
@@ -0,0 +1,89 @@
+import json
+import time
+from functools import partial
+
+PROFILE_SORT_KEYS = ("exclusive", "inclusive", "calls")
+
+
+class FunctionProfile:
+    __slots__ = ("name", "calls", "inclusive_time", "exclusive_time", "max_depth", "depth")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        # Time from entering the outermost active call to leaving it, so recursive calls are not counted twice
+        self.inclusive_time = 0.0
+        # Time spent in the function itself, without the functions it called
+        self.exclusive_time = 0.0
+        self.max_depth = 0
+        self.depth = 0
+
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "inclusive_time": self.inclusive_time, "exclusive_time": self.exclusive_time,
+                "max_depth": self.max_depth}
+
+
+class Profiler:
+    """
+    Measures calls of defined and builtin functions made by the interpreter: their number, wall time with and
+    without called functions and the deepest recursion. The interpreter calls functions through it only when
+    profiling, so programs run without it are not slowed down.
+    """
+    def __init__(self, clock=time.perf_counter):
+        self.profiles: dict[str, FunctionProfile] = {}
+        self._clock = clock
+        # Time spent in functions called by every active call
+        self._callees_times: list[float] = []
+
+    def call(self, name: str, function, *arguments):
+        if (profile := self.profiles.get(name)) is None:
+            profile = self.profiles[name] = FunctionProfile(name)
+        profile.calls += 1
+        profile.depth += 1
+        if profile.depth > profile.max_depth:
+            profile.max_depth = profile.depth
+
+        callees_times = self._callees_times
+        callees_times.append(0.0)
+        start = self._clock()
+        try:
+            return function(*arguments)
+        finally:
+            elapsed = self._clock() - start
+            profile.exclusive_time += elapsed - callees_times.pop()
+            if callees_times:
+                callees_times[-1] += elapsed
+            profile.depth -= 1
+            if not profile.depth:
+                profile.inclusive_time += elapsed
+
+    def wrap_builtin_functions(self, functions: dict) -> dict:
+        """
+        :return: builtin functions calling given ones through the profiler
+        """
+        return {name: partial(self.call, name, function) for name, function in functions.items()}
+
+    def get_sorted_profiles(self, sort_key: str = "exclusive") -> list[FunctionProfile]:
+        if sort_key not in PROFILE_SORT_KEYS:
+            raise ValueError(f"Unknown profile sort key: {sort_key}.")
+        attribute = sort_key if sort_key == "calls" else f"{sort_key}_time"
+        return sorted(self.profiles.values(), key=lambda profile: (-getattr(profile, attribute), profile.name))
+
+
+def format_profile(profiler: Profiler, sort_key: str = "exclusive") -> str:
+    """
+    :return: table of profiled functions, the most expensive first
+    """
+    profiles = profiler.get_sorted_profiles(sort_key)
+    if not profiles:
+        return "No function has been profiled."
+    name_width = max(len("Function"), *(len(profile.name) for profile in profiles))
+    lines = [f"{'Function':<{name_width}} {'Calls':>10} {'Inclusive [s]':>14} {'Exclusive [s]':>14} {'Max depth':>10}"]
+    lines.extend(f"{profile.name:<{name_width}} {profile.calls:>10} {profile.inclusive_time:>14.6f} "
+                 f"{profile.exclusive_time:>14.6f} {profile.max_depth:>10}" for profile in profiles)
+    return "\n".join(lines)
+
+
+def format_profile_json(profiler: Profiler, sort_key: str = "exclusive") -> str:
+    return json.dumps({profile.name: profile.to_dict() for profile in profiler.get_sorted_profiles(sort_key)},
+                      indent=4)
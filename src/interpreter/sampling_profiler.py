@@ -0,0 +1,106 @@
+import sys
+import threading
+from collections import Counter
+
+from parser.syntax_tree import expressions, literals, statements, syntax_tree
+from parser.syntax_tree.statements import FunctionDefinition
+from parser.syntax_tree.syntax_tree import Node, Program
+
+DEFAULT_SAMPLING_INTERVAL = 0.005
+# Python frames executing syntax tree nodes come from these files
+NODE_FILES = frozenset(module.__file__ for module in (expressions, literals, statements, syntax_tree))
+FUNCTION_CALL_CODES = frozenset((FunctionDefinition.__call__.__code__,
+                                 FunctionDefinition.call_with_checked_arguments.__code__))
+
+
+def get_misnomer_stack(frame) -> tuple[str, ...]:
+    """
+    Translates the Python stack of the tree interpreter into the Misnomer one. Every function is described by its
+    name and the position of the innermost node it is executing.
+
+    :param frame: innermost Python frame of the stack
+    :return: functions from main to the innermost one, empty if no program is being executed
+    """
+    python_frames = []
+    while frame is not None:
+        if frame.f_code.co_filename in NODE_FILES:
+            python_frames.append(frame)
+        frame = frame.f_back
+
+    stack = []
+    function_name = None
+    position = None
+    for python_frame in reversed(python_frames):
+        node = python_frame.f_locals.get("self")
+        if isinstance(node, Program):
+            # Main function is executed by the program itself, not called
+            function_name, position = "main", None
+        elif function_name is None or not isinstance(node, Node):
+            continue
+        elif python_frame.f_code in FUNCTION_CALL_CODES:
+            stack.append(format_stack_frame(function_name, position))
+            function_name, position = node.name, None
+        else:
+            position = node.position
+    if function_name is not None:
+        stack.append(format_stack_frame(function_name, position))
+    return tuple(stack)
+
+
+def format_stack_frame(function_name: str, position) -> str:
+    if position is None:
+        return function_name
+    return f"{function_name} ({position})"
+
+
+class SamplingProfiler:
+    """
+    Captures the Misnomer call stack of a thread at regular intervals, from a background thread. As the interpreter
+    is not instrumented, the overhead depends only on the interval, not on the number of calls.
+    """
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL):
+        self.interval = interval
+        # Numbers of samples by stacks
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._thread_id: int or None = None
+        self._stopped = threading.Event()
+        self._sampler: threading.Thread or None = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self, thread_id: int or None = None):
+        """
+        :param thread_id: identifier of the sampled thread, the calling one by default
+        """
+        self._thread_id = threading.get_ident() if thread_id is None else thread_id
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self.sample_periodically, name="misnomer-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        if self._sampler is not None:
+            self._stopped.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def sample_periodically(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        if (frame := sys._current_frames().get(self._thread_id)) is None:
+            return
+        if stack := get_misnomer_stack(frame):
+            self.samples[stack] += 1
+
+
+def format_folded_stacks(samples: Counter) -> str:
+    """
+    :return: stacks in the folded format of flame graph tools, one "main;f (l: 1, c: 2);g count" line per stack
+    """
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(samples.items()))
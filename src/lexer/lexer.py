@@ -1,4 +1,4 @@
-from copy import copy
+import sys
 
 from lexer.dictionaries import ESCAPE_CHARACTERS, ONE_SIGN_TOKENS, DOUBLE_SIGN_TOKENS, DOUBLE_SIGN_TOKENS_PREFIXES, \
     KEYWORD_TOKENS, EOF, BACKSLASH
@@ -139,7 +139,7 @@ class Lexer:
             if self._current_character.isdecimal() or self._current_character == ".":
                 message = f"Unexpected character '{self._current_character}' after number."
                 raise MisnomerLexerNumericBuildException(self._reader.get_position(), message)
-            return Token(value, copy(self._position), TokenType.NUMERIC_LITERAL)
+            return Token(value, self._position, TokenType.NUMERIC_LITERAL)
 
     def get_identifier_or_keyword(self) -> Token:
         if self._current_character.isalpha():
@@ -150,21 +150,21 @@ class Lexer:
                 name.append(self._current_character)
                 self.get_next_character()
 
-            name = "".join(name)
+            name = sys.intern("".join(name))
 
             if token_type := KEYWORD_TOKENS.get(name):
                 name = None
             else:
                 token_type = TokenType.IDENTIFIER
 
-            return Token(name, copy(self._position), token_type)
+            return Token(name, self._position, token_type)
 
     def get_end_of_file_token(self) -> Token:
         if self._current_character == EOF:
-            token = Token(None, copy(self._position), TokenType.EOF)
+            token = Token(None, self._position, TokenType.EOF)
             return token
 
     def get_unknown_token(self) -> Token:
-        token = Token(self._current_character, copy(self._position), TokenType.UNKNOWN)
+        token = Token(self._current_character, self._position, TokenType.UNKNOWN)
         self.get_next_character()
         return token
@@ -0,0 +1,158 @@
+import re
+import sys
+
+from lexer.dictionaries import ESCAPE_CHARACTERS, ONE_SIGN_TOKENS, DOUBLE_SIGN_TOKENS, KEYWORD_TOKENS, EOF, BACKSLASH
+from lexer.lexer import QUOTE_CHARACTERS
+from lexer.lexer_exceptions import MisnomerLexerUnterminatedStringException, MisnomerLexerNumericBuildException, \
+    MisnomerLexerStringBuildExceededLengthException, MisnomerLexerException
+from lexer.token.token import Token
+from lexer.token.token_type import TokenType
+from utils.position import Position
+from utils.source_reader import SourceReader
+
+
+def build_master_pattern() -> re.Pattern:
+    """
+    Builds a single pattern recognising the beginning of every token kind, preceded by optional whitespaces.
+    The name of the group that matched tells the token kind.
+    """
+    double_signs = "|".join(re.escape(sign) for sign in DOUBLE_SIGN_TOKENS)
+    one_signs = "".join(re.escape(sign) for sign in ONE_SIGN_TOKENS)
+    quotes = "".join(QUOTE_CHARACTERS)
+    return re.compile(
+        rf"\s*(?:"
+        rf"(?P<simple>{double_signs}|[{one_signs}])"
+        rf"|(?P<number>(?:0|\d+)(?:\.\d*)?)"
+        rf"|(?P<word>[^\W\d_]\w*)"
+        rf"|(?P<quote>[{quotes}])"
+        rf")?"
+    )
+
+
+MASTER_PATTERN = build_master_pattern()
+SIMPLE_STRING_PATTERNS = {
+    quote: re.compile(rf"[^{re.escape(quote)}{re.escape(BACKSLASH)}{re.escape(EOF)}]*{re.escape(quote)}")
+    for quote in QUOTE_CHARACTERS
+}
+SIMPLE_TOKENS = ONE_SIGN_TOKENS | DOUBLE_SIGN_TOKENS
+
+
+class RegexLexer:
+    """
+    Lexer scanning the whole source with one compiled pattern instead of reading it character by character.
+    Produces the same tokens, positions and exceptions as Lexer. Requires a reader nothing has been read from yet.
+    """
+    def __init__(self, reader: SourceReader, max_string_length: int = 1000):
+        self._source = reader.read_remaining()
+        self._get_position_at = reader.get_position_at
+        self._offset = 0
+        self._max_string_length = max_string_length
+
+    def _get_character(self, offset: int) -> str:
+        return self._source[offset] if offset < len(self._source) else EOF
+
+    def get_next_token(self) -> Token:
+        match = MASTER_PATTERN.match(self._source, self._offset)
+        kind = match.lastgroup
+
+        if kind == "word":
+            if token := self.get_identifier_or_keyword(match):
+                return token
+        elif kind == "simple":
+            self._offset = match.end()
+            return Token(None, self._get_position_at(match.start(kind)), SIMPLE_TOKENS[match.group(kind)])
+        elif kind == "number":
+            return self.get_number_literal(match)
+        elif kind == "quote":
+            return self.get_string_literal(match)
+
+        if kind:
+            # A word which does not begin with a letter
+            start = match.start(kind)
+        else:
+            # Matching past the end of the source starts at its end, while repeated EOF tokens keep moving forward
+            start = max(match.end(), self._offset)
+        self._offset = start + 1
+        if start >= len(self._source):
+            return Token(None, self._get_position_at(start), TokenType.EOF)
+        return Token(self._source[start], self._get_position_at(start), TokenType.UNKNOWN)
+
+    def get_number_literal(self, match: re.Match) -> Token:
+        integer, dot, fraction = match.group("number").partition(".")
+        value = self.convert_digits(integer)
+        if dot:
+            value += self.convert_digits(fraction) / (10 ** len(fraction))
+
+        self._offset = match.end()
+        character = self._get_character(self._offset)
+        if character.isdecimal() or character == ".":
+            message = f"Unexpected character '{character}' after number."
+            raise MisnomerLexerNumericBuildException(self._get_position_at(self._offset), message)
+        return Token(value, self._get_position_at(match.start("number")), TokenType.NUMERIC_LITERAL)
+
+    @staticmethod
+    def convert_digits(digits: str) -> int:
+        try:
+            return int(digits or "0")
+        except ValueError:
+            # Exceeded the limit of digits int() converts at once
+            value = 0
+            for digit in digits:
+                value = value * 10 + int(digit)
+            return value
+
+    def get_identifier_or_keyword(self, match: re.Match) -> Token or None:
+        name = match.group("word")
+        start = match.start("word")
+        if not name.isascii():
+            # \w accepts numeric characters which are neither letters nor decimals
+            if not name[0].isalpha():
+                return None
+            for length, character in enumerate(name):
+                if not (character.isalpha() or character.isdecimal() or character == "_"):
+                    name = name[:length]
+                    break
+
+        self._offset = start + len(name)
+        if token_type := KEYWORD_TOKENS.get(name):
+            return Token(None, self._get_position_at(start), token_type)
+        return Token(sys.intern(name), self._get_position_at(start), TokenType.IDENTIFIER)
+
+    def get_string_literal(self, match: re.Match) -> Token:
+        quote = match.group("quote")
+        position = self._get_position_at(match.start("quote"))
+        content_start = match.end()
+        if string_match := SIMPLE_STRING_PATTERNS[quote].match(self._source, content_start):
+            if string_match.end() - 1 - content_start <= self._max_string_length:
+                self._offset = string_match.end()
+                return Token(self._source[content_start:string_match.end() - 1], position, TokenType.STRING_LITERAL)
+        return self.build_string(quote, content_start, position)
+
+    def build_string(self, quote: str, offset: int, position: Position) -> Token:
+        buffer = []
+
+        while (character := self._get_character(offset)) != quote:
+            # String length exceeded
+            if len(buffer) >= self._max_string_length:
+                raise MisnomerLexerStringBuildExceededLengthException(self._get_position_at(offset),
+                                                                      max_length=self._max_string_length)
+            # EOF
+            if character == EOF:
+                raise MisnomerLexerUnterminatedStringException(position)
+            # Escape characters
+            elif character == BACKSLASH:
+                offset += 1
+                character = self._get_character(offset)
+                if character == quote:
+                    buffer.append(quote)
+                elif new_char := ESCAPE_CHARACTERS.get(character):
+                    buffer.append(new_char)
+                else:
+                    raise MisnomerLexerException(self._get_position_at(offset))
+            # Normal sign
+            else:
+                buffer.append(character)
+            offset += 1
+
+        self._offset = offset + 1
+        return Token("".join(buffer), position, TokenType.STRING_LITERAL)
@@ -10,11 +10,15 @@ correct_types_for_values: dict[type, tuple[TokenType]] = {
 
 
 class Token:
+    __slots__ = ("_value", "_position", "_type")
+
     def __init__(self, value, position: Position, token_type: TokenType):
         self._value = value
         self._position = position
         self._type = token_type
-        self.check_if_type_matches_value()
+        # Lexers only create valid tokens, so the check is skipped in optimised (python -O) runs
+        if __debug__:
+            self.check_if_type_matches_value()
 
     def __repr__(self):
         return f"Token {self._type.name} ({self._position}) = {self._value}"
@@ -0,0 +1,107 @@
+import hashlib
+import marshal
+import os
+from array import array
+
+from lexer.token.token import Token
+from lexer.token.token_type import TokenType
+from utils.position import SourcePosition
+
+TOKEN_CACHE_MAGIC = b"MNMT"
+TOKEN_CACHE_VERSION = 1
+TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+
+
+class CachedLexer:
+    """
+    Replays a previously lexed token stream. Tokens are only built when the parser asks for them.
+    """
+    def __init__(self, types: bytes, values: list, offsets: array, line_starts: list[int]):
+        self._types = types
+        self._values = values
+        self._offsets = offsets
+        self._line_starts = line_starts
+        self._index = 0
+
+    def get_next_token(self) -> Token:
+        index = self._index
+        self._index += 1
+        if index < len(self._types):
+            position = SourcePosition(self._offsets[index], self._line_starts)
+            return Token(self._values[index], position, TOKEN_TYPES[self._types[index]])
+        # Past the end of the stream the lexer keeps producing EOF tokens, each one character further
+        offset = self._offsets[-1] + index - len(self._types) + 1
+        return Token(None, SourcePosition(offset, self._line_starts), TokenType.EOF)
+
+
+class TokenCache:
+    """
+    On-disk cache of token streams. There is one entry per source file, valid only for the same file contents
+    and the same maximum string length.
+    """
+    def __init__(self, cache_directory: str):
+        self._cache_directory = cache_directory
+
+    def get_cache_path(self, source_path: str) -> str:
+        name = hashlib.sha256(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self._cache_directory, f"{name}.tokens")
+
+    def load(self, source_path: str, source_hash: str, max_string_length: int) -> CachedLexer or None:
+        """
+        Looks up the token stream of the given source.
+
+        :return: CachedLexer replaying the tokens, None if there is no valid entry
+        """
+        try:
+            with open(self.get_cache_path(source_path), "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        header = TOKEN_CACHE_MAGIC + bytes((TOKEN_CACHE_VERSION, ))
+        if not data.startswith(header):
+            return None
+        try:
+            key, types, values, offsets, line_starts = marshal.loads(data[len(header):])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if key != (os.path.abspath(source_path), source_hash, max_string_length):
+            return None
+
+        return CachedLexer(types, values, array("q", offsets), array("q", line_starts).tolist())
+
+    def store(self, source_path: str, source_hash: str, max_string_length: int, lexer) -> CachedLexer:
+        """
+        Lexes the whole source up to the end of file and saves the token stream. Failing to write is not an error,
+        the stream is simply not cached.
+
+        :param lexer: Lexer over the source, nothing should have been read from it yet
+        :return: CachedLexer replaying the lexed tokens
+        """
+        types = bytearray()
+        values = []
+        offsets = array("q")
+        while True:
+            token = lexer.get_next_token()
+            types.append(token.get_type().value)
+            values.append(token.get_value())
+            offsets.append(token.get_position().get_offset())
+            if token.get_type() == TokenType.EOF:
+                break
+        line_starts = token.get_position().get_line_starts()
+
+        key = (os.path.abspath(source_path), source_hash, max_string_length)
+        entry = (key, bytes(types), values, offsets.tobytes(), array("q", line_starts).tobytes())
+        data = TOKEN_CACHE_MAGIC + bytes((TOKEN_CACHE_VERSION, )) + marshal.dumps(entry)
+
+        cache_path = self.get_cache_path(source_path)
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_directory, exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            pass
+
+        return CachedLexer(bytes(types), values, offsets, line_starts)
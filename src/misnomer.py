@@ -1,10 +1,47 @@
 import argparse
+import sys
 
+from batch.batch_runner import BatchRunner, load_input_vectors, format_job_results
+from checker.type_checker import StaticTypeChecker
+from interpreter.closure_compiler import ClosureInterpreter
+from interpreter.input_output import BufferedInputOutput, DEFAULT_OUTPUT_BUFFER_SIZE
 from interpreter.interpreter import Interpreter
+from interpreter.memoization import EVICTION_POLICIES, install_memo_caches, format_memo_statistics
+from interpreter.profiler import Profiler, PROFILE_SORT_KEYS, format_profile, format_profile_json
+from interpreter.sampling_profiler import SamplingProfiler, DEFAULT_SAMPLING_INTERVAL, format_folded_stacks
+from optimizer.dead_code import format_dead_code_report
+from optimizer.pipeline import optimise_program
 from parser.parser import Parser
+from parser.program_cache import load_compiled_program, store_compiled_program
+from parser.syntax_tree.tree_printer import format_tree
+from transpiler.python_transpiler import PythonTranspiler, TranspilingInterpreter
 from src.lexer.lexer import Lexer
+from lexer.regex_lexer import RegexLexer
+from lexer.token_cache import TokenCache
 from utils.exceptions import MisnomerException
-from utils.source_reader.source_reader import FileSourceReader
+from utils.source_hash import hash_source_file
+from utils.source_reader.source_reader import FileSourceReader, MemoryMappedFileSourceReader, DEFAULT_CHUNK_SIZE, \
+    is_valid_chunk_size
+from vm.virtual_machine import VirtualMachine, StackMachine
+
+LEXERS = {
+    "sequential": Lexer,
+    "regex": RegexLexer,
+}
+
+ENGINES = {
+    "tree": Interpreter,
+    "closures": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "stack": StackMachine,
+    "python": TranspilingInterpreter,
+}
+
+
+def chunk_size(value: str) -> int:
+    if not is_valid_chunk_size(size := int(value)):
+        raise argparse.ArgumentTypeError(f"has to be positive or -1, got {size}")
+    return size
 
 
 def obtain_run_arguments():
@@ -12,25 +49,217 @@ def obtain_run_arguments():
     argument_parser.add_argument("path", type=str, help="Path to the executive file.")
     argument_parser.add_argument("--recursion_limit", type=int, help="Set the recursion limit.", default=900)
     argument_parser.add_argument("--max_string_length", type=int, help="Set the maximum string length.", default=1000)
+    argument_parser.add_argument("--chunk_size", type=chunk_size,
+                                 help="Set the number of characters read from the source at once (-1 reads it whole).",
+                                 default=DEFAULT_CHUNK_SIZE)
+    argument_parser.add_argument("--mmap", action="store_true",
+                                 help="Map the source file into memory and decode it lazily (for very large files).")
+    argument_parser.add_argument("--lexer", choices=LEXERS.keys(),
+                                 help="Choose the scanner: character by character or one regular expression.",
+                                 default="sequential")
+    argument_parser.add_argument("--engine", choices=ENGINES.keys(),
+                                 help="Choose how to execute the program: walk the syntax tree, compile it "
+                                      "to nested closures, to bytecode run by the virtual machine (with unlimited "
+                                      "recursion and tail calls for stack) or to Python source.",
+                                 default="tree")
+    argument_parser.add_argument("--memoize", type=int, metavar="MAX_ENTRIES",
+                                 help="Cache results of functions which neither print nor read input, keeping "
+                                      "at most given number of results per function (0 for no limit). "
+                                      "Requires the tree engine.", default=None)
+    argument_parser.add_argument("--memo_eviction", choices=EVICTION_POLICIES,
+                                 help="Choose which cached result is dropped when the cache is full: "
+                                      "the least recently used or the oldest one.", default="lru")
+    argument_parser.add_argument("--output_buffer", type=int, metavar="SIZE",
+                                 help="Set the number of printed characters kept before writing them "
+                                      "(0 writes every print at once).", default=DEFAULT_OUTPUT_BUFFER_SIZE)
+    argument_parser.add_argument("--writer_thread", action="store_true",
+                                 help="Write printed text in a background thread, while the program runs on.")
+    argument_parser.add_argument("--profile", action="store_true",
+                                 help="Measure calls of every function and print them when the program ends. "
+                                      "Requires the tree engine.")
+    argument_parser.add_argument("--profile_json", type=str,
+                                 help="Profile the program and write the measurements to given JSON file. "
+                                      "Requires the tree engine.",
+                                 default=None)
+    argument_parser.add_argument("--profile_sort", choices=PROFILE_SORT_KEYS,
+                                 help="Sort profiled functions by their time without or with called functions, "
+                                      "or by the number of calls.", default="exclusive")
+    argument_parser.add_argument("--sample", type=str, metavar="PATH",
+                                 help="Sample the call stack of the program periodically and write the stacks "
+                                      "to given file in the folded format of flame graphs. "
+                                      "Requires the tree engine.", default=None)
+    argument_parser.add_argument("--sample_interval", type=float, metavar="SECONDS",
+                                 help="Set the time between samples of the call stack.",
+                                 default=DEFAULT_SAMPLING_INTERVAL)
+    argument_parser.add_argument("--strict_static", action="store_true",
+                                 help="Reject programs whose types can not be proven correct before running them.")
+    argument_parser.add_argument("--optimise", action="store_true",
+                                 help="Simplify the syntax tree before running it: compute values of constant "
+                                      "expressions, remove dead code, compute repeated expressions once and move "
+                                      "invariant ones out of loops.")
+    argument_parser.add_argument("--dead_code_report", action="store_true",
+                                 help="With --optimise, list statements and functions removed as never executed.")
+    argument_parser.add_argument("--dump_tree", type=str,
+                                 help="Write the syntax tree, after optimisations if enabled, to given file.",
+                                 default=None)
+    argument_parser.add_argument("--dump_python", type=str,
+                                 help="Write the program translated to Python source to given file.", default=None)
+    argument_parser.add_argument("--token_cache", type=str,
+                                 help="Cache lexed tokens in given directory and reuse them while the file is unchanged.",
+                                 default=None)
+    argument_parser.add_argument("--compiled", action="store_true",
+                                 help="Load the parsed program from a .mnmc file next to the source, "
+                                      "(re)writing it when it is missing or outdated.")
+    argument_parser.add_argument("--compile_only", action="store_true",
+                                 help="Only write the .mnmc file next to the source, without running the program.")
 
     arguments = argument_parser.parse_args()
+    if arguments.engine != "tree" and arguments.memoize is not None:
+        argument_parser.error("--memoize requires the tree engine")
+    if arguments.engine != "tree" and (arguments.profile or arguments.profile_json):
+        argument_parser.error("--profile and --profile_json require the tree engine")
+    if arguments.engine != "tree" and arguments.sample:
+        argument_parser.error("--sample requires the tree engine")
+    return arguments
+
+
+def obtain_batch_arguments():
+    argument_parser = argparse.ArgumentParser("Misnomer batch",
+                                              description="Run one program many times, with different input.")
+    argument_parser.add_argument("path", type=str, help="Path to the executive file.")
+    argument_parser.add_argument("inputs", type=str,
+                                 help="Path to the file with one JSON array of input lines per run.")
+    argument_parser.add_argument("--workers", type=int,
+                                 help="Set the number of worker processes (all cores by default).", default=None)
+    argument_parser.add_argument("--output", type=str,
+                                 help="Write results to given file instead of the standard output.", default=None)
+    argument_parser.add_argument("--recursion_limit", type=int, help="Set the recursion limit.", default=900)
+    argument_parser.add_argument("--max_string_length", type=int, help="Set the maximum string length.", default=1000)
+    argument_parser.add_argument("--lexer", choices=LEXERS.keys(),
+                                 help="Choose the scanner: character by character or one regular expression.",
+                                 default="sequential")
+    argument_parser.add_argument("--engine", choices=ENGINES.keys(), help="Choose how to execute the program.",
+                                 default="tree")
+    argument_parser.add_argument("--optimise", action="store_true",
+                                 help="Simplify the syntax tree once, before running it.")
+    argument_parser.set_defaults(chunk_size=DEFAULT_CHUNK_SIZE, mmap=False, token_cache=None)
+
+    arguments = argument_parser.parse_args(sys.argv[2:])
     return arguments
 
 
+def compile_program(args):
+    source_hash = hash_source_file(args.path)
+    if not args.compile_only:
+        if program := load_compiled_program(args.path, source_hash, args.max_string_length):
+            return program
+    program = parse_program(args)
+    store_compiled_program(args.path, source_hash, args.max_string_length, program)
+    return program
+
+
+def parse_program(args):
+    reader_class = MemoryMappedFileSourceReader if args.mmap else FileSourceReader
+
+    if args.token_cache:
+        token_cache = TokenCache(args.token_cache)
+        source_hash = hash_source_file(args.path)
+        if not (lexer := token_cache.load(args.path, source_hash, args.max_string_length)):
+            try:
+                with reader_class(args.path, args.chunk_size) as source:
+                    lexer = LEXERS[args.lexer](source, args.max_string_length)
+                    lexer = token_cache.store(args.path, source_hash, args.max_string_length, lexer)
+            except MisnomerException:
+                # The error is reported when the parser actually reaches it
+                lexer = None
+        if lexer:
+            return Parser(lexer).parse_program()
+
+    with reader_class(args.path, args.chunk_size) as source:
+        lexer = LEXERS[args.lexer](source, args.max_string_length)
+        parser = Parser(lexer)
+        return parser.parse_program()
+
+
+def run_batch():
+    try:
+        args = obtain_batch_arguments()
+        program = parse_program(args)
+        if args.optimise:
+            optimise_program(program)
+        input_vectors = load_input_vectors(args.inputs)
+        results = BatchRunner(program, ENGINES[args.engine], args.recursion_limit, args.workers).run(input_vectors)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(format_job_results(results))
+        else:
+            print(format_job_results(results))
+        return 0
+    except MisnomerException as error:
+        print(error)
+
+
+def report_profile(profiler, args):
+    if args.profile:
+        print(format_profile(profiler, args.profile_sort))
+    if args.profile_json:
+        with open(args.profile_json, "w", encoding="utf-8") as file:
+            file.write(format_profile_json(profiler, args.profile_sort))
+
+
 def main():
     try:
         args = obtain_run_arguments()
-        with FileSourceReader(args.path) as source:
-            lexer = Lexer(source, args.max_string_length)
-            parser = Parser(lexer)
-            program = parser.parse_program()
-        interpreter = Interpreter(program, args.recursion_limit)
-        exit_code = interpreter.execute()
-        print(f"The program finished with exit code: {exit_code}.")
-        return exit_code
+        if args.compiled or args.compile_only:
+            program = compile_program(args)
+            if args.compile_only:
+                return 0
+        else:
+            program = parse_program(args)
+        if args.strict_static:
+            StaticTypeChecker(program, strict=True).check()
+        if args.optimise:
+            removed = optimise_program(program)
+            if args.dead_code_report:
+                print(format_dead_code_report(removed))
+        if args.dump_tree:
+            with open(args.dump_tree, "w", encoding="utf-8") as file:
+                file.write(format_tree(program))
+        if args.dump_python:
+            with open(args.dump_python, "w", encoding="utf-8") as file:
+                file.write(PythonTranspiler(program).transpile())
+        memo_caches = {}
+        if args.memoize is not None:
+            memo_caches = install_memo_caches(program, args.memoize, args.memo_eviction)
+        input_output = BufferedInputOutput(sys.stdin, sys.stdout, args.output_buffer, args.writer_thread)
+        profiler = Profiler() if args.profile or args.profile_json else None
+        sampler = SamplingProfiler(args.sample_interval) if args.sample else None
+        try:
+            if profiler is not None:
+                interpreter = Interpreter(program, args.recursion_limit, input_output, profiler)
+            else:
+                interpreter = ENGINES[args.engine](program, args.recursion_limit, input_output)
+            if sampler is not None:
+                sampler.start()
+            exit_code = interpreter.execute()
+            print(f"The program finished with exit code: {exit_code}.")
+            return exit_code
+        finally:
+            input_output.close()
+            if profiler is not None:
+                report_profile(profiler, args)
+            if sampler is not None:
+                sampler.stop()
+                with open(args.sample, "w", encoding="utf-8") as file:
+                    file.write(format_folded_stacks(sampler.samples))
+            if memo_caches:
+                print(format_memo_statistics(memo_caches))
     except MisnomerException as error:
         print(error)
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["batch"]:
+        run_batch()
+    else:
+        main()
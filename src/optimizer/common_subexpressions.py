@@ -0,0 +1,289 @@
+from collections import defaultdict
+
+from checker.type_checker import StaticTypeChecker, NUMBER_TYPES
+from parser.resolver import VariableResolver
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, EqualExpression, \
+    NotEqualExpression, BinaryExpression, Expression
+from parser.syntax_tree.literals import Literal
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, FunctionCall, Identifier, Condition, \
+    IfStatement, WhileStatement, ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+from parser.types import Type
+
+# Source names start with a letter, so temporary variables can not clash with them
+TEMPORARY_NAME_PREFIX = "_cse"
+
+
+def get_expression_key(expression) -> tuple or None:
+    """
+    :return: key equal for expressions computing the same value from the same variables, None if the expression
+             calls a function
+    """
+    if isinstance(expression, Literal):
+        return type(expression.value), expression.value
+    elif isinstance(expression, Identifier):
+        return Identifier, expression.name
+    elif isinstance(expression, (Expression, BinaryExpression, Condition)):
+        keys = [get_expression_key(child) for child in expression.get_children()]
+        if None in keys:
+            return None
+        return expression.__class__, *keys
+    return None
+
+
+def get_variable_type(types: frozenset) -> Type or None:
+    """
+    :return: type of a variable able to keep values of given types
+    """
+    if not types:
+        return None
+    elif types <= {int}:
+        return Type.INT
+    elif types <= {int, float}:
+        return Type.FLOAT
+    elif types == {str}:
+        return Type.STRING
+    return None
+
+
+def replace_nodes(root, replacements: dict):
+    """
+    Replaces nodes below the root, which are keys of replacements given by their ids.
+    """
+    for node in list(root.iterate_nodes()):
+        for attribute, value in vars(node).items():
+            if isinstance(value, list):
+                value[:] = [replacements.get(id(item), item) for item in value]
+            elif id(value) in replacements:
+                setattr(node, attribute, replacements[id(value)])
+
+
+def iterate_in_evaluation_order(node):
+    """
+    Yields the nodes below the node and the node itself, each one after the nodes it evaluates.
+    """
+    for child in node.get_children():
+        yield from iterate_in_evaluation_order(child)
+    yield node
+
+
+def is_named_in_exceptions(expression, parent, checker: StaticTypeChecker) -> bool:
+    """
+    Checks whether the parent may raise an exception naming the kind of the expression, which would change
+    if the expression was replaced with a variable.
+    """
+    if isinstance(parent, AdditiveExpression) and parent.expressions[0] is expression or \
+            isinstance(parent, (AdditiveInvertedExpression, MultiplicativeInvertedExpression)):
+        return not all(checker.infer(child) <= set(NUMBER_TYPES) for child in parent.get_children())
+    return False
+
+
+def is_safe_expression(expression, checker: StaticTypeChecker, declared: set[str]) -> bool:
+    """
+    Checks whether computing the expression can neither fail nor have any effect.
+
+    :param declared: variables certainly initialised before computing the expression
+    """
+    return all(is_safe_operation(node, checker, declared) for node in expression.iterate_nodes())
+
+
+def is_safe_operation(node, checker: StaticTypeChecker, declared: set[str]) -> bool:
+    if isinstance(node, (Literal, Condition, OrExpression, AndExpression, NotExpression, EqualExpression,
+                         NotEqualExpression)):
+        return True
+    elif isinstance(node, Identifier):
+        return node.name in declared
+    elif isinstance(node, (AdditiveExpression, MultiplicativeExpression, AdditiveInvertedExpression)):
+        return all(checker.infer(child) <= set(NUMBER_TYPES) for child in node.get_children())
+    elif isinstance(node, MultiplicativeInvertedExpression):
+        child = node.expressions
+        return isinstance(child, Literal) and type(child.value) in NUMBER_TYPES and bool(child.value)
+    elif isinstance(node, BinaryExpression):
+        left_types = checker.infer(node.left)
+        right_types = checker.infer(node.right)
+        return left_types | right_types <= set(NUMBER_TYPES) or left_types | right_types == {str}
+    return False
+
+
+class Occurrence:
+    def __init__(self, expression, statement_index: int, unconditional: bool):
+        self.expression = expression
+        self.statement_index = statement_index
+        self.unconditional = unconditional
+
+
+class CommonSubexpressionEliminator:
+    """
+    Computes expressions repeated within a statement block once, keeping the value in a temporary variable
+    initialised just before the statement which computes it first. Only expressions without function calls are
+    shared, and only as long as none of their variables is assigned in between.
+
+    The temporary variable takes the place of the first computation, so the expression is moved there only
+    if nothing evaluated before it may fail or have an effect, or if the expression itself can not fail.
+    Loops are left alone, as a variable can not be initialised again when the loop repeats.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._checker = StaticTypeChecker(program)
+        self._function: FunctionDefinition or None = None
+        self._temporaries_number = 0
+        self._initialisations: dict[str, int] = {}
+
+    def eliminate(self) -> Program:
+        for function in self._program.function_definitions.values():
+            self._function = function
+            self._temporaries_number = 0
+            self._checker.check_function(function)
+            self._initialisations = defaultdict(int)
+            for node in function.statement_block.iterate_nodes():
+                if isinstance(node, VariableInitialisationStatement):
+                    self._initialisations[node.name] += 1
+            self.eliminate_in_block(function.statement_block, set(function.parameters))
+            if self._temporaries_number:
+                VariableResolver().resolve(function)
+        return self._program
+
+    def eliminate_in_block(self, block: StatementBlock, declared: set[str]):
+        """
+        :param declared: variables certainly initialised before the block
+        """
+        while self.eliminate_repeated_expression(block, declared):
+            self._checker.check_function(self._function)
+
+        declared = set(declared)
+        for statement in block.statements:
+            if isinstance(statement, StatementBlock):
+                self.eliminate_in_block(statement, declared)
+            elif isinstance(statement, IfStatement):
+                self.eliminate_in_branches(statement, declared)
+            if isinstance(statement, VariableInitialisationStatement):
+                declared.add(statement.name)
+
+    def eliminate_in_branches(self, statement: IfStatement, declared: set[str]):
+        for branch in (statement.instructions, statement.else_statement):
+            if isinstance(branch, StatementBlock):
+                self.eliminate_in_block(branch, declared)
+            elif isinstance(branch, IfStatement):
+                self.eliminate_in_branches(branch, declared)
+
+    def eliminate_repeated_expression(self, block: StatementBlock, declared: set[str]) -> bool:
+        """
+        Replaces the largest expression computed more than once, which can be computed in advance.
+
+        :return: whether any expression has been replaced
+        """
+        declared_before = []
+        for statement in block.statements:
+            declared_before.append(set(declared))
+            if isinstance(statement, VariableInitialisationStatement):
+                declared = declared | {statement.name}
+
+        occurrences = self.find_occurrences(block)
+        candidates = sorted((group for group in occurrences.values() if len(group) > 1),
+                            key=lambda group: -sum(1 for _ in group[0].expression.iterate_nodes()))
+        for group in candidates:
+            first_occurrence = group[0]
+            statement = block.statements[first_occurrence.statement_index]
+            variable_type = get_variable_type(self._checker.infer(first_occurrence.expression))
+            if variable_type is None:
+                continue
+            if is_safe_expression(first_occurrence.expression, self._checker,
+                                  declared_before[first_occurrence.statement_index]) or \
+                    first_occurrence.unconditional and self.is_evaluated_first(
+                        first_occurrence.expression, statement, declared_before[first_occurrence.statement_index]):
+                self.replace_occurrences(block, group, variable_type)
+                return True
+        return False
+
+    def find_occurrences(self, block: StatementBlock) -> dict[tuple, list[Occurrence]]:
+        """
+        Groups expressions of the block by their keys and versions of their variables, bumped by every assignment.
+        Expressions within loops are skipped, as well as ones whose variables are assigned earlier within the same
+        statement of the block, as the temporary variable is initialised before that statement.
+        """
+        occurrences = defaultdict(list)
+        versions = defaultdict(int)
+        statement_versions = {}
+
+        def visit_expression(expression, statement_index: int, unconditional: bool, parent=None):
+            for index, child in enumerate(expression.get_children()):
+                # Operands following the first one of logical expressions may not be evaluated
+                visit_expression(child, statement_index, unconditional and (
+                    index == 0 or not isinstance(expression, (OrExpression, AndExpression))), expression)
+            if isinstance(expression, (Identifier, Literal, Condition)) or \
+                    is_named_in_exceptions(expression, parent, self._checker):
+                return
+            if (key := get_expression_key(expression)) is not None:
+                variables = sorted({node.name for node in expression.iterate_nodes() if isinstance(node, Identifier)})
+                if any(versions[name] != statement_versions.get(name, 0) for name in variables):
+                    return
+                key = key, tuple((name, versions[name]) for name in variables)
+                occurrences[key].append(Occurrence(expression, statement_index, unconditional))
+
+        def bump_assigned_variables(statement):
+            for node in statement.iterate_nodes():
+                if isinstance(node, (VariableInitialisationStatement, AssignmentStatement)):
+                    versions[node.name] += 1
+
+        def visit_statement(statement, statement_index: int, unconditional: bool):
+            if isinstance(statement, StatementBlock):
+                for sub_statement in statement.statements:
+                    # Statements following the first one may be skipped by returning from the function
+                    visit_statement(sub_statement, statement_index, False)
+                # Variables assigned in a branch, which may or may not run, differ from both of their values
+                bump_assigned_variables(statement)
+            elif isinstance(statement, WhileStatement):
+                bump_assigned_variables(statement)
+            elif isinstance(statement, IfStatement):
+                visit_expression(statement.condition, statement_index, unconditional)
+                visit_statement(statement.instructions, statement_index, False)
+                if statement.else_statement:
+                    visit_statement(statement.else_statement, statement_index, False)
+                bump_assigned_variables(statement)
+            elif isinstance(statement, (ReturnStatement, VariableInitialisationStatement, AssignmentStatement)):
+                if statement.value is not None:
+                    visit_expression(statement.value, statement_index, unconditional)
+                if not isinstance(statement, ReturnStatement):
+                    versions[statement.name] += 1
+            else:
+                visit_expression(statement, statement_index, unconditional)
+
+        for index, block_statement in enumerate(block.statements):
+            statement_versions = dict(versions)
+            visit_statement(block_statement, index, True)
+        return occurrences
+
+    def replace_occurrences(self, block: StatementBlock, group: list[Occurrence], variable_type: Type):
+        name = f"{TEMPORARY_NAME_PREFIX}{self._temporaries_number}"
+        self._temporaries_number += 1
+
+        first_occurrence = group[0]
+        replacements = {id(occurrence.expression): Identifier(name, occurrence.expression.get_position())
+                        for occurrence in group}
+        for statement in block.statements[first_occurrence.statement_index:]:
+            replace_nodes(statement, replacements)
+        block.statements[first_occurrence.statement_index:first_occurrence.statement_index] = [
+            VariableInitialisationStatement(name, first_occurrence.expression, variable_type,
+                                            first_occurrence.expression.get_position())]
+
+    # Exceptions and effects
+
+    def is_evaluated_first(self, expression, statement, declared: set[str]) -> bool:
+        """
+        Checks whether everything the statement evaluates before the expression can neither fail nor have any effect.
+        """
+        if isinstance(statement, VariableInitialisationStatement):
+            # Initialising a variable fails if it has been initialised before
+            if statement.name in self._function.parameters or self._initialisations[statement.name] > 1:
+                return False
+        elif isinstance(statement, AssignmentStatement) and statement.name not in declared:
+            return False
+        elif isinstance(statement, IfStatement):
+            statement = statement.condition
+
+        evaluated_nodes = list(iterate_in_evaluation_order(statement))
+        expression_index = next(index for index, node in enumerate(evaluated_nodes) if node is expression)
+        expression_size = sum(1 for _ in expression.iterate_nodes())
+        return all(is_safe_operation(node, self._checker, declared)
+                   for node in evaluated_nodes[:expression_index - expression_size + 1])
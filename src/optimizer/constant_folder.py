@@ -0,0 +1,203 @@
+from checker.type_checker import StaticTypeChecker, NUMBER_TYPES
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, BinaryExpression
+from parser.syntax_tree.literals import Literal, NumericLiteral, StringLiteral
+from parser.syntax_tree.statements import StatementBlock, FunctionCall, Condition, IfStatement, WhileStatement, \
+    ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+
+# Folding 'ab' * 1000000 would build the string even if the expression is never evaluated
+MAX_FOLDED_STRING_LENGTH = 1000
+
+
+def is_constant(expression) -> bool:
+    return isinstance(expression, Literal)
+
+
+def is_integer_literal(expression, value: int) -> bool:
+    return is_constant(expression) and type(expression.value) is int and expression.value == value
+
+
+def make_literal(value, expression) -> Literal:
+    literal_class = StringLiteral if isinstance(value, str) else NumericLiteral
+    return literal_class(value, expression.get_position())
+
+
+class ConstantFolder:
+    """
+    Replaces expressions of literals with their values and drops operations which do not change values,
+    like adding 0, multiplying by 1 or negating twice. Expressions which would raise an exception are left
+    to raise it at run time, at the same position and with the same message.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._checker = StaticTypeChecker(program)
+
+    def fold(self) -> Program:
+        for function in self._program.function_definitions.values():
+            # Types of variables tell which operations can not fail, so that they can be dropped
+            self._checker.check_function(function)
+            self.fold_statement(function.statement_block)
+        return self._program
+
+    def get_types(self, expression) -> frozenset:
+        return self._checker.infer(expression)
+
+    # Statements
+
+    def fold_statement(self, statement):
+        if isinstance(statement, StatementBlock):
+            for sub_statement in statement.statements:
+                self.fold_statement(sub_statement)
+            statement.statements = [self.fold_expression(sub_statement) for sub_statement in statement.statements]
+        elif isinstance(statement, (IfStatement, WhileStatement)):
+            self.fold_expression(statement.condition)
+            self.fold_statement(statement.instructions)
+            statement.instructions = self.fold_expression(statement.instructions)
+            if isinstance(statement, IfStatement) and statement.else_statement:
+                self.fold_statement(statement.else_statement)
+                statement.else_statement = self.fold_expression(statement.else_statement)
+        elif isinstance(statement, (ReturnStatement, VariableInitialisationStatement, AssignmentStatement)):
+            if statement.value is not None:
+                statement.value = self.fold_expression(statement.value)
+
+    # Expressions
+
+    def fold_expression(self, expression):
+        """
+        Folds the sub expressions in place.
+
+        :return: the expression or the simpler one giving the same value
+        """
+        if isinstance(expression, Condition):
+            expression.expression = self.fold_expression(expression.expression)
+        elif isinstance(expression, FunctionCall):
+            expression.arguments = [self.fold_expression(argument) for argument in expression.arguments]
+        elif isinstance(expression, BinaryExpression):
+            expression.left = self.fold_expression(expression.left)
+            expression.right = self.fold_expression(expression.right)
+            if is_constant(expression.left) and is_constant(expression.right):
+                return self.evaluate(expression)
+        elif isinstance(expression, (OrExpression, AndExpression)):
+            return self.fold_logical_expression(expression)
+        elif isinstance(expression, NotExpression):
+            # Negation never fails for values of Misnomer, so the negated expression is not named in any message
+            expression.expressions = self.fold_expression(expression.expressions)
+            if is_constant(expression.expressions):
+                return self.evaluate(expression)
+        elif isinstance(expression, (AdditiveInvertedExpression, MultiplicativeInvertedExpression)):
+            return self.fold_inverted_expression(expression)
+        elif isinstance(expression, AdditiveExpression):
+            return self.fold_additive_expression(expression)
+        elif isinstance(expression, MultiplicativeExpression):
+            return self.fold_multiplicative_expression(expression)
+        return expression
+
+    @staticmethod
+    def evaluate(expression):
+        """
+        :return: literal of the value of the expression of literals, or the expression if evaluating it fails
+        """
+        try:
+            return make_literal(expression.execute(None), expression)
+        except Exception:
+            return expression
+
+    def fold_logical_expression(self, expression):
+        stop_value = isinstance(expression, OrExpression)
+        operands = []
+        for sub_expression in expression.expressions:
+            sub_expression = self.fold_expression(sub_expression)
+            if not is_constant(sub_expression):
+                operands.append(sub_expression)
+            elif bool(sub_expression.value) == stop_value:
+                # Following operands are never evaluated
+                operands.append(sub_expression)
+                break
+        if not operands or len(operands) == 1 and is_constant(operands[0]):
+            return make_literal(bool(operands[0].value) if operands else not stop_value, expression)
+        expression.expressions = operands
+        return expression
+
+    def fold_inverted_expression(self, expression):
+        inverted_expression = expression.expressions
+        folded_expression = self.fold_expression(inverted_expression)
+        if is_constant(folded_expression):
+            expression.expressions = folded_expression
+            if (result := self.evaluate(expression)) is not expression:
+                return result
+        elif isinstance(expression, AdditiveInvertedExpression) \
+                and isinstance(folded_expression, AdditiveInvertedExpression) \
+                and self.get_types(folded_expression.expressions) <= {int, float}:
+            # Negating a number twice gives the same number
+            return folded_expression.expressions
+
+        # Messages of exceptions name the inverted expression, so its kind has to stay the same if it may fail
+        if type(folded_expression) is type(inverted_expression) \
+                or self.get_types(folded_expression) <= set(NUMBER_TYPES):
+            expression.expressions = folded_expression
+        else:
+            expression.expressions = inverted_expression
+        return expression
+
+    def fold_additive_expression(self, expression):
+        first_expression = expression.expressions[0]
+        operands = [self.fold_expression(sub_expression) for sub_expression in expression.expressions]
+        if all(is_constant(operand) for operand in operands):
+            expression.expressions = operands
+            if (result := self.evaluate(expression)) is not expression:
+                return result
+
+        # Adding 0 to the sum of numbers does not change it
+        simplified_operands = self.fold_constant_prefix(operands, AdditiveExpression)
+        simplified_operands[1:] = [operand for operand in simplified_operands[1:] if not is_integer_literal(operand, 0)]
+        if type(simplified_operands[0]) is not type(first_expression):
+            # The message of the exception names the first operand, so its kind has to stay the same
+            simplified_operands = [first_expression] + [operand for operand in operands[1:]
+                                                        if not is_integer_literal(operand, 0)]
+        expression.expressions = simplified_operands
+        if len(simplified_operands) == 1 and self.get_types(simplified_operands[0]) <= {int}:
+            return simplified_operands[0]
+        return expression
+
+    def fold_multiplicative_expression(self, expression):
+        operands = [self.fold_expression(sub_expression) for sub_expression in expression.expressions]
+        if all(is_constant(operand) for operand in operands) and self.is_short_product(operands):
+            expression.expressions = operands
+            if (result := self.evaluate(expression)) is not expression:
+                return result
+
+        # Multiplying a number or a string by 1 does not change it
+        simplified_operands = self.fold_constant_prefix(operands, MultiplicativeExpression)
+        simplified_operands = [operand for operand in simplified_operands if not is_integer_literal(operand, 1)] \
+            or simplified_operands[:1]
+        expression.expressions = simplified_operands
+        if len(simplified_operands) == 1 and self.get_types(simplified_operands[0]) <= {int, float, str}:
+            return simplified_operands[0]
+        return expression
+
+    def fold_constant_prefix(self, operands: list, expression_class) -> list:
+        """
+        Replaces literals at the beginning of the operands with one literal of their sum or product, as they
+        are combined before any other operand is evaluated.
+        """
+        prefix_length = 0
+        while prefix_length < len(operands) and is_constant(operands[prefix_length]):
+            prefix_length += 1
+        prefix = operands[:prefix_length]
+        if prefix_length < 2 or expression_class is MultiplicativeExpression and not self.is_short_product(prefix):
+            return list(operands)
+        prefix_expression = expression_class(prefix, prefix[0].get_position())
+        if (result := self.evaluate(prefix_expression)) is prefix_expression:
+            return list(operands)
+        return [result] + operands[prefix_length:]
+
+    @staticmethod
+    def is_short_product(operands: list) -> bool:
+        length = 1
+        for operand in operands:
+            if isinstance(operand.value, str):
+                length *= len(operand.value)
+            elif type(operand.value) is int:
+                length *= abs(operand.value)
+        return length <= MAX_FOLDED_STRING_LENGTH or not any(isinstance(operand.value, str) for operand in operands)
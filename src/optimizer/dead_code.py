@@ -0,0 +1,121 @@
+from checker.type_checker import StaticTypeChecker
+from interpreter.builtin_functions import builtin_functions
+from parser.syntax_tree.literals import Literal
+from parser.syntax_tree.statements import StatementBlock, FunctionCall, IfStatement, WhileStatement
+from parser.syntax_tree.syntax_tree import Program
+
+
+class DeadCodeEliminator:
+    """
+    Removes statements which can never be executed: ones following a statement which always returns from
+    the function, branches of conditions with constant values and functions which can not be called from main.
+
+    Code calling a function which does not exist is kept, as the program is rejected for it before running.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._checker = StaticTypeChecker(program)
+        self._function_names = set(program.function_definitions) | set(builtin_functions)
+        # Descriptions of removed code, in the order of removing
+        self.removed: list[str] = []
+
+    def eliminate(self) -> Program:
+        for function in self._program.function_definitions.values():
+            self._checker.check_function(function)
+            self.eliminate_in_statement(function.statement_block)
+        self.remove_unreachable_functions()
+        return self._program
+
+    def report(self, description: str, node):
+        self.removed.append(f"Removed {description} at: {node.position}.")
+
+    def is_removable(self, node) -> bool:
+        return not any(isinstance(sub_node, FunctionCall) and sub_node.identifier not in self._function_names
+                       for sub_node in node.iterate_nodes())
+
+    # Statements
+
+    def eliminate_in_statement(self, statement):
+        """
+        :return: the statement without dead code, or None if it may be removed as a whole
+        """
+        if isinstance(statement, StatementBlock):
+            self.eliminate_in_block(statement)
+        elif isinstance(statement, IfStatement):
+            return self.eliminate_in_if_statement(statement)
+        elif isinstance(statement, WhileStatement):
+            if self.is_constant_condition(statement, False) and self.is_removable(statement):
+                self.report(f"never executed {statement.__class__.__name__}", statement)
+                return None
+            statement.instructions = self.eliminate_in_branch(statement.instructions)
+        return statement
+
+    def eliminate_in_block(self, block: StatementBlock):
+        statements = []
+        returned = False
+        for statement in block.statements:
+            if returned:
+                if self.is_removable(statement):
+                    self.report(f"unreachable {statement.__class__.__name__}", statement)
+                else:
+                    statements.append(statement)
+            elif (statement := self.eliminate_in_statement(statement)) is not None:
+                statements.append(statement)
+                returned = self._checker.always_returns(statement)
+        block.statements = statements
+
+    def eliminate_in_branch(self, statement):
+        # A branch can not be removed from its statement, but it can be left empty
+        if (eliminated_statement := self.eliminate_in_statement(statement)) is None:
+            return StatementBlock(statement.get_position())
+        return eliminated_statement
+
+    def eliminate_in_if_statement(self, statement: IfStatement):
+        statement.instructions = self.eliminate_in_branch(statement.instructions)
+        if statement.else_statement:
+            statement.else_statement = self.eliminate_in_branch(statement.else_statement)
+
+        if self.is_constant_condition(statement, True):
+            if not statement.else_statement:
+                return statement.instructions
+            if self.is_removable(statement.else_statement):
+                self.report("never executed else branch", statement.else_statement)
+                return statement.instructions
+        elif self.is_constant_condition(statement, False) and self.is_removable(statement.instructions):
+            self.report("never executed if branch", statement.instructions)
+            return statement.else_statement
+        return statement
+
+    @staticmethod
+    def is_constant_condition(statement, value: bool) -> bool:
+        condition = statement.condition.expression
+        return isinstance(condition, Literal) and bool(condition.value) == value
+
+    # Functions
+
+    def remove_unreachable_functions(self):
+        function_definitions = self._program.function_definitions
+        if "main" not in function_definitions:
+            return
+
+        reachable_functions = {"main"}
+        unvisited_functions = ["main"]
+        while unvisited_functions:
+            function = function_definitions[unvisited_functions.pop()]
+            for node in function.statement_block.iterate_nodes():
+                if isinstance(node, FunctionCall) and node.identifier in function_definitions \
+                        and node.identifier not in reachable_functions:
+                    reachable_functions.add(node.identifier)
+                    unvisited_functions.append(node.identifier)
+
+        for name, function in list(function_definitions.items()):
+            # Functions named like builtin ones are rejected before running, even if never called
+            if name not in reachable_functions and name not in builtin_functions and self.is_removable(function):
+                self.report(f"never called function {name}", function)
+                del function_definitions[name]
+
+
+def format_dead_code_report(removed: list[str]) -> str:
+    if not removed:
+        return "No dead code has been found."
+    return "\n".join(removed)
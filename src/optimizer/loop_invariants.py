@@ -0,0 +1,100 @@
+from checker.type_checker import StaticTypeChecker
+from optimizer.common_subexpressions import get_expression_key, get_variable_type, replace_nodes, \
+    is_safe_expression, is_named_in_exceptions
+from parser.resolver import VariableResolver
+from parser.syntax_tree.literals import Literal
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, Identifier, Condition, IfStatement, \
+    WhileStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+
+# Source names start with a letter, so temporary variables can not clash with them
+TEMPORARY_NAME_PREFIX = "_licm"
+
+
+class LoopInvariantMover:
+    """
+    Computes expressions of while loops, whose variables the loop never changes, once before the loop and keeps
+    their values in temporary variables. Only expressions which can neither fail nor have any effect are moved,
+    so computing them even if the loop is never entered changes nothing but the time.
+
+    Expressions are moved before the outermost loop, as a variable can not be initialised again when a loop repeats.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._checker = StaticTypeChecker(program)
+        self._function: FunctionDefinition or None = None
+        self._temporaries_number = 0
+
+    def move(self) -> Program:
+        for function in self._program.function_definitions.values():
+            self._function = function
+            self._temporaries_number = 0
+            self._checker.check_function(function)
+            self.move_in_block(function.statement_block, set(function.parameters))
+            if self._temporaries_number:
+                VariableResolver().resolve(function)
+        return self._program
+
+    def move_in_block(self, block: StatementBlock, declared: set[str]):
+        """
+        :param declared: variables certainly initialised before the block
+        """
+        declared = set(declared)
+        statements = []
+        for statement in block.statements:
+            if isinstance(statement, WhileStatement):
+                statements.extend(self.move_out_of_loop(statement, declared))
+            elif isinstance(statement, StatementBlock):
+                self.move_in_block(statement, declared)
+            elif isinstance(statement, IfStatement):
+                self.move_in_branches(statement, declared)
+            statements.append(statement)
+            if isinstance(statement, VariableInitialisationStatement):
+                declared.add(statement.name)
+        block.statements = statements
+
+    def move_in_branches(self, statement: IfStatement, declared: set[str]):
+        for branch in (statement.instructions, statement.else_statement):
+            if isinstance(branch, StatementBlock):
+                self.move_in_block(branch, declared)
+            elif isinstance(branch, IfStatement):
+                self.move_in_branches(branch, declared)
+
+    def move_out_of_loop(self, loop: WhileStatement, declared: set[str]) -> list[VariableInitialisationStatement]:
+        """
+        Replaces invariant expressions of the loop with temporary variables.
+
+        :return: initialisations of the temporary variables
+        """
+        changed_variables = {node.name for node in loop.iterate_nodes()
+                             if isinstance(node, (VariableInitialisationStatement, AssignmentStatement))}
+        # Variables initialised before the loop and not changed by it keep their values
+        invariant_variables = declared - changed_variables
+        initialisations = {}
+        replacements = {}
+
+        def visit(node, parent=None):
+            if self.is_invariant(node, invariant_variables) and \
+                    not is_named_in_exceptions(node, parent, self._checker):
+                key = get_expression_key(node)
+                if key not in initialisations:
+                    name = f"{TEMPORARY_NAME_PREFIX}{self._temporaries_number}"
+                    self._temporaries_number += 1
+                    variable_type = get_variable_type(self._checker.infer(node))
+                    initialisations[key] = VariableInitialisationStatement(name, node, variable_type,
+                                                                           node.get_position())
+                replacements[id(node)] = Identifier(initialisations[key].name, node.get_position())
+                return
+            for child in node.get_children():
+                visit(child, node)
+
+        visit(loop)
+        replace_nodes(loop, replacements)
+        return list(initialisations.values())
+
+    def is_invariant(self, node, invariant_variables: set[str]) -> bool:
+        if isinstance(node, (Identifier, Literal, Condition)) or get_expression_key(node) is None:
+            return False
+        if get_variable_type(self._checker.infer(node)) is None:
+            return False
+        return is_safe_expression(node, self._checker, invariant_variables)
@@ -0,0 +1,21 @@
+from checker.type_checker import StaticTypeChecker
+from optimizer.common_subexpressions import CommonSubexpressionEliminator
+from optimizer.constant_folder import ConstantFolder
+from optimizer.dead_code import DeadCodeEliminator
+from optimizer.loop_invariants import LoopInvariantMover
+from parser.syntax_tree.syntax_tree import Program
+
+
+def optimise_program(program: Program) -> list[str]:
+    """
+    Runs all optimisations on the program, in place, then checks types of the resulting tree once.
+
+    :return: descriptions of removed dead code
+    """
+    ConstantFolder(program).fold()
+    dead_code_eliminator = DeadCodeEliminator(program)
+    dead_code_eliminator.eliminate()
+    CommonSubexpressionEliminator(program).eliminate()
+    LoopInvariantMover(program).move()
+    StaticTypeChecker(program).check()
+    return dead_code_eliminator.removed
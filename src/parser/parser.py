@@ -13,6 +13,7 @@ from parser.parser_exceptions import MisnomerParserUnexpectedTokenException, \
     MisnomerParserFunctionParameterNameDuplicateException
 from parser.syntax_tree.expressions import AndExpression, NotExpression, OrExpression, AdditiveExpression, \
     MultiplicativeExpression, AdditiveInvertedExpression, MultiplicativeInvertedExpression
+from parser.resolver import VariableResolver
 from parser.syntax_tree.literals import NumericLiteral, StringLiteral
 from parser.syntax_tree.statements import FunctionParameter, StatementBlock, IfStatement, FunctionDefinition, \
     Condition, WhileStatement, FunctionCall, Identifier, VariableInitialisationStatement, AssignmentStatement, \
@@ -24,6 +25,7 @@ class Parser:
     def __init__(self, lexer: Lexer):
         self._lexer: Lexer = lexer
         self._current_token: Token = self._lexer.get_next_token()
+        self._resolver = VariableResolver()
 
     def get_current_token_position(self):
         return copy(self._current_token.get_position())
@@ -62,8 +64,11 @@ class Parser:
             if not statement_block:
                 raise MisnomerParserNoFunctionStatementBlockException(function_name, self.get_current_token_position())
 
-            return FunctionDefinition(function_name, function_parameters, TYPES.get(return_type.get_type()),
-                                      statement_block, token.get_position())
+            function_definition = FunctionDefinition(function_name, function_parameters,
+                                                     TYPES.get(return_type.get_type()), statement_block,
+                                                     token.get_position())
+            self._resolver.resolve(function_definition)
+            return function_definition
 
     def parse_parameters(self) -> dict[str, FunctionParameter]:
         parameters: dict[str, FunctionParameter] = {}
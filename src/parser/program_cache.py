@@ -0,0 +1,73 @@
+import gc
+import os
+import pickle
+
+from parser.syntax_tree.syntax_tree import Program
+
+COMPILED_PROGRAM_MAGIC = b"MNMC"
+# Has to be increased whenever syntax tree classes change
+COMPILED_PROGRAM_VERSION = 9
+COMPILED_PROGRAM_EXTENSION = ".mnmc"
+
+
+def get_compiled_path(source_path: str) -> str:
+    """
+    Compiled programs are kept next to their sources, e.g. fibonacci.mnm -> fibonacci.mnmc.
+    """
+    return os.path.splitext(source_path)[0] + COMPILED_PROGRAM_EXTENSION
+
+
+def get_header(source_hash: str, max_string_length: int) -> bytes:
+    key = f"{source_hash}:{max_string_length}".encode("ascii")
+    return COMPILED_PROGRAM_MAGIC + bytes((COMPILED_PROGRAM_VERSION, len(key))) + key
+
+
+def load_compiled_program(source_path: str, source_hash: str, max_string_length: int) -> Program or None:
+    """
+    Loads the syntax tree saved by store_compiled_program.
+
+    :return: Program if the compiled file exists and matches the source, None otherwise
+    """
+    try:
+        with open(get_compiled_path(source_path), "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    header = get_header(source_hash, max_string_length)
+    if not data.startswith(header):
+        return None
+    # Unpickling allocates lots of nodes at once, which would otherwise trigger many useless garbage collections
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        program = pickle.loads(memoryview(data)[len(header):])
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return program if isinstance(program, Program) else None
+
+
+def store_compiled_program(source_path: str, source_hash: str, max_string_length: int, program: Program) -> bool:
+    """
+    Saves the syntax tree of a parsed program next to its source. Failing to write is not an error.
+
+    :return: True if the compiled file has been written
+    """
+    try:
+        data = get_header(source_hash, max_string_length) + pickle.dumps(program, pickle.HIGHEST_PROTOCOL)
+    except RecursionError:
+        # Extremely deeply nested trees cannot be serialised
+        return False
+
+    compiled_path = get_compiled_path(source_path)
+    temporary_path = f"{compiled_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(data)
+        os.replace(temporary_path, compiled_path)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,26 @@
+from parser.syntax_tree.statements import FunctionDefinition, Identifier, VariableInitialisationStatement, \
+    AssignmentStatement
+
+
+class VariableResolver:
+    """
+    Assigns every variable of a function a fixed slot, the index of its value in the function's call frame.
+    Parameters take the first slots, in their order. A name which is never declared gets a slot as well,
+    it just stays empty, so using it still fails at run time.
+    """
+    def __init__(self):
+        self._slots: dict[str, int] = {}
+
+    def resolve(self, function_definition: FunctionDefinition):
+        self._slots = {}
+        for parameter_name in function_definition.parameters:
+            self.get_slot(parameter_name)
+        for node in function_definition.statement_block.iterate_nodes():
+            if isinstance(node, (Identifier, VariableInitialisationStatement, AssignmentStatement)):
+                node.slot = self.get_slot(node.name)
+        function_definition.variables_number = len(self._slots)
+
+    def get_slot(self, name: str) -> int:
+        if (slot := self._slots.get(name)) is None:
+            slot = self._slots[name] = len(self._slots)
+        return slot
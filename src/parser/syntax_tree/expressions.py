@@ -9,6 +9,9 @@ class Expression(Node):
         super().__init__(position)
         self.expressions = expressions
 
+    def get_children(self) -> list:
+        return self.expressions if isinstance(self.expressions, list) else [self.expressions]
+
 
 class OrExpression(Expression):
     def __init__(self, expressions: list, position: Position):
@@ -123,6 +126,9 @@ class BinaryExpression(Node):
         self.left = left
         self.right = right
 
+    def get_children(self) -> list:
+        return [self.left, self.right]
+
 
 class EqualExpression(BinaryExpression):
     def __init__(self, left, right, position: Position):
@@ -23,6 +23,9 @@ class StatementBlock(Node):
     def add_statement(self, statement):
         self.statements.append(statement)
 
+    def get_children(self) -> list:
+        return self.statements
+
     def execute(self, context):
         for statement in self.statements:
             if (exit_code := statement.execute(context)) is not None and context.get_return_flag():
@@ -59,6 +62,12 @@ class FunctionDefinition(Node):
         self.return_type = return_type
         self.statement_block = statement_block
         self.add_function_parameters(parameters)
+        # Size of the call frame, set by VariableResolver
+        self.variables_number = len(self.parameters)
+        # Disabled by StaticTypeChecker, when proven unnecessary
+        self.check_return_type = True
+        # Cache of results, set for pure functions when memoization is enabled
+        self.memo_cache = None
 
     def get_name(self):
         return self.name
@@ -76,10 +85,18 @@ class FunctionDefinition(Node):
             if value_type not in correct_types:
                 raise exception(value_type, type_to_check.name, name, self.position)
 
-    def execute(self, context):
-        if self.name in context.functions:
+    def get_children(self) -> list:
+        return [self.statement_block]
+
+    def register(self, functions: dict):
+        if self.name in functions:
             raise MisnomerInterpreterVariableAlreadyExistsException(self.name, self.position)
-        context.add_function(self.name, self)
+        functions[self.name] = self
+
+    def link_function_calls(self, functions):
+        for node in self.statement_block.iterate_nodes():
+            if isinstance(node, FunctionCall):
+                node.link(functions)
 
     def __call__(self, context, *call_arguments_values):
         if (got_arguments_number := len(call_arguments_values)) != (expected_arguments_number := len(self.parameters)):
@@ -87,16 +104,30 @@ class FunctionDefinition(Node):
                                                                           got_arguments_number,
                                                                           self.name, self.position)
 
-        new_context = context.get_new_context()
-        for argument_name, argument_value in zip(self.parameters, call_arguments_values):
+        new_context = context.get_new_context(self.variables_number)
+        for slot, (argument_name, argument_value) in enumerate(zip(self.parameters, call_arguments_values)):
             self.check_if_value_matches_type(argument_name, argument_value,
                                              self.parameters[argument_name].argument_type,
                                              MisnomerInterpreterFunctionCallParameterTypeException)
-            new_context.set_variable(argument_name, argument_value)
+            new_context.set_variable(slot, argument_value)
+
+        result = self.statement_block.execute(new_context)
+        if self.check_return_type:
+            self.check_if_value_matches_type(self.name, result, self.return_type,
+                                             MisnomerInterpreterFunctionReturnTypeException)
+        return result
+
+    def call_with_checked_arguments(self, context, *call_arguments_values):
+        """
+        Calls the function with arguments already proven to match its parameters.
+        """
+        new_context = context.get_new_context(self.variables_number)
+        new_context.variables[:len(call_arguments_values)] = call_arguments_values
 
         result = self.statement_block.execute(new_context)
-        self.check_if_value_matches_type(self.name, result, self.return_type,
-                                         MisnomerInterpreterFunctionReturnTypeException)
+        if self.check_return_type:
+            self.check_if_value_matches_type(self.name, result, self.return_type,
+                                             MisnomerInterpreterFunctionReturnTypeException)
         return result
 
     def __eq__(self, other):
@@ -111,6 +142,64 @@ class FunctionCall(Node):
         super().__init__(position)
         self.identifier = identifier
         self.arguments = arguments
+        # Defined function called, builtins are taken from the context, as every execution has its own
+        self.function = None
+        # Disabled by StaticTypeChecker, when proven unnecessary
+        self.check_arguments = True
+
+    def get_children(self) -> list:
+        return self.arguments
+
+    def link(self, functions):
+        """
+        Binds the call to the called function, replacing the lookup on every execution with a call path specific
+        for defined or builtin functions. The path does not depend on the execution, so calls are linked once.
+        Defined functions are called through the context's profiler, when it has one.
+        """
+        if not (function := functions.get(self.identifier)):
+            raise MisnomerInterpreterFunctionDoesNotExistException(self.identifier, self.position)
+        if not isinstance(function, FunctionDefinition):
+            self.function = None
+            self.execute = self.execute_builtin_function
+            return
+        self.function = function
+        if function.memo_cache is not None:
+            self.execute = self.execute_memoized_function
+        elif self.check_arguments:
+            self.execute = self.execute_defined_function
+        else:
+            self.execute = self.execute_defined_function_with_checked_arguments
+
+    def execute_defined_function(self, context):
+        if context.profiler is not None:
+            return self.execute_profiled_function(context)
+        return self.function(context, *[argument.execute(context) for argument in self.arguments])
+
+    def execute_defined_function_with_checked_arguments(self, context):
+        if context.profiler is not None:
+            return self.execute_profiled_function(context)
+        return self.function.call_with_checked_arguments(context,
+                                                         *[argument.execute(context) for argument in self.arguments])
+
+    def execute_memoized_function(self, context):
+        if context.profiler is not None:
+            return self.execute_profiled_function(context)
+        arguments = [argument.execute(context) for argument in self.arguments]
+        return self.function.memo_cache.call(self.function, context, arguments)
+
+    def execute_profiled_function(self, context):
+        arguments = [argument.execute(context) for argument in self.arguments]
+        if self.function.memo_cache is not None:
+            return context.profiler.call(self.identifier, self.function.memo_cache.call, self.function, context,
+                                         arguments)
+        return context.profiler.call(self.identifier, self.function, context, *arguments)
+
+    def execute_builtin_function(self, context):
+        arguments = [argument.execute(context) for argument in self.arguments]
+        try:
+            return context.functions[self.identifier](*arguments)
+        except MisnomerInterpreterCastingBuiltinException as e:
+            raise MisnomerInterpreterCastingException(e.cast_type, e.expression, self.position)
 
     def execute(self, context):
         if function := context.get_function(self.identifier):
@@ -134,9 +223,10 @@ class Identifier(Node):
     def __init__(self, name, position: Position):
         super().__init__(position)
         self.name = name
+        self.slot = None
 
     def execute(self, context):
-        if (variable := context.get_variable(self.name)) is not None:
+        if (variable := context.variables[self.slot]) is not None:
             return variable
         raise MisnomerInterpreterVariableDoesNotExistException(self.name, self.position)
 
@@ -150,6 +240,9 @@ class Condition(Node):
         super().__init__(position)
         self.expression = logic_expression
 
+    def get_children(self) -> list:
+        return [self.expression]
+
     def execute(self, context):
         return self.expression.execute(context)
 
@@ -164,6 +257,9 @@ class ConditionalStatement(Statement):
         self.condition = condition
         self.instructions = instructions
 
+    def get_children(self) -> list:
+        return [self.condition, self.instructions]
+
     def __eq__(self, other):
         super_eq = super().__eq__(other)
         attributes_eq = self.condition == other.condition and self.instructions == other.instructions
@@ -175,6 +271,9 @@ class IfStatement(ConditionalStatement):
         super().__init__(condition, instructions, position)
         self.else_statement = else_statement
 
+    def get_children(self) -> list:
+        return super().get_children() + ([self.else_statement] if self.else_statement else [])
+
     def execute(self, context):
         if self.condition.execute(context):
             return self.instructions.execute(context)
@@ -202,6 +301,9 @@ class ReturnStatement(Node):
         super().__init__(position)
         self.value = value
 
+    def get_children(self) -> list:
+        return [self.value] if self.value is not None else []
+
     def execute(self, context):
         context.set_return_flag(True)
         return self.value.execute(context) if self.value is not None else None
@@ -217,6 +319,12 @@ class VariableInitialisationStatement(Statement):
         self.name = name
         self.value = value
         self.variable_type = variable_type
+        self.slot = None
+        # Disabled by StaticTypeChecker, when proven unnecessary
+        self.check_type = True
+
+    def get_children(self) -> list:
+        return [self.value]
 
     def check_if_value_matches_type(self, result):
         value_type = type(result)
@@ -226,11 +334,12 @@ class VariableInitialisationStatement(Statement):
                                                                          self.name, self.position)
 
     def execute(self, context):
-        if self.name in context.variables:
+        if context.variables[self.slot] is not None:
             raise MisnomerInterpreterVariableAlreadyExistsException(self.name, self.position)
         result = self.value.execute(context)
-        self.check_if_value_matches_type(result)
-        context.set_variable(self.name, result)
+        if self.check_type:
+            self.check_if_value_matches_type(result)
+        context.variables[self.slot] = result
 
     def __eq__(self, other):
         super_eq = super().__eq__(other)
@@ -244,14 +353,20 @@ class AssignmentStatement(Statement):
         super().__init__(position)
         self.name = name
         self.value = value
+        self.slot = None
+        # Disabled by StaticTypeChecker, when proven unnecessary
+        self.check_type = True
+
+    def get_children(self) -> list:
+        return [self.value]
 
     def execute(self, context):
-        if self.name not in context.variables:
+        if (variable := context.variables[self.slot]) is None:
             raise MisnomerInterpreterVariableDoesNotExistException(self.name, self.position)
         result = self.value.execute(context)
-        variable_type = type(context.get_variable(self.name))
-        if type(result) == variable_type:
-            context.set_variable(self.name, result)
+        variable_type = type(variable)
+        if not self.check_type or type(result) == variable_type:
+            context.variables[self.slot] = result
         else:
             raise MisnomerInterpreterVariableAssignmentTypeException(type(result), variable_type, self.name,
                                                                      self.position)
@@ -1,5 +1,7 @@
 from copy import copy
+from types import MappingProxyType
 
+from interpreter.builtin_functions import builtin_functions, get_builtin_functions
 from interpreter.interpreter_exceptions import MisnomerInterpreterNoMainFunctionException
 from parser.parser_exceptions import MisnomerParserFunctionNameDuplicateException
 from utils.position import Position
@@ -18,6 +20,17 @@ class Node:
     def execute(self, context):
         raise NotImplemented("This is just an interface method.")
 
+    def get_children(self) -> list:
+        return []
+
+    def iterate_nodes(self):
+        """
+        Yields the node and all nodes below it, depth first in source order.
+        """
+        yield self
+        for child in self.get_children():
+            yield from child.iterate_nodes()
+
     def __eq__(self, other):
         return self.position == other.position
 
@@ -26,6 +39,10 @@ class Program(Node):
     def __init__(self):
         super().__init__(Position())
         self.function_definitions: dict = {}
+        # Set by StaticTypeChecker, which has to check the program only once
+        self.type_checked = False
+        # Set once function calls are linked, reset when something they are linked by changes
+        self.calls_linked = False
 
     def add_function_definition(self, function_definition):
         function_name = function_definition.get_name()
@@ -33,11 +50,41 @@ class Program(Node):
             raise MisnomerParserFunctionNameDuplicateException(function_name, function_definition.get_position())
         self.function_definitions[function_name] = function_definition
 
+    def link_functions(self, builtins: dict = builtin_functions) -> MappingProxyType:
+        """
+        Builds the table of builtin and defined functions, shared by all contexts of the execution.
+        """
+        functions = builtins.copy()
+        for function in self.function_definitions.values():
+            function.register(functions)
+        return MappingProxyType(functions)
+
+    def link_function_calls(self, functions: MappingProxyType or None = None):
+        """
+        Links calls of all functions once, before the first execution, so that executions only read the program.
+        """
+        functions = self.link_functions() if functions is None else functions
+        for function in self.function_definitions.values():
+            function.link_function_calls(functions)
+        self.calls_linked = True
+
+    def get_children(self) -> list:
+        return list(self.function_definitions.values())
+
     def execute(self, context):
-        for function_name, function in self.function_definitions.items():
-            function.execute(context)
-        if main := context.functions.get("main"):
-            if (exit_code := main.statement_block.execute(context)) is not None:
+        builtins = get_builtin_functions(context.input_output)
+        if (profiler := context.profiler) is not None:
+            builtins = profiler.wrap_builtin_functions(builtins)
+        context.set_functions(functions := self.link_functions(builtins))
+        if main := functions.get("main"):
+            if not self.calls_linked:
+                self.link_function_calls(functions)
+            context.allocate_variables(main.variables_number)
+            if profiler is not None:
+                exit_code = profiler.call(main.name, main.statement_block.execute, context)
+            else:
+                exit_code = main.statement_block.execute(context)
+            if exit_code is not None:
                 return exit_code
             return 0
         raise MisnomerInterpreterNoMainFunctionException(self.position)
@@ -0,0 +1,32 @@
+from parser.syntax_tree.literals import Literal
+from parser.syntax_tree.statements import FunctionDefinition, FunctionCall, Identifier, \
+    VariableInitialisationStatement, AssignmentStatement
+
+INDENT = "  "
+
+
+def describe_node(node) -> str:
+    if isinstance(node, FunctionDefinition):
+        parameters = ", ".join(f"{parameter.name}: {parameter.argument_type.name.lower()}"
+                               for parameter in node.parameters.values())
+        return f"{node.name}({parameters}) returns {node.return_type.name.lower()}"
+    elif isinstance(node, Literal):
+        return repr(node.value)
+    elif isinstance(node, (Identifier, AssignmentStatement)):
+        return node.name
+    elif isinstance(node, VariableInitialisationStatement):
+        return f"{node.name}: {node.variable_type.name.lower()}"
+    elif isinstance(node, FunctionCall):
+        return node.identifier
+    return ""
+
+
+def format_tree(node, depth: int = 0) -> str:
+    """
+    :return: the syntax tree below the node, one node per line, indented by its depth
+    """
+    description = describe_node(node)
+    lines = [f"{INDENT * depth}{node.__class__.__name__}{' ' + description if description else ''} "
+             f"({node.position})"]
+    lines.extend(format_tree(child, depth + 1) for child in node.get_children())
+    return "\n".join(lines)
@@ -0,0 +1,668 @@
+import operator
+from contextlib import contextmanager
+from types import NoneType
+
+from interpreter.builtin_functions import builtin_functions, get_builtin_functions
+from interpreter.dictionaries import misnomer_types_to_python_types
+from interpreter.interpreter_exceptions import MisnomerInterpreterVariableAlreadyExistsException, \
+    MisnomerInterpreterNoMainFunctionException, MisnomerInterpreterExceededMaximumDepthException, \
+    MisnomerInterpreterArgumentsNumberDoesNotMatchException, MisnomerInterpreterFunctionDoesNotExistException, \
+    MisnomerInterpreterVariableDoesNotExistException, MisnomerInterpreterCastingException, \
+    MisnomerInterpreterCastingBuiltinException, MisnomerInterpreterVariableAssignmentTypeException, \
+    MisnomerInterpreterFunctionReturnTypeException, MisnomerInterpreterFunctionCallParameterTypeException, \
+    MisnomerInterpreterCouldNotNegateExpressionException, MisnomerInterpreterBadOperandTypeException, \
+    MisnomerInterpreterZeroDivisionException
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression, \
+    EqualExpression, NotEqualExpression, LessExpression, LessEqualExpression, GreaterExpression, \
+    GreaterEqualExpression
+from parser.syntax_tree.literals import Literal, NumericLiteral
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, FunctionCall, Identifier, Condition, \
+    IfStatement, WhileStatement, ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+from parser.types import Type
+
+ENTRY_FUNCTION_NAME = "run_main"
+RECURSION_LIMIT_NAME = "recursion_limit"
+
+COMPARISON_OPERATORS = {
+    EqualExpression: "==",
+    NotEqualExpression: "!=",
+    LessExpression: "<",
+    LessEqualExpression: "<=",
+    GreaterExpression: ">",
+    GreaterEqualExpression: ">=",
+}
+
+EXCEPTIONS = (
+    MisnomerInterpreterExceededMaximumDepthException, MisnomerInterpreterVariableAlreadyExistsException,
+    MisnomerInterpreterVariableDoesNotExistException, MisnomerInterpreterCastingException,
+    MisnomerInterpreterCastingBuiltinException, MisnomerInterpreterVariableAssignmentTypeException,
+    MisnomerInterpreterFunctionReturnTypeException, MisnomerInterpreterFunctionCallParameterTypeException,
+    MisnomerInterpreterCouldNotNegateExpressionException, MisnomerInterpreterBadOperandTypeException,
+    MisnomerInterpreterZeroDivisionException
+)
+
+
+def raise_variable_does_not_exist(name: str, position):
+    raise MisnomerInterpreterVariableDoesNotExistException(name, position)
+
+
+def raise_arguments_number_does_not_match(expected_arguments_number: int, name: str, position, *arguments):
+    raise MisnomerInterpreterArgumentsNumberDoesNotMatchException(expected_arguments_number, len(arguments),
+                                                                  name, position)
+
+
+def iterate_statements(statement):
+    """
+    Yields the statement and all statements nested in it.
+    """
+    yield statement
+    if isinstance(statement, StatementBlock):
+        for sub_statement in statement.statements:
+            yield from iterate_statements(sub_statement)
+    elif isinstance(statement, IfStatement):
+        yield from iterate_statements(statement.instructions)
+        if statement.else_statement:
+            yield from iterate_statements(statement.else_statement)
+    elif isinstance(statement, WhileStatement):
+        yield from iterate_statements(statement.instructions)
+
+
+class PythonTranspiler:
+    """
+    Translates a syntax tree into Python source, in which Misnomer functions become Python functions and variables
+    become their locals. Running it gives the same results and raises the same exceptions as Interpreter.
+
+    Expressions are translated into Python expressions as long as Python evaluates them in the same order. Nodes
+    turning exceptions into Misnomer ones store their result in a temporary variable within try statement.
+
+    Builtin functions and the recursion limit are globals given when executing, so the same source may be executed
+    with different ones.
+    """
+    def __init__(self, program: Program):
+        self._program = program
+        self._namespace = {exception.__name__: exception for exception in EXCEPTIONS}
+        self._namespace.update({
+            "NoneType": NoneType,
+            raise_variable_does_not_exist.__name__: raise_variable_does_not_exist,
+            raise_arguments_number_does_not_match.__name__: raise_arguments_number_does_not_match,
+        })
+        self._constants = {}
+        self._function_names = {}
+        self._lines = []
+        self._indentation = 0
+
+        # State of the function being translated
+        self._function: FunctionDefinition or None = None
+        self._is_entry = False
+        self._variable_names = {}
+        self._temporary_count = 0
+        self._declared: set[str] = set()
+        self._possibly_declared: set[str] = set()
+        self._return_flag_may_be_set = False
+
+    def transpile(self) -> str:
+        for index, (function_name, function_definition) in enumerate(self._program.function_definitions.items()):
+            if function_name in builtin_functions:
+                raise MisnomerInterpreterVariableAlreadyExistsException(function_name, function_definition.position)
+            self._function_names[function_name] = f"f_{function_name}" if function_name.isascii() else f"f__{index}"
+
+        if not (main := self._program.function_definitions.get("main")):
+            raise MisnomerInterpreterNoMainFunctionException(self._program.position)
+
+        for function_name, function_definition in self._program.function_definitions.items():
+            self.transpile_function(function_definition, self._function_names[function_name], is_entry=False)
+        # Main function is executed like a statement block, without parameters and checking the returned value
+        self.transpile_function(main, ENTRY_FUNCTION_NAME, is_entry=True)
+        return "\n".join(self._lines) + "\n"
+
+    def get_namespace(self, functions: dict, recursion_limit: int) -> dict:
+        """
+        :param functions: builtin functions called by the transpiled source
+        :return: globals the transpiled source has to be executed with
+        """
+        namespace = dict(self._namespace)
+        namespace.update({f"b_{name}": function for name, function in functions.items()})
+        namespace[RECURSION_LIMIT_NAME] = recursion_limit
+        return namespace
+
+    # Emitting
+
+    def emit(self, line: str):
+        self._lines.append("    " * self._indentation + line)
+
+    @contextmanager
+    def indented(self):
+        self._indentation += 1
+        length = len(self._lines)
+        yield
+        if len(self._lines) == length:
+            self.emit("pass")
+        self._indentation -= 1
+
+    @contextmanager
+    def captured(self):
+        """
+        Collects the lines emitted within the block instead of emitting them.
+        """
+        lines = self._lines
+        self._lines = captured_lines = []
+        yield captured_lines
+        self._lines = lines
+
+    @contextmanager
+    def protected(self, exception_name: str, raised_exception: str):
+        self.emit("try:")
+        with self.indented():
+            yield
+        self.emit(f"except {exception_name}:")
+        with self.indented():
+            self.emit(f"raise {raised_exception}")
+
+    @contextmanager
+    def conditional(self):
+        # Variables initialised within the block are not certainly initialised after it, as it may be skipped
+        declared = self._declared
+        self._declared = set(declared)
+        yield
+        self._declared = declared
+
+    def constant(self, value) -> str:
+        """
+        :return: name of a global holding the value
+        """
+        if (name := self._constants.get(id(value))) is None:
+            name = self._constants[id(value)] = f"c_{len(self._constants)}"
+            self._namespace[name] = value
+        return name
+
+    def get_temporary(self) -> str:
+        self._temporary_count += 1
+        return f"t_{self._temporary_count}"
+
+    def get_variable_name(self, name: str) -> str:
+        if (variable_name := self._variable_names.get(name)) is None:
+            variable_name = f"v_{name}" if name.isascii() else f"v__{len(self._variable_names)}"
+            self._variable_names[name] = variable_name
+        return variable_name
+
+    @staticmethod
+    def get_type_check(value: str, allowed_types: tuple) -> str:
+        """
+        :return: condition met by values of other types than allowed
+        """
+        if len(allowed_types) == 1:
+            return f"type({value}) is not {allowed_types[0].__name__}"
+        return f"type({value}) not in ({', '.join(allowed_type.__name__ for allowed_type in allowed_types)})"
+
+    # Functions
+
+    def transpile_function(self, definition: FunctionDefinition, python_name: str, is_entry: bool):
+        self._function = definition
+        self._is_entry = is_entry
+        self._variable_names = {}
+        self._temporary_count = 0
+        self._return_flag_may_be_set = False
+        parameters = [] if is_entry else list(definition.parameters)
+        self._declared = set(parameters)
+        self._possibly_declared = set(parameters)
+        parameter_names = [self.get_variable_name(parameter) for parameter in parameters]
+
+        with self.captured() as body:
+            self._indentation += 1
+            self.transpile_statement_block(definition.statement_block)
+            self.emit_return("None")
+            self._indentation -= 1
+
+        self.emit(f"def {python_name}({', '.join(['calls'] + parameter_names)}):")
+        with self.indented():
+            if not is_entry:
+                self.emit("calls -= 1")
+                self.emit("if calls <= 0:")
+                with self.indented():
+                    self.emit(f"raise {MisnomerInterpreterExceededMaximumDepthException.__name__}"
+                              f"({RECURSION_LIMIT_NAME})")
+                for parameter_name, parameter in zip(parameter_names, definition.parameters.values()):
+                    allowed_types = misnomer_types_to_python_types[parameter.argument_type]
+                    self.emit(f"if {self.get_type_check(parameter_name, allowed_types)}:")
+                    with self.indented():
+                        self.emit(f"raise {MisnomerInterpreterFunctionCallParameterTypeException.__name__}"
+                                  f"(type({parameter_name}), {parameter.argument_type.name!r}, {parameter.name!r}, "
+                                  f"{self.constant(definition.position)})")
+            if self._return_flag_may_be_set:
+                self.emit("return_flag = False")
+            if local_names := [name for name in self._variable_names.values() if name not in parameter_names]:
+                self.emit(" = ".join(local_names) + " = None")
+            self._lines.extend(body)
+        self.emit("")
+
+    def emit_return(self, value: str):
+        if self._is_entry:
+            self.emit(f"return {value}")
+            return
+
+        return_type = self._function.return_type
+        if value == "None":
+            if return_type != Type.NOTHING:
+                self.emit(f"raise {MisnomerInterpreterFunctionReturnTypeException.__name__}(NoneType, "
+                          f"{return_type.name!r}, {self._function.name!r}, {self.constant(self._function.position)})")
+            else:
+                self.emit("return None")
+            return
+
+        self.emit(f"if {self.get_type_check(value, misnomer_types_to_python_types[return_type])}:")
+        with self.indented():
+            self.emit(f"raise {MisnomerInterpreterFunctionReturnTypeException.__name__}(type({value}), "
+                      f"{return_type.name!r}, {self._function.name!r}, {self.constant(self._function.position)})")
+        self.emit(f"return {value}")
+
+    # Statements
+
+    def emit_result(self, value: str, atomic: bool, may_be_none: bool, result: str or None):
+        """
+        Emits handling of the value a statement evaluates to. Within a statement block the function returns it,
+        if it is not None and the return flag has been set. Within a loop the loop is left with it, if it is not None.
+
+        :param atomic: whether the value is a name or a literal, which may be repeated without evaluating it again
+        :param result: None for statement blocks, name of the variable holding the result for loops
+        """
+        if result is None:
+            if not self._return_flag_may_be_set:
+                if not atomic:
+                    self.emit(value)
+                return
+            value, _ = self.store(value, atomic)
+            self.emit(f"if {value} is not None and return_flag:" if may_be_none else "if return_flag:")
+            with self.indented():
+                self.emit_return(value)
+        else:
+            self.emit(f"{result} = {value}")
+            if may_be_none:
+                self.emit(f"if {result} is not None:")
+                with self.indented():
+                    self.emit("break")
+            else:
+                self.emit("break")
+
+    def transpile_statement(self, statement, result: str or None):
+        if isinstance(statement, StatementBlock):
+            self.transpile_statement_block(statement)
+        elif isinstance(statement, IfStatement):
+            self.transpile_if_statement(statement, result)
+        elif isinstance(statement, WhileStatement):
+            self.transpile_while_statement(statement, result)
+        elif isinstance(statement, ReturnStatement):
+            self.transpile_return_statement(statement, result)
+        elif isinstance(statement, VariableInitialisationStatement):
+            self.transpile_variable_initialisation(statement)
+        elif isinstance(statement, AssignmentStatement):
+            self.transpile_assignment(statement)
+        else:
+            value, atomic = self.transpile_expression(statement)
+            self.emit_result(value, atomic, self.may_be_none(statement), result)
+
+    def transpile_statement_block(self, block: StatementBlock):
+        # Values of statements within a block may only return from the function, which leaves enclosing loops as well
+        for statement in block.statements:
+            self.transpile_statement(statement, None)
+
+    def transpile_if_statement(self, statement: IfStatement, result: str or None):
+        condition, _ = self.transpile_expression(statement.condition)
+        self.emit(f"if {condition}:")
+        with self.indented(), self.conditional():
+            self.transpile_statement(statement.instructions, result)
+        if statement.else_statement:
+            self.emit("else:")
+            with self.indented(), self.conditional():
+                self.transpile_statement(statement.else_statement, result)
+
+    def transpile_while_statement(self, statement: WhileStatement, result: str or None):
+        body_statements = list(iterate_statements(statement.instructions))
+        if any(isinstance(body_statement, ReturnStatement) for body_statement in body_statements):
+            self._return_flag_may_be_set = True
+        for body_statement in body_statements:
+            if isinstance(body_statement, VariableInitialisationStatement):
+                self._possibly_declared.add(body_statement.name)
+
+        loop_result = None
+        if self.produces_value(statement.instructions):
+            loop_result = self.get_temporary()
+            self.emit(f"{loop_result} = None")
+
+        with self.captured() as condition_lines:
+            condition, _ = self.transpile_expression(statement.condition)
+        if condition_lines:
+            self.emit("while True:")
+        else:
+            self.emit(f"while {condition}:")
+        with self.indented(), self.conditional():
+            if condition_lines:
+                self._lines.extend("    " + line for line in condition_lines)
+                self.emit(f"if not {condition}:")
+                with self.indented():
+                    self.emit("break")
+            self.transpile_statement(statement.instructions, loop_result)
+
+        if loop_result:
+            self.emit_result(loop_result, True, True, result)
+
+    def transpile_return_statement(self, statement: ReturnStatement, result: str or None):
+        if statement.value is None:
+            self._return_flag_may_be_set = True
+            self.emit("return_flag = True")
+            return
+
+        value, atomic = self.transpile_expression(statement.value)
+        if result is None and not self.may_be_none(statement.value):
+            # The flag would not be read anymore, the value is only checked and returned
+            value, _ = self.store(value, atomic)
+            self.emit_return(value)
+            return
+        self._return_flag_may_be_set = True
+        self.emit("return_flag = True")
+        self.emit_result(value, atomic, self.may_be_none(statement.value), result)
+
+    def transpile_variable_initialisation(self, statement: VariableInitialisationStatement):
+        variable_name = self.get_variable_name(statement.name)
+        position = self.constant(statement.position)
+        if statement.name in self._possibly_declared:
+            self.emit(f"if {variable_name} is not None:")
+            with self.indented():
+                self.emit(f"raise {MisnomerInterpreterVariableAlreadyExistsException.__name__}"
+                          f"({statement.name!r}, {position})")
+
+        value, atomic = self.transpile_expression(statement.value)
+        if not atomic:
+            temporary = self.get_temporary()
+            self.emit(f"{temporary} = {value}")
+            value = temporary
+        allowed_types = misnomer_types_to_python_types[statement.variable_type]
+        if not (isinstance(statement.value, Literal) and type(statement.value.value) in allowed_types):
+            self.emit(f"if {self.get_type_check(value, allowed_types)}:")
+            with self.indented():
+                self.emit(f"raise {MisnomerInterpreterVariableAssignmentTypeException.__name__}(type({value}), "
+                          f"{statement.variable_type.name!r}, {statement.name!r}, {position})")
+        self.emit(f"{variable_name} = {value}")
+        self._declared.add(statement.name)
+        self._possibly_declared.add(statement.name)
+
+    def transpile_assignment(self, statement: AssignmentStatement):
+        variable_name = self.get_variable_name(statement.name)
+        position = self.constant(statement.position)
+        if statement.name not in self._declared:
+            self.emit(f"if {variable_name} is None:")
+            with self.indented():
+                self.emit(f"raise {MisnomerInterpreterVariableDoesNotExistException.__name__}"
+                          f"({statement.name!r}, {position})")
+
+        value, atomic = self.transpile_expression(statement.value)
+        if not atomic:
+            temporary = self.get_temporary()
+            self.emit(f"{temporary} = {value}")
+            value = temporary
+        self.emit(f"if type({value}) is not type({variable_name}):")
+        with self.indented():
+            self.emit(f"raise {MisnomerInterpreterVariableAssignmentTypeException.__name__}(type({value}), "
+                      f"type({variable_name}), {statement.name!r}, {position})")
+        self.emit(f"{variable_name} = {value}")
+
+    @classmethod
+    def produces_value(cls, statement) -> bool:
+        """
+        Checks whether the statement may evaluate to a value other than None, when it is not a statement block.
+        """
+        if isinstance(statement, IfStatement):
+            return cls.produces_value(statement.instructions) or \
+                bool(statement.else_statement) and cls.produces_value(statement.else_statement)
+        elif isinstance(statement, WhileStatement):
+            return cls.produces_value(statement.instructions)
+        elif isinstance(statement, ReturnStatement):
+            return statement.value is not None
+        return not isinstance(statement, (StatementBlock, VariableInitialisationStatement, AssignmentStatement))
+
+    def may_be_none(self, expression) -> bool:
+        if not isinstance(expression, FunctionCall):
+            return False
+        if function := self._program.function_definitions.get(expression.identifier):
+            return function.return_type == Type.NOTHING
+        return True
+
+    # Expressions
+
+    def transpile_expression(self, expression) -> tuple[str, bool]:
+        """
+        Emits statements evaluating parts of the expression, if it needs any.
+
+        :return: Python expression giving the value and whether it is just a name or a literal, which may be
+                 evaluated at any moment
+        """
+        if isinstance(expression, Literal):
+            if isinstance(expression.value, str) or expression.value >= 0:
+                return repr(expression.value), True
+            return f"({expression.value!r})", True
+        elif isinstance(expression, Identifier):
+            return self.transpile_identifier(expression)
+        elif isinstance(expression, FunctionCall):
+            return self.transpile_function_call(expression)
+        elif isinstance(expression, Condition):
+            return self.transpile_expression(expression.expression)
+        elif isinstance(expression, UnaryExpression):
+            return self.transpile_expression(expression.expressions)
+        elif comparison_operator := COMPARISON_OPERATORS.get(type(expression)):
+            left, right = self.transpile_in_order([expression.left, expression.right])
+            return f"({left} {comparison_operator} {right})", False
+        elif isinstance(expression, AdditiveExpression):
+            return self.transpile_folded_expression(
+                expression, 0, "+", operator.add,
+                f"{MisnomerInterpreterBadOperandTypeException.__name__}('+', "
+                f"{self.constant(expression.expressions[0])}, {self.constant(expression.position)})")
+        elif isinstance(expression, MultiplicativeExpression):
+            # Fails with AttributeError, just like MultiplicativeExpression does
+            return self.transpile_folded_expression(
+                expression, 1, "*", operator.mul,
+                f"{MisnomerInterpreterBadOperandTypeException.__name__}('*', "
+                f"{self.constant(expression.expressions)}, {self.constant(expression.expressions)}.position)")
+        elif isinstance(expression, AdditiveInvertedExpression):
+            return self.transpile_additive_inverted_expression(expression)
+        elif isinstance(expression, MultiplicativeInvertedExpression):
+            return self.transpile_multiplicative_inverted_expression(expression)
+        elif isinstance(expression, NotExpression):
+            return self.transpile_not_expression(expression)
+        elif isinstance(expression, (OrExpression, AndExpression)):
+            return self.transpile_logic_expression(expression)
+        raise TypeError(f"Cannot transpile {expression.__class__.__name__}.")
+
+    def transpile_in_order(self, expressions) -> list[str]:
+        """
+        Translates expressions evaluated one after another. Values of the earlier ones are stored before
+        statements evaluating the later ones, so that Python evaluates all of them in the original order.
+        """
+        values = []
+        for expression in expressions:
+            with self.captured() as lines:
+                value = self.transpile_expression(expression)
+            if lines:
+                values = [self.store(*previous_value) for previous_value in values]
+                self._lines.extend(lines)
+            values.append(value)
+        return [value for value, _ in values]
+
+    def store(self, value: str, atomic: bool) -> tuple[str, bool]:
+        if atomic:
+            return value, atomic
+        temporary = self.get_temporary()
+        self.emit(f"{temporary} = {value}")
+        return temporary, True
+
+    def transpile_identifier(self, identifier: Identifier) -> tuple[str, bool]:
+        variable_name = self.get_variable_name(identifier.name)
+        if identifier.name in self._declared:
+            return variable_name, True
+        # Values of variables are never None
+        return f"({variable_name} if {variable_name} is not None else " \
+               f"raise_variable_does_not_exist({identifier.name!r}, {self.constant(identifier.position)}))", False
+
+    def transpile_function_call(self, call: FunctionCall) -> tuple[str, bool]:
+        position = self.constant(call.position)
+        if function := self._program.function_definitions.get(call.identifier):
+            arguments = self.transpile_in_order(call.arguments)
+            if len(arguments) != len(function.parameters):
+                arguments = [str(len(function.parameters)), repr(function.name), self.constant(function.position)] \
+                    + arguments
+                return f"raise_arguments_number_does_not_match({', '.join(arguments)})", False
+            return f"{self._function_names[call.identifier]}({', '.join(['calls'] + arguments)})", False
+
+        elif call.identifier in builtin_functions:
+            arguments = self.transpile_in_order(call.arguments)
+            temporary = self.get_temporary()
+            self.emit("try:")
+            with self.indented():
+                self.emit(f"{temporary} = b_{call.identifier}({', '.join(arguments)})")
+            self.emit(f"except {MisnomerInterpreterCastingBuiltinException.__name__} as e:")
+            with self.indented():
+                self.emit(f"raise {MisnomerInterpreterCastingException.__name__}"
+                          f"(e.cast_type, e.expression, {position})")
+            return temporary, True
+
+        # Reported when translating, just like Program links function calls before executing
+        raise MisnomerInterpreterFunctionDoesNotExistException(call.identifier, call.position)
+
+    def transpile_folded_expression(self, expression, initial_value, operator_sign: str, operation,
+                                    raised_exception: str) -> tuple[str, bool]:
+        """
+        Translates initial_value combined with every sub expression in turn, each combination evaluated before
+        the next sub expression.
+        """
+        first_expression, *other_expressions = expression.expressions
+        temporary = self.get_temporary()
+        with self.protected("TypeError", raised_exception):
+            if isinstance(first_expression, NumericLiteral):
+                value = repr(operation(initial_value, first_expression.value))
+            else:
+                first_value, _ = self.transpile_expression(first_expression)
+                value = f"{initial_value} {operator_sign} {first_value}"
+            for sub_expression in other_expressions:
+                with self.captured() as lines:
+                    sub_value, _ = self.transpile_expression(sub_expression)
+                if lines:
+                    self.emit(f"{temporary} = {value}")
+                    value = temporary
+                    self._lines.extend(lines)
+                value = f"{value} {operator_sign} {sub_value}"
+            self.emit(f"{temporary} = {value}")
+        return temporary, True
+
+    def transpile_additive_inverted_expression(self, expression: AdditiveInvertedExpression) -> tuple[str, bool]:
+        inverted_expression = expression.expressions
+        if isinstance(inverted_expression, NumericLiteral):
+            return f"({-inverted_expression.value!r})", True
+
+        temporary = self.get_temporary()
+        with self.protected("TypeError", f"{MisnomerInterpreterBadOperandTypeException.__name__}('-', "
+                                         f"{self.constant(inverted_expression)}, "
+                                         f"{self.constant(inverted_expression.position)})"):
+            value, _ = self.transpile_expression(inverted_expression)
+            self.emit(f"{temporary} = -{value}")
+        return temporary, True
+
+    def transpile_multiplicative_inverted_expression(self, expression: MultiplicativeInvertedExpression) \
+            -> tuple[str, bool]:
+        inverted_expression = expression.expressions
+        if isinstance(inverted_expression, NumericLiteral) and inverted_expression.value:
+            return repr(1.0 / inverted_expression.value), True
+
+        temporary = self.get_temporary()
+        with self.protected("TypeError", f"{MisnomerInterpreterBadOperandTypeException.__name__}('/', "
+                                         f"{self.constant(inverted_expression)}, "
+                                         f"{self.constant(inverted_expression.position)})"):
+            value, _ = self.transpile_expression(inverted_expression)
+            self.emit(f"{temporary} = {value}")
+            self.emit(f"if not {temporary}:")
+            with self.indented():
+                self.emit(f"raise {MisnomerInterpreterZeroDivisionException.__name__}"
+                          f"({self.constant(expression.position)})")
+            self.emit(f"{temporary} = 1.0 / {temporary}")
+        return temporary, True
+
+    def transpile_not_expression(self, expression: NotExpression) -> tuple[str, bool]:
+        negated_expression = expression.expressions
+        temporary = self.get_temporary()
+        with self.protected("ValueError", f"{MisnomerInterpreterCouldNotNegateExpressionException.__name__}("
+                                          f"{self.constant(negated_expression)}, "
+                                          f"{self.constant(negated_expression.position)})"):
+            value, _ = self.transpile_expression(negated_expression)
+            self.emit(f"{temporary} = not {value}")
+        return temporary, True
+
+    def transpile_logic_expression(self, expression) -> tuple[str, bool]:
+        is_or_expression = isinstance(expression, OrExpression)
+        values = []
+        for sub_expression in expression.expressions:
+            with self.captured() as lines:
+                value, _ = self.transpile_expression(sub_expression)
+            values.append((value, lines))
+
+        if not any(lines for _, lines in values):
+            connector = " or " if is_or_expression else " and "
+            return f"(True if {connector.join(value for value, _ in values)} else False)", False
+
+        # Evaluates following sub expressions only while the result is not known yet
+        temporary = self.get_temporary()
+        self.emit(f"{temporary} = {is_or_expression}")
+        indentation = self._indentation
+        for value, lines in values:
+            self._lines.extend("    " * (self._indentation - indentation) + line for line in lines)
+            self.emit(f"if not {value}:" if is_or_expression else f"if {value}:")
+            self._indentation += 1
+        self.emit(f"{temporary} = {not is_or_expression}")
+        self._indentation = indentation
+        return temporary, True
+
+
+class TranspilingInterpreter:
+    """
+    Executes the program translated to Python source by PythonTranspiler.
+    """
+    def __init__(self, program: Program, recursion_limit=1000, input_output=None, transpiled=None):
+        """
+        :param transpiled: code object and transpiler given by transpile, transpiled when executing if not given
+        """
+        self.program = program
+        self.recursion_limit = recursion_limit
+        self.input_output = input_output
+        self.transpiled = transpiled
+        if recursion_limit <= 0:
+            raise MisnomerInterpreterExceededMaximumDepthException(recursion_limit)
+
+    @staticmethod
+    def transpile(program: Program):
+        """
+        :return: code object of the transpiled source and the transpiler giving globals to execute it with
+        """
+        transpiler = PythonTranspiler(program)
+        return compile(transpiler.transpile(), "<misnomer>", "exec"), transpiler
+
+    @classmethod
+    def compile(cls, program: Program):
+        """
+        Transpiles the program once for many executions.
+
+        :return: function executing the program with given recursion limit and input and output
+        """
+        transpiled = cls.transpile(program)
+        return lambda recursion_limit, input_output=None: \
+            cls(program, recursion_limit, input_output, transpiled).execute()
+
+    def execute(self):
+        code, transpiler = self.transpiled or self.transpile(self.program)
+        namespace = transpiler.get_namespace(get_builtin_functions(self.input_output), self.recursion_limit)
+        exec(code, namespace)
+        try:
+            exit_code = namespace[ENTRY_FUNCTION_NAME](self.recursion_limit)
+        finally:
+            if self.input_output:
+                self.input_output.flush()
+        if exit_code is not None:
+            return exit_code
+        return 0
@@ -1,5 +1,6 @@
 from utils.exceptions.exceptions import (
     MisnomerException,
     MisnomerExecutiveNotFoundError,
-    MisnomerEncodingError
+    MisnomerEncodingError,
+    MisnomerChunkSizeError
 )
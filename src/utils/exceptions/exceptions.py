@@ -17,3 +17,9 @@ class MisnomerEncodingError(MisnomerException, ValueError):
     def __init__(self, message):
         self.message = f"You should use UTF-8 encoded text file as a source od the code.\nDetails: {message}"
         super(MisnomerEncodingError, self).__init__(self.message)
+
+
+class MisnomerChunkSizeError(MisnomerException, ValueError):
+    def __init__(self, chunk_size: int):
+        self.message = f"Chunk size has to be positive or -1 to read the whole source, got {chunk_size}."
+        super(MisnomerChunkSizeError, self).__init__(self.message)
@@ -1,4 +1,9 @@
+from bisect import bisect_right
+
+
 class Position:
+    __slots__ = ("line", "column", "character")
+
     def __init__(self, line=1, column=1, character=1):
         self.line = line
         self.column = column
@@ -12,3 +17,40 @@ class Position:
         if self.line == other.line and self.column == other.column and self.character == other.character:
             return True
         return False
+
+
+class SourcePosition(Position):
+    """
+    Position stored as a bare character offset. Line and column are resolved only when asked for,
+    by bisecting the offsets at which the source reader has seen new lines.
+    """
+    __slots__ = ("_offset", "_line_starts")
+
+    def __init__(self, offset: int, line_starts: list[int]):
+        self._offset = offset
+        self._line_starts = line_starts
+
+    @property
+    def line(self) -> int:
+        return bisect_right(self._line_starts, self._offset)
+
+    @property
+    def column(self) -> int:
+        return self._offset - self._line_starts[self.line - 1]
+
+    @property
+    def character(self) -> int:
+        return self._offset + 1
+
+    def get_offset(self) -> int:
+        return self._offset
+
+    def get_line_starts(self) -> list[int]:
+        return self._line_starts
+
+    def __copy__(self):
+        # Source positions are never modified, so they can be shared
+        return self
+
+    def __reduce__(self):
+        return SourcePosition, (self._offset, self._line_starts)
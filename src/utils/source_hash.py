@@ -0,0 +1,32 @@
+import hashlib
+
+from utils.exceptions.exceptions import MisnomerExecutiveNotFoundError
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_source_file(source_path: str) -> str:
+    """
+    Computes a digest of the file contents, used to tell whether cached results for the file are still valid.
+
+    :param source_path: Path to the file
+    :return: Hexadecimal SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(source_path, "rb") as file:
+            while chunk := file.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except FileNotFoundError:
+        raise MisnomerExecutiveNotFoundError(source_path)
+    return digest.hexdigest()
+
+
+def hash_source(source: str) -> str:
+    """
+    Computes a digest of the source code, the same as hash_source_file would for a file containing it.
+
+    :param source: Source code
+    :return: Hexadecimal SHA-256 digest of the source encoded in UTF-8
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
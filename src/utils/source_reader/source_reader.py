@@ -1,18 +1,36 @@
-from copy import copy
-from io import TextIOWrapper, BytesIO
+import codecs
+import mmap
+from io import TextIOWrapper, BytesIO, IncrementalNewlineDecoder
 from typing import IO
 
 from lexer.dictionaries import EOF
-from utils.exceptions.exceptions import MisnomerExecutiveNotFoundError, MisnomerEncodingError
-from utils.position import Position
+from utils.exceptions.exceptions import MisnomerExecutiveNotFoundError, MisnomerEncodingError, MisnomerChunkSizeError
+from utils.position import Position, SourcePosition
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def is_valid_chunk_size(chunk_size: int) -> bool:
+    """
+    Chunk size 0 would read nothing, so only positive sizes and -1, which reads the whole source, are valid.
+    """
+    return chunk_size > 0 or chunk_size == -1
 
 
 class SourceReader:
     _END_OF_LINE = "\n"
 
-    def __init__(self, source):
+    def __init__(self, source, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if not is_valid_chunk_size(chunk_size):
+            source.close()
+            raise MisnomerChunkSizeError(chunk_size)
         self._source = source
-        self._position = Position()
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._buffer_index = 0
+        self._buffer_offset = 0
+        self._offset = 0
+        self._line_starts = [-1]
 
     def __enter__(self):
         return self
@@ -20,57 +38,94 @@ class SourceReader:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._source.close()
 
-    def update_position(self, character: str):
+    def _register_line_starts(self):
         """
-        Updates position depending on character kind.
+        Records offsets of all new line characters in the current buffer, so that positions can be resolved later.
+        A new line at the very first character is not counted, since the reader never moves onto it.
+        """
+        index = self._buffer.find(SourceReader._END_OF_LINE)
+        while index != -1:
+            if offset := self._buffer_offset + index:
+                self._line_starts.append(offset)
+            index = self._buffer.find(SourceReader._END_OF_LINE, index + 1)
 
-        :param character: Determines what component of position should be updated
+    def _load_chunk(self) -> bool:
         """
-        if character == SourceReader._END_OF_LINE:
-            self._position.line += 1
-            self._position.column = 0
-        else:
-            self._position.column += 1
+        Replaces the buffer with the next chunk of the source. Chunk size -1 loads the whole source at once.
 
-        self._position.character += 1
+        :return: False if the source is exhausted, True otherwise
+        """
+        self._buffer_offset += len(self._buffer)
+        self._buffer = self._source.read(self._chunk_size)
+        self._buffer_index = 0
+        self._register_line_starts()
+        return bool(self._buffer)
 
-    def get_first_character(self) -> str:
+    def _read_character(self) -> str:
         """
-        Obtains one character from source without updating position (since default is correct).
+        Hands out the next character from the buffer, loading a new chunk when the current one is used up.
 
         :return: string
         """
-        character = self._source.read(1)
-        if not character:
-            character = EOF
+        if self._buffer_index >= len(self._buffer) and not self._load_chunk():
+            return EOF
+        character = self._buffer[self._buffer_index]
+        self._buffer_index += 1
         return character
 
+    def get_first_character(self) -> str:
+        """
+        Obtains one character from source without moving the position (since default is correct).
+
+        :return: string
+        """
+        return self._read_character()
+
     def get_next_character(self) -> str:
         """
         Obtains one character from source.
 
         :return: string
         """
-        character = self._source.read(1)
-        if not character:
-            character = EOF
-        self.update_position(character)
-        return character
+        self._offset += 1
+        return self._read_character()
+
+    def read_remaining(self) -> str:
+        """
+        Loads the rest of the source at once and marks it as read. Used by lexers scanning the whole text.
+
+        :return: All characters that have not been handed out yet
+        """
+        remaining = self._buffer[self._buffer_index:]
+        self._buffer_offset += len(self._buffer)
+        self._buffer = self._source.read()
+        self._buffer_index = len(self._buffer)
+        self._register_line_starts()
+        return remaining + self._buffer
 
     def get_position(self) -> Position:
         """
-        Returns a copy of position reader is currently at.
+        Returns position reader is currently at. Line and column are only computed when accessed.
 
-        :return: Copy of reader position
+        :return: Reader position
         """
-        return copy(self._position)
+        return SourcePosition(self._offset, self._line_starts)
+
+    def get_position_at(self, offset: int) -> Position:
+        """
+        Returns position of the character at given offset of the source.
+
+        :param offset: Number of characters preceding the character in the source
+        :return: Position at given offset
+        """
+        return SourcePosition(offset, self._line_starts)
 
 
 class FileSourceReader(SourceReader):
-    def __init__(self, source_path: str):
+    def __init__(self, source_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self._source_path: str = source_path
         source = self._load_source()
-        super().__init__(source)
+        super().__init__(source, chunk_size)
 
     def _load_source(self) -> IO:
         """
@@ -87,8 +142,61 @@ class FileSourceReader(SourceReader):
             raise MisnomerEncodingError(error)
 
 
+class MemoryMappedSource:
+    """
+    Read-only text stream over a memory-mapped UTF-8 file. Bytes are decoded lazily, one requested chunk at a time,
+    so only the pages around the current chunk have to be resident. Line endings are translated like in text mode.
+    """
+    def __init__(self, source_path: str):
+        self._file = open(source_path, "rb")
+        try:
+            self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                self._mapped.madvise(mmap.MADV_SEQUENTIAL)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._mapped = b""
+        self._decoder = IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+        self._offset = 0
+
+    def read(self, size: int = -1) -> str:
+        """
+        Decodes the next size bytes of the mapped file (all remaining bytes if size is negative).
+
+        :return: Decoded text, empty string at the end of the file
+        """
+        length = len(self._mapped)
+        while True:
+            end = length if size < 0 else min(self._offset + size, length)
+            try:
+                text = self._decoder.decode(self._mapped[self._offset:end], final=end == length)
+            except UnicodeDecodeError as error:
+                raise MisnomerEncodingError(error)
+            self._offset = end
+            if text or end == length:
+                return text
+
+    def close(self):
+        if isinstance(self._mapped, mmap.mmap):
+            self._mapped.close()
+        self._file.close()
+
+
+class MemoryMappedFileSourceReader(FileSourceReader):
+    def _load_source(self) -> MemoryMappedSource:
+        """
+        Maps the file at given source_path into memory instead of reading it through a text stream.
+
+        :return: MemoryMappedSource over the file at given source_path
+        """
+        try:
+            return MemoryMappedSource(self._source_path)
+        except FileNotFoundError:
+            raise MisnomerExecutiveNotFoundError(self._source_path)
+
+
 class StringSourceReader(SourceReader):
-    def __init__(self, code):
+    def __init__(self, code, chunk_size: int = DEFAULT_CHUNK_SIZE):
         input_bytes = BytesIO(code.encode('utf-8'))
         source = TextIOWrapper(input_bytes, encoding='utf-8')
-        super().__init__(source)
+        super().__init__(source, chunk_size)
@@ -0,0 +1,395 @@
+import operator
+from contextlib import contextmanager
+
+from interpreter.builtin_functions import builtin_functions
+from interpreter.dictionaries import misnomer_types_to_python_types
+from interpreter.interpreter_exceptions import MisnomerInterpreterVariableAlreadyExistsException, \
+    MisnomerInterpreterNoMainFunctionException, MisnomerInterpreterBadOperandTypeException, \
+    MisnomerInterpreterCouldNotNegateExpressionException, MisnomerInterpreterFunctionDoesNotExistException, \
+    MisnomerInterpreterArgumentsNumberDoesNotMatchException
+from parser.syntax_tree.expressions import OrExpression, AndExpression, NotExpression, AdditiveInvertedExpression, \
+    MultiplicativeInvertedExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression, \
+    EqualExpression, NotEqualExpression, LessExpression, LessEqualExpression, GreaterExpression, \
+    GreaterEqualExpression
+from parser.syntax_tree.literals import Literal, NumericLiteral
+from parser.syntax_tree.statements import StatementBlock, FunctionDefinition, FunctionCall, Identifier, Condition, \
+    IfStatement, WhileStatement, ReturnStatement, VariableInitialisationStatement, AssignmentStatement
+from parser.syntax_tree.syntax_tree import Program
+from vm.opcodes import LOAD_CONST, LOAD_LOCAL, CHECK_NEW_LOCAL, STORE_NEW_LOCAL, CHECK_LOCAL, STORE_LOCAL, \
+    BINARY_OPERATION, BINARY_OPERATION_CONST, LOCAL_OPERATION_CONST, NEGATE, INVERT, NOT, JUMP, POP_JUMP_IF_FALSE, \
+    POP_JUMP_IF_TRUE, JUMP_IF_NOT_NONE, CALL, CALL_BUILTIN, SET_RETURN_FLAG, RETURN_IF_SET, RETURN_IF_NOT_NONE, \
+    RETURN, RAISE, TAIL_CALL
+
+COMPARISON_OPERATORS = {
+    EqualExpression: operator.eq,
+    NotEqualExpression: operator.ne,
+    LessExpression: operator.lt,
+    LessEqualExpression: operator.le,
+    GreaterExpression: operator.gt,
+    GreaterEqualExpression: operator.ge
+}
+
+
+class CompiledFunction:
+    """
+    Bytecode of one function. Exception handlers are (start, end, exception class, exception factory) tuples,
+    innermost first. They reproduce try/except blocks of the syntax tree nodes.
+    """
+    def __init__(self, definition: FunctionDefinition):
+        self.definition = definition
+        self.name = definition.name
+        self.code: list[tuple] = []
+        self.handlers: list[tuple] = []
+        self.local_count = 0
+        self.parameter_checks = [
+            (misnomer_types_to_python_types[parameter.argument_type], parameter)
+            for parameter in definition.parameters.values()
+        ]
+        self.return_types = misnomer_types_to_python_types[definition.return_type]
+
+
+class CompiledProgram:
+    def __init__(self, functions: dict[str, CompiledFunction], main: CompiledFunction):
+        self.functions = functions
+        self.main = main
+
+
+class Compiler:
+    """
+    Translates a syntax tree into bytecode of the virtual machine, preserving the semantics of the tree
+    interpreter, including its exceptions and the order in which they are raised.
+
+    With tail_calls, returning the result of a call of a user function reuses the frame of the caller, whenever
+    checking the type of the returned value again would be redundant.
+    """
+    def __init__(self, program: Program, tail_calls: bool = False):
+        self._program = program
+        self._tail_calls = tail_calls
+        self._functions: dict[str, CompiledFunction] = {}
+        self._function: CompiledFunction or None = None
+        self._slots: dict[str, int] = {}
+        self._return_jumps: list[int] = []
+        self._jump_targets: set[int] = set()
+        # Variables certainly initialised at the current instruction
+        self._declared: set[str] = set()
+
+    def compile_program(self) -> CompiledProgram:
+        for function_name, function_definition in self._program.function_definitions.items():
+            if function_name in builtin_functions:
+                raise MisnomerInterpreterVariableAlreadyExistsException(function_name, function_definition.position)
+            self._functions[function_name] = CompiledFunction(function_definition)
+
+        if not (main := self._functions.get("main")):
+            raise MisnomerInterpreterNoMainFunctionException(self._program.position)
+
+        for function in self._functions.values():
+            self.compile_function(function)
+        return CompiledProgram(self._functions, main)
+
+    def compile_function(self, function: CompiledFunction):
+        self._function = function
+        self._slots = {}
+        self._return_jumps = []
+        self._jump_targets = set()
+        self._declared = set(function.definition.parameters)
+        for parameter_name in function.definition.parameters:
+            self.get_slot(parameter_name)
+
+        self.compile_statement(function.definition.statement_block)
+        self.emit(LOAD_CONST, None)
+        return_index = self.emit(RETURN)
+        for jump in self._return_jumps:
+            self.patch_jump(jump, return_index)
+        function.local_count = len(self._slots)
+
+    def get_slot(self, name: str) -> int:
+        if (slot := self._slots.get(name)) is None:
+            slot = self._slots[name] = len(self._slots)
+        return slot
+
+    def emit(self, opcode: int, argument=None) -> int:
+        code = self._function.code
+        if opcode == BINARY_OPERATION and code and code[-1][0] == LOAD_CONST and self.can_merge_with_previous():
+            _, constant = code.pop()
+            opcode, argument = BINARY_OPERATION_CONST, (argument, constant)
+        if opcode == BINARY_OPERATION_CONST and code and code[-1][0] == LOAD_LOCAL and self.can_merge_with_previous():
+            _, local_argument = code.pop()
+            opcode, argument = LOCAL_OPERATION_CONST, local_argument + argument
+        code.append((opcode, argument))
+        return len(code) - 1
+
+    def can_merge_with_previous(self) -> bool:
+        """
+        Checks whether the next instruction may be merged into the last one: nothing jumps between them and
+        they are protected by the same exception handlers.
+        """
+        index = self.get_next_index()
+        if index in self._jump_targets:
+            return False
+        return all(end != index for _, end, _, _ in self._function.handlers)
+
+    def get_next_index(self) -> int:
+        return len(self._function.code)
+
+    def patch_jump(self, index: int, target: int = None):
+        if target is None:
+            target = self.get_next_index()
+        opcode, _ = self._function.code[index]
+        self._function.code[index] = (opcode, target)
+        self._jump_targets.add(target)
+
+    @contextmanager
+    def protected(self, exception_class: type, exception_factory):
+        """
+        Instructions emitted within the block raise the exception made by exception_factory instead of
+        exception_class, also when exception_class comes from a function called within the block.
+        """
+        start = self.get_next_index()
+        yield
+        self._function.handlers.append((start, self.get_next_index(), exception_class, exception_factory))
+
+    @contextmanager
+    def conditional(self):
+        """
+        Variables initialised within the block are not certainly initialised after it, as it may be skipped.
+        """
+        declared = self._declared
+        self._declared = set(declared)
+        yield
+        self._declared = declared
+
+    # Statements
+
+    def compile_statement(self, statement) -> bool:
+        """
+        Emits the statement. Statements evaluate to a value which decides whether enclosing blocks and loops
+        are left, just like results of execute methods do.
+
+        :return: True if the value has been pushed, False if it is always None and nothing has been pushed
+        """
+        if isinstance(statement, StatementBlock):
+            return self.compile_statement_block(statement)
+        elif isinstance(statement, IfStatement):
+            return self.compile_if_statement(statement)
+        elif isinstance(statement, WhileStatement):
+            return self.compile_while_statement(statement)
+        elif isinstance(statement, ReturnStatement):
+            return self.compile_return_statement(statement)
+        elif isinstance(statement, VariableInitialisationStatement):
+            return self.compile_variable_initialisation(statement)
+        elif isinstance(statement, AssignmentStatement):
+            return self.compile_assignment(statement)
+        self.compile_expression(statement)
+        return True
+
+    @classmethod
+    def produces_value(cls, statement) -> bool:
+        if isinstance(statement, IfStatement):
+            return cls.produces_value(statement.instructions) or \
+                bool(statement.else_statement) and cls.produces_value(statement.else_statement)
+        elif isinstance(statement, WhileStatement):
+            return cls.produces_value(statement.instructions)
+        elif isinstance(statement, ReturnStatement):
+            return statement.value is not None
+        return not isinstance(statement, (StatementBlock, VariableInitialisationStatement, AssignmentStatement))
+
+    def compile_statement_block(self, block: StatementBlock) -> bool:
+        for statement in block.statements:
+            if self._tail_calls and self.is_tail_call(statement):
+                self.compile_tail_call(statement)
+            elif self.compile_statement(statement):
+                # Return statements have just set the flag
+                opcode = RETURN_IF_NOT_NONE if isinstance(statement, ReturnStatement) else RETURN_IF_SET
+                self._return_jumps.append(self.emit(opcode))
+        # Blocks are left with a value only by returning from the function
+        return False
+
+    def is_tail_call(self, statement) -> bool:
+        """
+        Checks whether the statement returns the result of a user function, which is certainly not None and passes
+        the return type check of the current function.
+        """
+        if not (isinstance(statement, ReturnStatement) and isinstance(statement.value, FunctionCall)):
+            return False
+        call = statement.value
+        if not (function := self._functions.get(call.identifier)):
+            return False
+        return len(call.arguments) == len(function.parameter_checks) and type(None) not in function.return_types \
+            and set(function.return_types) <= set(self._function.return_types)
+
+    def compile_tail_call(self, statement: ReturnStatement):
+        call = statement.value
+        self.emit(SET_RETURN_FLAG)
+        for argument in call.arguments:
+            self.compile_expression(argument)
+        self.emit(TAIL_CALL, (self._functions[call.identifier], len(call.arguments)))
+
+    def compile_if_statement(self, statement: IfStatement) -> bool:
+        produces_value = self.produces_value(statement)
+        self.compile_expression(statement.condition)
+        else_jump = self.emit(POP_JUMP_IF_FALSE)
+        self.compile_branch(statement.instructions, produces_value)
+        if not (statement.else_statement or produces_value):
+            self.patch_jump(else_jump)
+            return False
+
+        end_jump = self.emit(JUMP)
+        self.patch_jump(else_jump)
+        if statement.else_statement:
+            self.compile_branch(statement.else_statement, produces_value)
+        else:
+            self.emit(LOAD_CONST, None)
+        self.patch_jump(end_jump)
+        return produces_value
+
+    def compile_branch(self, statement, produces_value: bool):
+        # A branch always evaluating to None pushes it if the other one may evaluate to a value
+        with self.conditional():
+            if not self.compile_statement(statement) and produces_value:
+                self.emit(LOAD_CONST, None)
+
+    def compile_while_statement(self, statement: WhileStatement) -> bool:
+        loop_start = self.get_next_index()
+        self._jump_targets.add(loop_start)
+        self.compile_expression(statement.condition)
+        exit_jump = self.emit(POP_JUMP_IF_FALSE)
+        with self.conditional():
+            pushed = self.compile_statement(statement.instructions)
+        if pushed:
+            # The loop is left as soon as its instructions evaluate to a value
+            end_jump = self.emit(JUMP_IF_NOT_NONE)
+            self.emit(JUMP, loop_start)
+            self.patch_jump(exit_jump)
+            self.emit(LOAD_CONST, None)
+            self.patch_jump(end_jump)
+        else:
+            self.emit(JUMP, loop_start)
+            self.patch_jump(exit_jump)
+        return pushed
+
+    def compile_return_statement(self, statement: ReturnStatement) -> bool:
+        self.emit(SET_RETURN_FLAG)
+        if statement.value is None:
+            return False
+        self.compile_expression(statement.value)
+        return True
+
+    def compile_variable_initialisation(self, statement: VariableInitialisationStatement) -> bool:
+        slot = self.get_slot(statement.name)
+        allowed_types = misnomer_types_to_python_types[statement.variable_type]
+        self.emit(CHECK_NEW_LOCAL, (slot, statement))
+        self.compile_expression(statement.value)
+        self.emit(STORE_NEW_LOCAL, (slot, allowed_types, statement))
+        self._declared.add(statement.name)
+        return False
+
+    def compile_assignment(self, statement: AssignmentStatement) -> bool:
+        slot = self.get_slot(statement.name)
+        if statement.name not in self._declared:
+            self.emit(CHECK_LOCAL, (slot, statement))
+        self.compile_expression(statement.value)
+        self.emit(STORE_LOCAL, (slot, statement))
+        return False
+
+    # Expressions
+
+    def compile_expression(self, expression):
+        if isinstance(expression, Literal):
+            self.emit(LOAD_CONST, expression.value)
+        elif isinstance(expression, Identifier):
+            self.emit(LOAD_LOCAL, (self.get_slot(expression.name), expression))
+        elif isinstance(expression, FunctionCall):
+            self.compile_function_call(expression)
+        elif isinstance(expression, Condition):
+            self.compile_expression(expression.expression)
+        elif comparison_operator := COMPARISON_OPERATORS.get(type(expression)):
+            self.compile_expression(expression.left)
+            self.compile_expression(expression.right)
+            self.emit(BINARY_OPERATION, comparison_operator)
+        elif isinstance(expression, AdditiveExpression):
+            self.compile_folded_expression(expression, 0, operator.add,
+                                           lambda: MisnomerInterpreterBadOperandTypeException(
+                                               "+", expression.expressions[0], expression.position))
+        elif isinstance(expression, MultiplicativeExpression):
+            # Raises AttributeError instead, just like MultiplicativeExpression does
+            self.compile_folded_expression(expression, 1, operator.mul,
+                                           lambda: MisnomerInterpreterBadOperandTypeException(
+                                               "*", expression.expressions, expression.expressions.position))
+        elif isinstance(expression, AdditiveInvertedExpression):
+            if isinstance(expression.expressions, NumericLiteral):
+                self.emit(LOAD_CONST, -expression.expressions.value)
+                return
+            with self.protected(TypeError, lambda: MisnomerInterpreterBadOperandTypeException(
+                    "-", expression.expressions, expression.expressions.position)):
+                self.compile_expression(expression.expressions)
+                self.emit(NEGATE)
+        elif isinstance(expression, MultiplicativeInvertedExpression):
+            if isinstance(expression.expressions, NumericLiteral) and expression.expressions.value:
+                self.emit(LOAD_CONST, 1.0 / expression.expressions.value)
+                return
+            with self.protected(TypeError, lambda: MisnomerInterpreterBadOperandTypeException(
+                    "/", expression.expressions, expression.expressions.position)):
+                self.compile_expression(expression.expressions)
+                self.emit(INVERT, expression)
+        elif isinstance(expression, NotExpression):
+            with self.protected(ValueError, lambda: MisnomerInterpreterCouldNotNegateExpressionException(
+                    expression.expressions, expression.expressions.position)):
+                self.compile_expression(expression.expressions)
+                self.emit(NOT)
+        elif isinstance(expression, OrExpression):
+            self.compile_logic_expression(expression, POP_JUMP_IF_TRUE, True)
+        elif isinstance(expression, AndExpression):
+            self.compile_logic_expression(expression, POP_JUMP_IF_FALSE, False)
+        elif isinstance(expression, UnaryExpression):
+            self.compile_expression(expression.expressions)
+        else:
+            raise TypeError(f"Cannot compile {expression.__class__.__name__}.")
+
+    def compile_folded_expression(self, expression, initial_value, operation, exception_factory):
+        """
+        Emits initial_value combined with every sub expression in turn. Applying the operation to the first value
+        and initial_value in reversed order gives the same result, so it can take the constant operand.
+        """
+        first_expression, *other_expressions = expression.expressions
+        with self.protected(TypeError, exception_factory):
+            if isinstance(first_expression, NumericLiteral):
+                self.emit(LOAD_CONST, operation(initial_value, first_expression.value))
+            else:
+                self.compile_expression(first_expression)
+                self.emit(LOAD_CONST, initial_value)
+                self.emit(BINARY_OPERATION, operation)
+            for sub_expression in other_expressions:
+                self.compile_expression(sub_expression)
+                self.emit(BINARY_OPERATION, operation)
+
+    def compile_logic_expression(self, expression, jump_opcode: int, short_circuit_value: bool):
+        short_circuit_jumps = []
+        for sub_expression in expression.expressions:
+            self.compile_expression(sub_expression)
+            short_circuit_jumps.append(self.emit(jump_opcode))
+        self.emit(LOAD_CONST, not short_circuit_value)
+        end_jump = self.emit(JUMP)
+        for jump in short_circuit_jumps:
+            self.patch_jump(jump)
+        self.emit(LOAD_CONST, short_circuit_value)
+        self.patch_jump(end_jump)
+
+    def compile_function_call(self, call: FunctionCall):
+        if function := self._functions.get(call.identifier):
+            for argument in call.arguments:
+                self.compile_expression(argument)
+            expected_arguments_number = len(function.parameter_checks)
+            if len(call.arguments) == expected_arguments_number:
+                self.emit(CALL, (function, len(call.arguments)))
+            else:
+                definition = function.definition
+                self.emit(RAISE, lambda: MisnomerInterpreterArgumentsNumberDoesNotMatchException(
+                    expected_arguments_number, len(call.arguments), definition.name, definition.position))
+        elif call.identifier in builtin_functions:
+            for argument in call.arguments:
+                self.compile_expression(argument)
+            # Builtins are looked up when running, as every execution prints and reads through its own ones
+            self.emit(CALL_BUILTIN, (call.identifier, len(call.arguments), call))
+        else:
+            # Reported when compiling, just like Program links function calls before executing
+            raise MisnomerInterpreterFunctionDoesNotExistException(call.identifier, call.position)
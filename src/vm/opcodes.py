@@ -0,0 +1,35 @@
+# Instructions of the Misnomer virtual machine. Every instruction is a pair (opcode, argument).
+
+# Values
+LOAD_CONST = 0                  # push argument
+LOAD_LOCAL = 1                  # push local variable (slot, identifier)
+CHECK_NEW_LOCAL = 2             # fail if local variable already exists (slot, initialisation)
+STORE_NEW_LOCAL = 3             # pop, check declared type, store (slot, allowed types, initialisation)
+CHECK_LOCAL = 4                 # fail if local variable does not exist (slot, assignment)
+STORE_LOCAL = 5                 # pop, check it has the type of current value, store (slot, assignment)
+
+# Operators
+BINARY_OPERATION = 10           # pop right operand, apply to it and left one (operator function)
+BINARY_OPERATION_CONST = 11     # apply to value and constant right operand (operator function, constant)
+LOCAL_OPERATION_CONST = 12      # LOAD_LOCAL followed by BINARY_OPERATION_CONST (slot, identifier, function, constant)
+NEGATE = 13
+INVERT = 14                     # 1.0 / value, fails on zero (expression)
+NOT = 15
+
+# Control flow
+JUMP = 30
+POP_JUMP_IF_FALSE = 31
+POP_JUMP_IF_TRUE = 32
+JUMP_IF_NOT_NONE = 33           # jump keeping the value if it is not None, otherwise pop it
+
+# Functions
+CALL = 40                       # call user function (compiled function, arguments number)
+CALL_BUILTIN = 41               # call builtin function (function, arguments number, call)
+SET_RETURN_FLAG = 42
+RETURN_IF_SET = 43              # jump to return if value is not None and return flag is set, otherwise pop it
+RETURN_IF_NOT_NONE = 44         # jump to return if value is not None, otherwise pop it
+RETURN = 45                     # pop and return
+RAISE = 46                      # raise exception made by argument
+TAIL_CALL = 47                  # return the result of user function, reusing the frame (compiled function, arguments number)
+
+OPCODE_NAMES = {value: name for name, value in list(globals().items()) if name.isupper() and isinstance(value, int)}
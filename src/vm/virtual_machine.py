@@ -0,0 +1,296 @@
+import math
+
+from interpreter.builtin_functions import get_builtin_functions
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException, \
+    MisnomerInterpreterVariableAlreadyExistsException, MisnomerInterpreterVariableDoesNotExistException, \
+    MisnomerInterpreterVariableAssignmentTypeException, MisnomerInterpreterZeroDivisionException, \
+    MisnomerInterpreterFunctionCallParameterTypeException, MisnomerInterpreterFunctionReturnTypeException, \
+    MisnomerInterpreterCastingBuiltinException, MisnomerInterpreterCastingException
+from parser.syntax_tree.syntax_tree import Program
+from vm.compiler import Compiler, CompiledFunction, CompiledProgram
+from vm.opcodes import LOAD_CONST, LOAD_LOCAL, CHECK_NEW_LOCAL, STORE_NEW_LOCAL, CHECK_LOCAL, STORE_LOCAL, \
+    BINARY_OPERATION, BINARY_OPERATION_CONST, LOCAL_OPERATION_CONST, NEGATE, INVERT, NOT, JUMP, POP_JUMP_IF_FALSE, \
+    POP_JUMP_IF_TRUE, JUMP_IF_NOT_NONE, CALL, CALL_BUILTIN, SET_RETURN_FLAG, RETURN_IF_SET, RETURN_IF_NOT_NONE, \
+    RETURN, RAISE, TAIL_CALL
+
+
+class Frame:
+    """
+    Variables of a function call. Values of variables are never None, so None marks variables not initialised yet.
+    """
+    __slots__ = ("function", "locals", "stack", "pc", "available_calls", "return_flag")
+
+    def __init__(self, function: CompiledFunction, local_variables: list, available_calls: int):
+        self.function = function
+        self.locals = local_variables
+        self.stack = []
+        self.pc = 0
+        self.available_calls = available_calls
+        self.return_flag = False
+
+
+class VirtualMachine:
+    """
+    Executes the program compiled to bytecode. Gives the same results and raises the same exceptions as Interpreter,
+    but keeps calls on its own frame stack instead of the Python one.
+    """
+    tail_calls = False
+
+    def __init__(self, program: Program, recursion_limit=1000, input_output=None,
+                 compiled_program: CompiledProgram or None = None):
+        """
+        :param compiled_program: bytecode of the program, compiled when executing if not given
+        """
+        self.program = program
+        self.recursion_limit = recursion_limit
+        self.input_output = input_output
+        self.compiled_program = compiled_program
+        self.builtin_functions = get_builtin_functions(input_output)
+        if recursion_limit <= 0:
+            raise MisnomerInterpreterExceededMaximumDepthException(recursion_limit)
+
+    @classmethod
+    def compile(cls, program: Program):
+        """
+        Compiles the program once for many executions.
+
+        :return: function executing the program with given recursion limit and input and output
+        """
+        compiled_program = Compiler(program, cls.tail_calls).compile_program()
+        return lambda recursion_limit, input_output=None: \
+            cls(program, recursion_limit, input_output, compiled_program).execute()
+
+    def execute(self):
+        compiled_program = self.compiled_program or Compiler(self.program, self.tail_calls).compile_program()
+        main = compiled_program.main
+        try:
+            exit_code = self.run(Frame(main, [None] * main.local_count, self.recursion_limit))
+        finally:
+            if self.input_output:
+                self.input_output.flush()
+        if exit_code is not None:
+            return exit_code
+        return 0
+
+    @staticmethod
+    def find_exception_factory(frames: list[Frame], exception: Exception):
+        """
+        Looks for the innermost handler of the instruction which raised the exception, then of the calls leading to it.
+        """
+        for frame in reversed(frames):
+            index = frame.pc - 1
+            for start, end, exception_class, exception_factory in frame.function.handlers:
+                if start <= index < end and isinstance(exception, exception_class):
+                    return exception_factory
+        return None
+
+    def run(self, frame: Frame):
+        frames = [frame]
+        function = frame.function
+        code = function.code
+        local_variables = frame.locals
+        stack = frame.stack
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        return_flag = False
+        builtin_functions = self.builtin_functions
+
+        try:
+            while True:
+                opcode, argument = code[pc]
+                pc += 1
+
+                if opcode == LOCAL_OPERATION_CONST:
+                    slot, identifier, operation, constant = argument
+                    value = local_variables[slot]
+                    if value is None:
+                        raise MisnomerInterpreterVariableDoesNotExistException(identifier.name, identifier.position)
+                    push(operation(value, constant))
+                elif opcode == LOAD_LOCAL:
+                    value = local_variables[argument[0]]
+                    if value is None:
+                        identifier = argument[1]
+                        raise MisnomerInterpreterVariableDoesNotExistException(identifier.name, identifier.position)
+                    push(value)
+                elif opcode == BINARY_OPERATION_CONST:
+                    stack[-1] = argument[0](stack[-1], argument[1])
+                elif opcode == LOAD_CONST:
+                    push(argument)
+                elif opcode == BINARY_OPERATION:
+                    value = pop()
+                    stack[-1] = argument(stack[-1], value)
+                elif opcode == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = argument
+                elif opcode == STORE_LOCAL:
+                    slot, statement = argument
+                    value = pop()
+                    variable_type = type(local_variables[slot])
+                    if type(value) != variable_type:
+                        raise MisnomerInterpreterVariableAssignmentTypeException(type(value), variable_type,
+                                                                                 statement.name, statement.position)
+                    local_variables[slot] = value
+                elif opcode == JUMP:
+                    pc = argument
+                elif opcode == CALL:
+                    called_function, arguments_number = argument
+                    if arguments_number:
+                        arguments = stack[-arguments_number:]
+                        del stack[-arguments_number:]
+                    else:
+                        arguments = []
+
+                    if (available_calls := frame.available_calls - 1) <= 0:
+                        raise MisnomerInterpreterExceededMaximumDepthException(self.recursion_limit)
+                    for (allowed_types, parameter), value in zip(called_function.parameter_checks, arguments):
+                        if type(value) not in allowed_types:
+                            raise MisnomerInterpreterFunctionCallParameterTypeException(
+                                type(value), parameter.argument_type.name, parameter.name,
+                                called_function.definition.position)
+
+                    frame.pc = pc
+                    frame.return_flag = return_flag
+                    arguments.extend([None] * (called_function.local_count - arguments_number))
+                    frame = Frame(called_function, arguments, available_calls)
+                    frames.append(frame)
+                    function = called_function
+                    code = function.code
+                    local_variables = frame.locals
+                    stack = frame.stack
+                    push = stack.append
+                    pop = stack.pop
+                    pc = 0
+                    return_flag = False
+                elif opcode == TAIL_CALL:
+                    called_function, arguments_number = argument
+                    if arguments_number:
+                        arguments = stack[-arguments_number:]
+                        del stack[-arguments_number:]
+                    else:
+                        arguments = []
+
+                    for (allowed_types, parameter), value in zip(called_function.parameter_checks, arguments):
+                        if type(value) not in allowed_types:
+                            raise MisnomerInterpreterFunctionCallParameterTypeException(
+                                type(value), parameter.argument_type.name, parameter.name,
+                                called_function.definition.position)
+
+                    arguments.extend([None] * (called_function.local_count - arguments_number))
+                    if len(frames) == 1:
+                        # Main function does not check the returned value, so its frame can not be taken over
+                        # by the called function. Its result is returned by the final instruction of main.
+                        if (available_calls := frame.available_calls - 1) <= 0:
+                            raise MisnomerInterpreterExceededMaximumDepthException(self.recursion_limit)
+                        frame.pc = len(code) - 1
+                        frame = Frame(called_function, arguments, available_calls)
+                        frames.append(frame)
+                    else:
+                        frame.function = called_function
+                        frame.locals = arguments
+                        frame.stack = []
+                    function = called_function
+                    code = function.code
+                    local_variables = frame.locals
+                    stack = frame.stack
+                    push = stack.append
+                    pop = stack.pop
+                    pc = 0
+                    return_flag = False
+                elif opcode == RETURN_IF_SET:
+                    if stack[-1] is not None and return_flag:
+                        pc = argument
+                    else:
+                        pop()
+                elif opcode == RETURN:
+                    value = pop()
+                    frames.pop()
+                    if not frames:
+                        # Main function is executed like a statement block, without checking the returned value
+                        return value
+                    if type(value) not in function.return_types:
+                        definition = function.definition
+                        raise MisnomerInterpreterFunctionReturnTypeException(type(value), definition.return_type.name,
+                                                                             definition.name, definition.position)
+
+                    frame = frames[-1]
+                    function = frame.function
+                    code = function.code
+                    local_variables = frame.locals
+                    stack = frame.stack
+                    push = stack.append
+                    pop = stack.pop
+                    pc = frame.pc
+                    return_flag = frame.return_flag
+                    push(value)
+                elif opcode == RETURN_IF_NOT_NONE:
+                    if stack[-1] is not None:
+                        pc = argument
+                    else:
+                        pop()
+                elif opcode == SET_RETURN_FLAG:
+                    return_flag = True
+                elif opcode == CALL_BUILTIN:
+                    identifier, arguments_number, call = argument
+                    if arguments_number:
+                        arguments = stack[-arguments_number:]
+                        del stack[-arguments_number:]
+                    else:
+                        arguments = ()
+                    try:
+                        push(builtin_functions[identifier](*arguments))
+                    except MisnomerInterpreterCastingBuiltinException as e:
+                        raise MisnomerInterpreterCastingException(e.cast_type, e.expression, call.position)
+                elif opcode == CHECK_LOCAL:
+                    if local_variables[argument[0]] is None:
+                        statement = argument[1]
+                        raise MisnomerInterpreterVariableDoesNotExistException(statement.name, statement.position)
+                elif opcode == CHECK_NEW_LOCAL:
+                    if local_variables[argument[0]] is not None:
+                        statement = argument[1]
+                        raise MisnomerInterpreterVariableAlreadyExistsException(statement.name, statement.position)
+                elif opcode == STORE_NEW_LOCAL:
+                    slot, allowed_types, statement = argument
+                    value = pop()
+                    if type(value) not in allowed_types:
+                        raise MisnomerInterpreterVariableAssignmentTypeException(type(value),
+                                                                                 statement.variable_type.name,
+                                                                                 statement.name, statement.position)
+                    local_variables[slot] = value
+                elif opcode == POP_JUMP_IF_TRUE:
+                    if pop():
+                        pc = argument
+                elif opcode == JUMP_IF_NOT_NONE:
+                    if stack[-1] is not None:
+                        pc = argument
+                    else:
+                        pop()
+                elif opcode == NEGATE:
+                    stack[-1] = -stack[-1]
+                elif opcode == INVERT:
+                    if value := stack[-1]:
+                        stack[-1] = 1.0 / value
+                    else:
+                        raise MisnomerInterpreterZeroDivisionException(argument.position)
+                elif opcode == NOT:
+                    stack[-1] = not stack[-1]
+                elif opcode == RAISE:
+                    raise argument()
+        except (TypeError, ValueError) as exception:
+            frame.pc = pc
+            if exception_factory := self.find_exception_factory(frames, exception):
+                raise exception_factory()
+            raise
+
+
+class StackMachine(VirtualMachine):
+    """
+    Virtual machine limiting the depth of recursion only by the available memory, as its frames are kept on the heap.
+    Returning the result of a call reuses the frame of the caller, so tail recursive functions run in constant space.
+    """
+    tail_calls = True
+
+    def __init__(self, program: Program, recursion_limit=1000, input_output=None,
+                 compiled_program: CompiledProgram or None = None):
+        super(StackMachine, self).__init__(program, recursion_limit, input_output, compiled_program)
+        self.recursion_limit = math.inf
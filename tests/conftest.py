@@ -0,0 +1,61 @@
+import pytest
+
+import test_interpreter
+from interpreter.closure_compiler import ClosureInterpreter
+from interpreter.interpreter import Interpreter
+from optimizer.common_subexpressions import CommonSubexpressionEliminator
+from optimizer.constant_folder import ConstantFolder
+from optimizer.dead_code import DeadCodeEliminator
+from optimizer.loop_invariants import LoopInvariantMover
+from transpiler.python_transpiler import TranspilingInterpreter
+from vm.virtual_machine import VirtualMachine
+
+
+def transformed(engine_class, transformation):
+    """
+    :return: engine factory which transforms the program before handing it to given engine
+    """
+    def create_engine(program, *args, **kwargs):
+        return engine_class(transformation(program), *args, **kwargs)
+    return create_engine
+
+
+def fold_constants(program):
+    return ConstantFolder(program).fold()
+
+
+def eliminate_common_subexpressions(program):
+    return CommonSubexpressionEliminator(program).eliminate()
+
+
+def eliminate_dead_code(program):
+    return DeadCodeEliminator(ConstantFolder(program).fold()).eliminate()
+
+
+def move_loop_invariants(program):
+    return LoopInvariantMover(program).move()
+
+
+# Engines which have to give the same results and raise the same exceptions as Interpreter
+ENGINES = {
+    "tree": Interpreter,
+    "closures": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": TranspilingInterpreter,
+    "folded": transformed(Interpreter, fold_constants),
+    "folded_vm": transformed(VirtualMachine, fold_constants),
+    "cse": transformed(Interpreter, eliminate_common_subexpressions),
+    "cse_vm": transformed(VirtualMachine, eliminate_common_subexpressions),
+    "dead_code": transformed(Interpreter, eliminate_dead_code),
+    "dead_code_vm": transformed(VirtualMachine, eliminate_dead_code),
+    "licm": transformed(Interpreter, move_loop_invariants),
+    "licm_vm": transformed(VirtualMachine, move_loop_invariants),
+}
+
+
+@pytest.fixture(params=list(ENGINES))
+def engine(request, monkeypatch):
+    engine = ENGINES[request.param]
+    # Tests of the interpreter create it by its name, so they are run with every engine
+    monkeypatch.setattr(test_interpreter, "Interpreter", engine)
+    return engine
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from batch.batch_exceptions import MisnomerBatchInputVectorException, MisnomerBatchWorkersException
+from batch import batch_runner
+from batch.batch_runner import BatchRunner, JobResult, load_input_vectors, format_job_results, run_job
+from embedding.compiled_program import CompiledProgram
+from interpreter.interpreter import Interpreter
+from test_virtual_machine import parse
+from transpiler.python_transpiler import TranspilingInterpreter
+from vm.compiler import Compiler
+from vm.virtual_machine import VirtualMachine
+
+DOUBLING_CODE = """
+main() returns int {
+    var a: int = to_int(input('a: '));
+    print(a * 2);
+    return a;
+}
+"""
+
+
+class TestBatchRunner:
+    def test_results_in_input_order(self):
+        input_vectors = [[str(number)] for number in range(20)]
+        results = BatchRunner(parse(DOUBLING_CODE), Interpreter, 100, workers=2).run(input_vectors)
+        assert results == [JobResult(number, f"{number * 2}\n") for number in range(20)]
+
+    @pytest.mark.parametrize("engine", (VirtualMachine, TranspilingInterpreter))
+    def test_engines(self, engine):
+        results = BatchRunner(parse(DOUBLING_CODE), engine, 100, workers=2).run([["3"], ["-1"]])
+        assert results == [JobResult(3, "6\n"), JobResult(-1, "-2\n")]
+
+    def test_errors_are_collected(self):
+        results = BatchRunner(parse(DOUBLING_CODE), Interpreter, 100, workers=2).run([["x"], [], ["1"]])
+        assert results[0].exit_code is None and "int" in results[0].error
+        assert results[1].error == "EOFError: EOF when reading a line"
+        assert results[2] == JobResult(1, "2\n")
+
+    def test_no_jobs(self):
+        assert BatchRunner(parse(DOUBLING_CODE), Interpreter, 100).run([]) == []
+
+    def test_wrong_number_of_workers(self):
+        with pytest.raises(MisnomerBatchWorkersException):
+            BatchRunner(parse(DOUBLING_CODE), Interpreter, 100, workers=0)
+
+    def test_worker_compiles_once(self, monkeypatch):
+        compilations = []
+        compile_program = Compiler.compile_program
+        monkeypatch.setattr(Compiler, "compile_program", lambda compiler: compilations.append(compiler)
+                            or compile_program(compiler))
+        batch_runner._initialise_worker(parse(DOUBLING_CODE), VirtualMachine, 100)
+        assert [batch_runner._run_job([str(number)]) for number in range(3)] == \
+            [JobResult(number, f"{number * 2}\n") for number in range(3)]
+        assert len(compilations) == 1
+
+    def test_run_job_restores_streams(self, capsys):
+        assert run_job(CompiledProgram(parse(DOUBLING_CODE)), 100, ["4"]) == JobResult(4, "8\n")
+        print("after")
+        assert capsys.readouterr().out == "after\n"
+
+
+class TestInputVectors:
+    def test_load(self, tmp_path):
+        path = tmp_path / "inputs.jsonl"
+        path.write_text('["3", "4"]\n\n[5]\n[]\n', encoding="utf-8")
+        assert load_input_vectors(str(path)) == [["3", "4"], ["5"], []]
+
+    @pytest.mark.parametrize("line", ('"3"', "[3", "{}"))
+    def test_wrong_line(self, tmp_path, line):
+        path = tmp_path / "inputs.jsonl"
+        path.write_text(f"[1]\n{line}\n", encoding="utf-8")
+        with pytest.raises(MisnomerBatchInputVectorException) as exception:
+            load_input_vectors(str(path))
+        assert "Line 2" in str(exception.value)
+
+    def test_format(self):
+        lines = format_job_results([JobResult(1, "a\n"), JobResult(None, "", "error")]).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"job": 0, "exit_code": 1, "output": "a\n", "error": None},
+            {"job": 1, "exit_code": None, "output": "", "error": "error"},
+        ]
@@ -0,0 +1,42 @@
+import pytest
+
+from interpreter.builtin_functions import builtin_functions
+from interpreter.closure_compiler import ClosureCompiler, ClosureInterpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException, \
+    MisnomerInterpreterVariableDoesNotExistException
+from test_virtual_machine import parse
+
+COUNT_CODE = """
+count(n: int) returns int {
+    if (n <= 0) { return 0; }
+    return count(n - 1) + 1;
+}
+
+main() returns int {
+    return count(50);
+}
+"""
+
+
+class TestClosureInterpreter:
+    def test_compiled_program_runs_many_times(self):
+        execute_main = ClosureCompiler(parse(COUNT_CODE)).compile_program()
+        assert execute_main(100, builtin_functions) == execute_main(100, builtin_functions) == 50
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException, match=r"reached \(51\)"):
+            execute_main(51, builtin_functions)
+
+    def test_recursion_limit(self):
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException, match=r"reached \(51\)"):
+            ClosureInterpreter(parse(COUNT_CODE), 51).execute()
+        assert ClosureInterpreter(parse(COUNT_CODE), 52).execute() == 50
+
+    def test_variable_initialised_in_branch(self):
+        code = """
+        main() returns int {
+            var c: int = 0;
+            if (c) { var x: int = 1; }
+            x = 2;
+        }
+        """
+        with pytest.raises(MisnomerInterpreterVariableDoesNotExistException):
+            ClosureInterpreter(parse(code)).execute()
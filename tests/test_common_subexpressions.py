@@ -0,0 +1,84 @@
+from conftest import eliminate_common_subexpressions, transformed
+from interpreter.interpreter import Interpreter
+from optimizer.common_subexpressions import CommonSubexpressionEliminator
+from parser.syntax_tree.expressions import MultiplicativeExpression
+from parser.syntax_tree.statements import VariableInitialisationStatement
+from test_virtual_machine import execute, parse
+from vm.virtual_machine import VirtualMachine
+
+ELIMINATION_SAMPLES = (
+    "f(a: int, b: int) returns int { return a * b + a * b; } main() returns int { return f(2, 3); }",
+    "main() returns int { var a: int = 2; var x: int = a * a; a = 3; var y: int = a * a; return x + y; }",
+    "main() returns int { var a: int = 2; if (a * a > 3) { return a * a; } return a * a + 1; }",
+    "main() returns int { var a: int = 2; var b: int = 0; print(a); return a / b + a / b; }",
+    "g() returns int { print('g'); return 1; }"
+    "main() returns int { var a: int = 2; var b: int = 0; var x: float = g() + a / b; return a / b; }",
+    "g() returns int { print('g'); return 1; } main() returns int { return g() + 1 + (g() + 1); }",
+    "main() returns int { var s: string = 'ab'; print(s * 2, s * 2); return 1; }",
+    "main() returns int { var s: string = 'ab'; print(s + 1, s + 1); return 1; }",
+    "main() returns int { var a: int = 1; if (a) { var b: int = 2; print(a + b); } print(a + 5, a + 5); }",
+    "main() returns int { var a: int = 1; if (a) { return 4; } var b: int = 2; return (a + b) * (a + b); }",
+    "main() returns int { var a: int = 0; while (a < 3) { print(a + 1, a + 1); a = a + 1; } return a + 1; }",
+    "main() returns int { var a: int = 1; var x: int = a + x; var y: int = a + x; return y; }",
+    "main() returns int { var a: int = 1; return 0 or a + 1 > 1 or a + 1; }",
+    "main() returns float { var a: int = 1; var b: float = 2.5; return (a + b) * (a + b); }",
+    # Assignments within branches
+    "f(x: int, c: int) returns int { if (c) { x = 5; print(x * 2); } print(x * 2); return 0; }"
+    "main() returns int { f(1, 0); return f(1, 1); }",
+    "main() returns int { var p1: int = 1; print(-p1); if (1) { p1 = 7 + p1; print(-p1); } return -p1; }",
+    "main() returns int { var a: int = 1; if (a) { print(a * 3); a = 2; print(a * 3); } else { a = 4; } "
+    "return a * 3 + a * 3; }",
+)
+
+
+def count_nodes(program, node_class, function_name="main"):
+    statement_block = program.function_definitions[function_name].statement_block
+    return sum(1 for node in statement_block.iterate_nodes() if isinstance(node, node_class))
+
+
+class TestCommonSubexpressionEliminatorParity:
+    def test_same_results(self):
+        for code in ELIMINATION_SAMPLES:
+            expected_result = execute(Interpreter, code)
+            for engine_class in (Interpreter, VirtualMachine):
+                assert execute(transformed(engine_class, eliminate_common_subexpressions), code) == expected_result
+
+
+class TestCommonSubexpressionEliminator:
+    def test_triangle(self):
+        with open("code_examples/triangle.mnm", encoding="utf-8") as file:
+            program = CommonSubexpressionEliminator(parse(file.read())).eliminate()
+        # a*a, b*b and c*c are computed once instead of three times
+        assert count_nodes(program, MultiplicativeExpression, "check_pythagoras") == 3
+        assert count_nodes(program, VariableInitialisationStatement, "check_pythagoras") == 2
+
+    def test_expression_computed_once(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[0])).eliminate()
+        assert count_nodes(program, MultiplicativeExpression, "f") == 1
+
+    def test_assignment_changes_expression(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[1])).eliminate()
+        assert count_nodes(program, MultiplicativeExpression) == 2
+
+    def test_function_calls_are_not_shared(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[5])).eliminate()
+        assert count_nodes(program, VariableInitialisationStatement) == 0
+
+    def test_failing_expression_is_not_moved(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[4])).eliminate()
+        assert count_nodes(program, VariableInitialisationStatement) == 3
+
+    def test_loops_are_left_alone(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[10])).eliminate()
+        assert count_nodes(program, VariableInitialisationStatement) == 1
+
+    def test_assignment_in_branch_changes_expression(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[14])).eliminate()
+        # x * 2 after the assignment is neither computed before the branch nor shared with the one after it
+        assert count_nodes(program, MultiplicativeExpression, "f") == 2
+        assert count_nodes(program, VariableInitialisationStatement, "f") == 0
+
+    def test_expression_after_branch_is_shared(self):
+        program = CommonSubexpressionEliminator(parse(ELIMINATION_SAMPLES[16])).eliminate()
+        # Only a * 3 of the return statement is computed once, each branch one is left alone
+        assert count_nodes(program, MultiplicativeExpression) == 3
@@ -0,0 +1,91 @@
+from conftest import fold_constants, transformed
+from interpreter.interpreter import Interpreter
+from optimizer.constant_folder import ConstantFolder
+from parser.syntax_tree.expressions import AdditiveExpression, AdditiveInvertedExpression
+from parser.syntax_tree.literals import NumericLiteral, StringLiteral
+from parser.syntax_tree.statements import Identifier
+from parser.syntax_tree.tree_printer import format_tree
+from test_virtual_machine import execute, parse
+from vm.virtual_machine import VirtualMachine
+
+FOLDING_SAMPLES = (
+    "main() returns int { return 2 * 3 + 4 - 1; }",
+    "main() returns float { return 1 / 4 + 2; }",
+    "main() returns int { return -1 + 'a'; }",
+    "main() returns int { return -(1 * 'ab'); }",
+    "main() returns int { return 1 / (2 - 2); }",
+    "main() returns int { var a: int = 2; return a / (1 - 1); }",
+    "main() returns int { var a: int = 2; return -(-a) + a * 1 + 0; }",
+    "main() returns int { return -(-(1 < 2)); }",
+    "main() returns int { return (1 < 2) * 1; }",
+    "main() returns int { var s: string = 'x'; return -(-s); }",
+    "main() returns int { var s: string = 'x'; return 1 + 2 + s; }",
+    "main() returns int { var s: string = 'x'; return 1 * 2 * s * 1; }",
+    "main() returns int { var a: float = 1.5; return a + 0 + 1 - 1; }",
+    "main() returns int { var a: int = 0; if (0 or a or 3 < 2) return 1; else if (1 and !0) return 2; }",
+    "f() returns int { print('f'); return 1; } main() returns int { return 0 or f() or 1; }",
+    "main() returns int { return 'ab' * 3 == 'ababab'; }",
+)
+
+
+def fold_return_value(code):
+    program = ConstantFolder(parse(code)).fold()
+    return program.function_definitions["main"].statement_block.statements[-1].value
+
+
+class TestConstantFolderParity:
+    def test_same_results(self):
+        for code in FOLDING_SAMPLES:
+            expected_result = execute(Interpreter, code)
+            for engine_class in (Interpreter, VirtualMachine):
+                assert execute(transformed(engine_class, fold_constants), code) == expected_result
+
+
+class TestConstantFolder:
+    def test_fold_constant_expression(self):
+        value = fold_return_value("main() returns float { return (2 + 3) * 4 / 8 - 1; }")
+        assert isinstance(value, NumericLiteral)
+        assert value.value == 1.5
+
+    def test_fold_string(self):
+        value = fold_return_value("main() returns int { return 'ab' * 2; }")
+        assert isinstance(value, StringLiteral)
+        assert value.value == "abab"
+
+    def test_long_string_is_not_folded(self):
+        value = fold_return_value("main() returns int { return 'ab' * 100000; }")
+        assert not isinstance(value, StringLiteral)
+
+    def test_fold_constant_prefix(self):
+        value = fold_return_value("main() returns int { var a: int = 1; return 1 + 2 + a; }")
+        assert isinstance(value, AdditiveExpression)
+        assert len(value.expressions) == 2
+        assert value.expressions[0].value == 3
+
+    def test_double_negation(self):
+        value = fold_return_value("main() returns int { var a: int = 1; return -(-a); }")
+        assert isinstance(value, Identifier)
+
+    def test_double_negation_of_string(self):
+        value = fold_return_value("main() returns int { var a: string = 'a'; return -(-a); }")
+        assert isinstance(value, AdditiveInvertedExpression)
+
+    def test_multiplication_by_one(self):
+        value = fold_return_value("main() returns int { var a: int = 1; return a * 1; }")
+        assert isinstance(value, Identifier)
+
+    def test_division_by_zero_is_kept(self):
+        code = "main() returns int { return 1 + 10 / 0; }"
+        result = execute(transformed(Interpreter, fold_constants), code)
+        assert result == execute(Interpreter, code)
+        assert "l: 1, c: 36" in result[0][1]
+
+    def test_format_tree(self):
+        program = ConstantFolder(parse("main() returns int { return 2 + 3; }")).fold()
+        assert format_tree(program).splitlines() == [
+            "Program (l: 1, c: 1)",
+            "  FunctionDefinition main() returns int (l: 1, c: 1)",
+            "    StatementBlock (l: 1, c: 20)",
+            "      ReturnStatement (l: 1, c: 22)",
+            "        NumericLiteral 5 (l: 1, c: 29)",
+        ]
@@ -0,0 +1,70 @@
+from conftest import eliminate_dead_code, transformed
+from interpreter.interpreter import Interpreter
+from optimizer.dead_code import DeadCodeEliminator, format_dead_code_report
+from test_virtual_machine import execute, parse
+from vm.virtual_machine import VirtualMachine
+
+DEAD_CODE_SAMPLES = (
+    "f() returns int { return 1; print('dead'); } main() returns int { return f(); }",
+    "main() returns int { if (1 < 0) { print('no'); } else { print('yes'); } return 2; }",
+    "main() returns int { if (1) print('yes'); else print('no'); while (0) print('never'); return 2; }",
+    "main() returns int { if ('') return 1; else if (0) return 2; return 3; }",
+    "f() returns int { if (1) { return 1; } else { return 2; } return 3; } main() returns int { return f(); }",
+    "f() returns nothing { return; } main() returns int { var a: int = 1; return a; f(); }",
+    "main() returns int { if (0) { var x: int = 1; } x = 2; return x; }",
+)
+
+
+def get_main_statements(program):
+    return program.function_definitions["main"].statement_block.statements
+
+
+class TestDeadCodeEliminatorParity:
+    def test_same_results(self):
+        for code in DEAD_CODE_SAMPLES:
+            expected_result = execute(Interpreter, code)
+            for engine_class in (Interpreter, VirtualMachine):
+                assert execute(transformed(engine_class, eliminate_dead_code), code) == expected_result
+
+
+class TestDeadCodeEliminator:
+    def test_statements_after_return(self):
+        program = eliminate_dead_code(parse("main() returns int { return 1; print('a'); print('b'); }"))
+        assert len(get_main_statements(program)) == 1
+
+    def test_return_without_value_is_not_final(self):
+        program = eliminate_dead_code(parse("main() returns int { return; print('a'); }"))
+        assert len(get_main_statements(program)) == 2
+
+    def test_constant_conditions(self):
+        program = eliminate_dead_code(parse(DEAD_CODE_SAMPLES[2]))
+        assert [statement.__class__.__name__ for statement in get_main_statements(program)] == \
+            ["FunctionCall", "ReturnStatement"]
+
+    def test_unreachable_functions(self):
+        code = """
+        unused() returns int { return helper(); }
+        helper() returns int { return 1; }
+        print() returns int { return 2; }
+        used() returns int { return 3; }
+        main() returns int { return used(); }
+        """
+        program = eliminate_dead_code(parse(code))
+        # Functions named like builtin ones are reported when running the program
+        assert list(program.function_definitions) == ["print", "used", "main"]
+
+    def test_calls_of_unknown_functions_are_kept(self):
+        code = "unused() returns int { return g(); } main() returns int { return 1; g(); }"
+        program = eliminate_dead_code(parse(code))
+        assert list(program.function_definitions) == ["unused", "main"]
+        assert len(get_main_statements(program)) == 2
+
+    def test_report(self):
+        code = "unused() returns int { return 1; } main() returns int { while (0) { print(1); } return 1; }"
+        eliminator = DeadCodeEliminator(parse(code))
+        eliminator.eliminate()
+        assert format_dead_code_report(eliminator.removed).splitlines() == [
+            "Removed never executed WhileStatement at: l: 1, c: 57.",
+            "Removed never called function unused at: l: 1, c: 1.",
+        ]
+        assert format_dead_code_report([]) == "No dead code has been found."
@@ -0,0 +1,159 @@
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from checker.type_checker import StaticTypeChecker
+from embedding import CompiledProgram, compile, compiled_programs
+from interpreter.closure_compiler import ClosureCompiler, ClosureInterpreter
+from interpreter.interpreter import Interpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException
+from parser.parser_exceptions import MisnomerParserException
+from parser.syntax_tree.syntax_tree import Program
+from transpiler.python_transpiler import PythonTranspiler, TranspilingInterpreter
+from vm.compiler import Compiler
+from vm.virtual_machine import VirtualMachine
+
+GREETING_CODE = """
+main() returns int {
+    var name: string = input('Name: ');
+    print('Hello', name);
+    return 3;
+}
+"""
+COUNTDOWN_CODE = """
+f(n: int) returns int {
+    print(n);
+    if (n <= 0) {
+        return 0;
+    }
+    return f(n - 1) + 1;
+}
+main() returns int {
+    var name: string = input('Name: ');
+    print('Hello', name);
+    return f(10);
+}
+"""
+RECURSION_CODE = "f(n: int) returns int { if (n <= 0) { return 0; } return f(n - 1) + 1; }" \
+                 "main() returns int { return f(50); }"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    compiled_programs.__init__(compiled_programs.max_entries)
+    yield
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    # Makes runs made by different threads interleave
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+class TestCompiledProgram:
+    def test_runs_many_times(self):
+        program = compile(GREETING_CODE)
+        for name in ("Ann", "Bob", "Cid"):
+            stdout = io.StringIO()
+            assert program.run(stdin=f"{name}\n", stdout=stdout) == 3
+            assert stdout.getvalue() == f"Hello {name}\n"
+
+    def test_file_streams(self, capsys):
+        program = compile(GREETING_CODE, engine=VirtualMachine)
+        assert program.run(stdin=io.StringIO("Dee\n")) == 3
+        assert capsys.readouterr().out == "Hello Dee\n"
+
+    def test_recursion_limit(self):
+        program = compile(RECURSION_CODE)
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException):
+            program.run(recursion_limit=20)
+        assert program.run(recursion_limit=100) == 50
+
+    def test_types_are_checked_once(self, monkeypatch):
+        checks = []
+        check = StaticTypeChecker.check
+        monkeypatch.setattr(StaticTypeChecker, "check", lambda checker: checks.append(check(checker)))
+        program = compile(GREETING_CODE)
+        for _ in range(3):
+            program.run(stdin="Ann\n", stdout=io.StringIO())
+        assert len(checks) == 1
+        assert program.program.type_checked
+
+    @pytest.mark.parametrize("engine, compiler, method_name", (
+        (Interpreter, Program, "link_function_calls"),
+        (ClosureInterpreter, ClosureCompiler, "compile_program"),
+        (VirtualMachine, Compiler, "compile_program"),
+        (TranspilingInterpreter, PythonTranspiler, "transpile"),
+    ))
+    def test_compiled_once(self, engine, compiler, method_name, monkeypatch):
+        compilations = []
+        method = getattr(compiler, method_name)
+        monkeypatch.setattr(compiler, method_name,
+                            lambda *arguments: compilations.append(arguments) or method(*arguments))
+        program = compile(RECURSION_CODE, engine=engine)
+        for recursion_limit in (100, 60, 100):
+            assert program.run(recursion_limit=recursion_limit) == 50
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException):
+            program.run(recursion_limit=20)
+        assert len(compilations) == 1
+
+    @pytest.mark.parametrize("engine", (Interpreter, ClosureInterpreter, VirtualMachine, TranspilingInterpreter))
+    def test_concurrent_runs(self, engine, frequent_thread_switches):
+        program = compile(COUNTDOWN_CODE, engine=engine)
+        countdown = "".join(f"{n}\n" for n in range(10, -1, -1))
+
+        def run(run_number):
+            name = f"Run {run_number}"
+            # Every other run has too few calls for the countdown
+            recursion_limit = 100 if run_number % 2 else 5 + run_number % 4
+            stdout = io.StringIO()
+            try:
+                return program.run(stdin=f"{name}\n", stdout=stdout, recursion_limit=recursion_limit), \
+                    stdout.getvalue()
+            except MisnomerInterpreterExceededMaximumDepthException as exception:
+                return str(exception), stdout.getvalue()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run, range(40)))
+        for run_number, (result, output) in enumerate(results):
+            if run_number % 2:
+                assert (result, output) == (10, f"Hello Run {run_number}\n{countdown}")
+            else:
+                assert result.endswith(f"Maximum call depth has been reached ({5 + run_number % 4}).")
+                assert output.startswith(f"Hello Run {run_number}\n10\n")
+
+    def test_optimise(self):
+        program = compile("main() returns int { return 2 * 3 + 1; }", optimise=True)
+        assert program.run() == 7
+        assert isinstance(program, CompiledProgram)
+
+
+class TestCompiledProgramsCache:
+    def test_same_source_is_parsed_once(self):
+        assert compile(GREETING_CODE) is compile(GREETING_CODE)
+        assert (compiled_programs.hits, compiled_programs.misses) == (1, 1)
+
+    def test_settings_are_part_of_key(self):
+        program = compile(GREETING_CODE)
+        assert compile(GREETING_CODE, engine=VirtualMachine) is not program
+        assert compile(GREETING_CODE, max_string_length=10) is not program
+        assert compile(GREETING_CODE, optimise=True) is not program
+
+    def test_least_recently_used_is_dropped(self):
+        compiled_programs.__init__(2)
+        first = compile("main() returns int { return 1; }")
+        compile("main() returns int { return 2; }")
+        compile("main() returns int { return 1; }")
+        compile("main() returns int { return 3; }")
+        assert compile("main() returns int { return 1; }") is first
+        assert len(compiled_programs) == 2
+
+    def test_invalid_source_is_not_cached(self):
+        with pytest.raises(MisnomerParserException):
+            compile("main() returns int {")
+        assert len(compiled_programs) == 0
@@ -0,0 +1,19 @@
+from interpreter.interpreter import Interpreter
+from test_virtual_machine import CODE_SAMPLES, EXCEPTION_SAMPLES, execute
+
+
+class TestEngineParity:
+    def test_same_results(self, engine):
+        for code in CODE_SAMPLES:
+            assert execute(engine, code) == execute(Interpreter, code)
+
+    def test_same_exceptions(self, engine):
+        for code in EXCEPTION_SAMPLES:
+            result = execute(engine, code)
+            assert isinstance(result[0], tuple)
+            assert result == execute(Interpreter, code)
+
+    def test_code_examples(self, engine):
+        with open("code_examples/fibonacci.mnm", encoding="utf-8") as file:
+            code = file.read()
+        assert execute(engine, code, 900) == execute(Interpreter, code, 900)
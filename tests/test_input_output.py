@@ -0,0 +1,126 @@
+import io
+
+import pytest
+
+from interpreter.closure_compiler import ClosureInterpreter
+from interpreter.input_output import BufferedInputOutput
+from interpreter.interpreter import Interpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterZeroDivisionException
+from test_virtual_machine import parse
+from transpiler.python_transpiler import TranspilingInterpreter
+from vm.virtual_machine import VirtualMachine, StackMachine
+
+ENGINES = (Interpreter, ClosureInterpreter, VirtualMachine, StackMachine, TranspilingInterpreter)
+ECHO_CODE = """
+main() returns int {
+    print('start', 1, 2.5);
+    var a: string = input('first: ');
+    var b: string = input('second: ');
+    print(b, a);
+    return 0;
+}
+"""
+
+
+class InteractiveInput(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class CountingInput(io.StringIO):
+    reads = 0
+
+    def read(self, *args):
+        self.reads += 1
+        return super().read(*args)
+
+
+class TestBufferedInputOutput:
+    def test_print_is_buffered(self):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO(), stdout, buffer_size=100)
+        input_output.print("a", 1, 2.5, True)
+        assert stdout.getvalue() == ""
+        input_output.flush()
+        assert stdout.getvalue() == "a 1 2.5 True\n"
+
+    def test_full_buffer_is_written(self):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO(), stdout, buffer_size=4)
+        input_output.print("ab")
+        assert stdout.getvalue() == ""
+        input_output.print("c")
+        assert stdout.getvalue() == "ab\nc\n"
+
+    def test_unbuffered(self):
+        stdout = io.StringIO()
+        BufferedInputOutput(io.StringIO(), stdout, buffer_size=0).print()
+        assert stdout.getvalue() == "\n"
+
+    def test_non_interactive_input(self):
+        stdin = CountingInput("x\n\ny")
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(stdin, stdout)
+        input_output.print("before")
+        assert [input_output.input("prompt: ") for _ in range(3)] == ["x", "", "y"]
+        # Output is written before reading, prompts are not
+        assert stdout.getvalue() == "before\n"
+        assert stdin.reads == 1
+        with pytest.raises(EOFError):
+            input_output.input()
+
+    def test_echo_prompts(self):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO("1\n"), stdout, echo_prompts=True)
+        assert input_output.input(5) == "1"
+        assert stdout.getvalue() == "5"
+
+    def test_interactive_input(self):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(InteractiveInput("1\n2"), stdout)
+        input_output.print("a")
+        assert input_output.input("n: ") == "1"
+        assert stdout.getvalue() == "a\nn: "
+        assert input_output.input() == "2"
+        with pytest.raises(EOFError):
+            input_output.input()
+
+    def test_writer_thread(self):
+        stdout = io.StringIO()
+        with BufferedInputOutput(io.StringIO("z\n"), stdout, buffer_size=10, writer_thread=True) as input_output:
+            for number in range(100):
+                input_output.print(number)
+            assert input_output.input() == "z"
+            assert stdout.getvalue() == "".join(f"{number}\n" for number in range(100))
+            input_output.print("end")
+        assert stdout.getvalue().endswith("99\nend\n")
+
+    def test_writer_thread_error(self):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO(), stdout, buffer_size=0, writer_thread=True)
+        stdout.close()
+        input_output.print("a")
+        with pytest.raises(ValueError):
+            input_output.flush()
+
+
+class TestEngines:
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_same_output(self, engine, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO("x\ny\n"))
+        assert engine(parse(ECHO_CODE), 100).execute() == 0
+        expected_output = capsys.readouterr().out
+
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO("x\ny\n"), stdout, echo_prompts=True)
+        assert engine(parse(ECHO_CODE), 100, input_output).execute() == 0
+        assert stdout.getvalue() == expected_output == "start 1 2.5\nfirst: second: y x\n"
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_output_is_flushed_on_error(self, engine):
+        stdout = io.StringIO()
+        input_output = BufferedInputOutput(io.StringIO(), stdout)
+        with pytest.raises(MisnomerInterpreterZeroDivisionException):
+            engine(parse("main() returns int { print('a'); return 1 / 0; }"), 100, input_output).execute()
+        assert stdout.getvalue() == "a\n"
@@ -3,7 +3,8 @@ import sys
 
 import pytest
 
-from interpreter.interpreter import Interpreter
+from interpreter.builtin_functions import builtin_functions
+from interpreter.interpreter import Interpreter, Context
 from interpreter.interpreter_exceptions import MisnomerInterpreterNoMainFunctionException, \
     MisnomerInterpreterVariableAlreadyExistsException, MisnomerInterpreterArgumentsNumberDoesNotMatchException, \
     MisnomerInterpreterFunctionDoesNotExistException, MisnomerInterpreterVariableDoesNotExistException, \
@@ -16,6 +17,7 @@ from parser.parser import Parser
 from utils.source_reader.source_reader import StringSourceReader
 
 
+@pytest.mark.usefixtures("engine")
 class TestParser:
     def test_fibonacci(self):
         test_cases = ((8, 21), (13, 233), (15, 610), (18, 2584), (20, 6765))
@@ -294,6 +296,7 @@ class TestParser:
         assert exit_code == 0
 
 
+@pytest.mark.usefixtures("engine")
 class TestParserExceptions:
     def test_recursion_limit(self):
         code = """
@@ -576,3 +579,66 @@ class TestParserExceptions:
             interpreter = Interpreter(program)
             with pytest.raises(MisnomerInterpreterFunctionCallParameterTypeException):
                 interpreter.execute()
+
+
+class TestContext:
+    def test_contexts_share_function_table(self):
+        code = """
+        foo() returns int {
+            return 1;
+        }
+        main() returns int {
+            return foo();
+        }
+        """
+        with StringSourceReader(code) as source:
+            program = Parser(Lexer(source)).parse_program()
+        context = Context(10)
+        assert program.execute(context) == 1
+        new_context = context.get_new_context(0)
+        assert new_context.functions is context.functions
+        assert new_context.get_function("foo") is program.function_definitions["foo"]
+        assert "foo" not in builtin_functions
+        with pytest.raises(TypeError):
+            context.functions["bar"] = program.function_definitions["foo"]
+
+
+class TestFunctionCallLinking:
+    def test_calls_are_bound_to_functions(self):
+        code = """
+        foo(a: int) returns int {
+            return a;
+        }
+        main() returns int {
+            print(foo(1));
+            return foo(2);
+        }
+        """
+        with StringSourceReader(code) as source:
+            program = Parser(Lexer(source)).parse_program()
+        assert Interpreter(program).execute() == 2
+        print_call, return_statement = program.function_definitions["main"].statement_block.statements
+        assert print_call.function is None and print_call.execute == print_call.execute_builtin_function
+        assert print_call.arguments[0].function is program.function_definitions["foo"]
+        assert return_statement.value.function is program.function_definitions["foo"]
+
+    def test_unknown_function_is_reported_before_execution(self):
+        code = """
+        main() returns int {
+            print("started");
+            if (0) {
+                foo();
+            }
+            return 1;
+        }
+        """
+        with StringSourceReader(code) as source:
+            program = Parser(Lexer(source)).parse_program()
+        stdout = sys.stdout
+        sys.stdout = output = io.StringIO()
+        try:
+            with pytest.raises(MisnomerInterpreterFunctionDoesNotExistException):
+                Interpreter(program).execute()
+        finally:
+            sys.stdout = stdout
+        assert output.getvalue() == ""
@@ -78,6 +78,15 @@ class TestLexerTokenAssignments:
 
         assert tokens == correct_tokens
 
+    def test_identifiers_are_interned(self):
+        code = "".join(["some_identifier ", "some_", "identifier"])
+        with StringSourceReader(code) as source:
+            lexer = Lexer(source)
+            first_token = lexer.get_next_token()
+            second_token = lexer.get_next_token()
+
+        assert first_token.get_value() is second_token.get_value()
+
 
 class TestLexerExceptions:
     def test_non_escaped_string(self):
@@ -0,0 +1,79 @@
+from conftest import move_loop_invariants, transformed
+from interpreter.interpreter import Interpreter
+from optimizer.loop_invariants import LoopInvariantMover
+from parser.syntax_tree.expressions import MultiplicativeExpression
+from parser.syntax_tree.statements import VariableInitialisationStatement, WhileStatement
+from test_virtual_machine import execute, parse
+from vm.virtual_machine import VirtualMachine
+
+LOOP_SAMPLES = (
+    """
+    main() returns int {
+        var n: int = 30; var k: int = 7; var total: int = 0; var i: int = 0;
+        while (i < n * 2 - k) {
+            total = total + (k * k + 3) * i - k * k;
+            i = i + 1;
+        }
+        return total;
+    }
+    """,
+    """
+    main() returns int {
+        var k: int = 2; var s: string = 'a'; var i: int = 0;
+        while (i < 2) { i = i + 1; s = k * k + s; }
+    }
+    """,
+    "main() returns int { var b: int = 0; while (0 > 1) { print(1 / b); } return b; }",
+    "main() returns int { var b: string = 'x'; var i: int = 0; while (i < 2) { i = i + 1; print(-(b * 2)); } }",
+    """
+    main() returns int {
+        var a: int = 3; var i: int = 0; var j: int = 0; var total: float = 0;
+        while (i < a * a) {
+            j = 0;
+            while (j < a + 1) { total = total + a / 2 + i * (a + 1); j = j + 1; }
+            i = i + 1;
+        }
+        return total;
+    }
+    """,
+    "main() returns int { var a: int = 0; while (a < 3) { var b: int = a * 2; a = a + 1; } return a; }",
+    "main() returns int { var i: int = 0; while (i < 3) { i = i + 1; var c: int = 1; print(c * 2); } }",
+    "main() returns int { var i: int = 0; while (i < 3) { i = i + 1; print(i * i, x * 2); } var x: int = 1; }",
+)
+
+
+def count_nodes_in_loops(program, node_class):
+    statement_block = program.function_definitions["main"].statement_block
+    loops = [node for node in statement_block.statements if isinstance(node, WhileStatement)]
+    return sum(1 for loop in loops for node in loop.iterate_nodes() if isinstance(node, node_class))
+
+
+class TestLoopInvariantMoverParity:
+    def test_same_results(self):
+        for code in LOOP_SAMPLES:
+            expected_result = execute(Interpreter, code)
+            for engine_class in (Interpreter, VirtualMachine):
+                assert execute(transformed(engine_class, move_loop_invariants), code) == expected_result
+
+
+class TestLoopInvariantMover:
+    def test_invariants_are_moved(self):
+        program = LoopInvariantMover(parse(LOOP_SAMPLES[0])).move()
+        # Only the multiplication by i is left in the loop
+        assert count_nodes_in_loops(program, MultiplicativeExpression) == 1
+        statements = program.function_definitions["main"].statement_block.statements
+        assert [statement.name for statement in statements if isinstance(statement, VariableInitialisationStatement)] \
+            == ["n", "k", "total", "i", "_licm0", "_licm1", "_licm2"]
+
+    def test_failing_expression_is_not_moved(self):
+        program = LoopInvariantMover(parse(LOOP_SAMPLES[2])).move()
+        assert count_nodes_in_loops(program, MultiplicativeExpression) == 1
+
+    def test_nested_loops(self):
+        program = LoopInvariantMover(parse(LOOP_SAMPLES[4])).move()
+        # i * (a + 1) still depends on i, changed by the outer loop
+        assert count_nodes_in_loops(program, MultiplicativeExpression) == 1
+
+    def test_variables_changed_in_loop(self):
+        program = LoopInvariantMover(parse(LOOP_SAMPLES[6])).move()
+        assert count_nodes_in_loops(program, MultiplicativeExpression) == 1
@@ -0,0 +1,112 @@
+import pytest
+
+from interpreter.interpreter import Interpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException
+from interpreter.memoization import MemoCache, MISSING, find_pure_functions, install_memo_caches, \
+    format_memo_statistics
+from test_virtual_machine import parse
+
+FIBONACCI_CODE = """
+fibonacci(n: int) returns int {
+    if (n <= 1) { return n; }
+    else {
+        var a: int = fibonacci(n-1);
+        var b: int = fibonacci(n-2);
+        return a+b;
+    }
+}
+
+main() returns int {
+    return fibonacci(25);
+}
+"""
+
+# Result of g(10), which takes 11 nested calls, is cached by main, then needed by h 13 calls deep
+NESTED_RECURSION_CODE = """
+g(n: int) returns int { if (n <= 0) { return 0; } return g(n - 1) + 1; }
+h(n: int) returns int { if (n <= 0) { return g(10); } return h(n - 1); }
+main() returns int {
+    print(g(10));
+    print(h(12));
+    return 0;
+}
+"""
+
+
+class TestMemoCache:
+    def test_lru_eviction(self):
+        memo_cache = MemoCache(2, "lru")
+        memo_cache.store(1, "a")
+        memo_cache.store(2, "b")
+        assert memo_cache.get(1) == "a"
+        memo_cache.store(3, "c")
+        assert memo_cache.get(2) is MISSING
+        assert memo_cache.get(1) == "a"
+        assert (memo_cache.hits, memo_cache.misses) == (2, 1)
+
+    def test_fifo_eviction(self):
+        memo_cache = MemoCache(2, "fifo")
+        memo_cache.store(1, "a")
+        memo_cache.store(2, "b")
+        assert memo_cache.get(1) == "a"
+        memo_cache.store(3, "c")
+        assert memo_cache.get(1) is MISSING
+        assert memo_cache.get(2) == "b"
+
+    def test_unlimited(self):
+        memo_cache = MemoCache(0)
+        for key in range(100):
+            memo_cache.store(key, key)
+        assert len(memo_cache) == 100
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            MemoCache(10, "random")
+
+
+class TestMemoization:
+    def test_pure_functions(self):
+        code = """
+        square(a: int) returns int { return a * a; }
+        twice(a: int) returns int { return square(a) + square(a); }
+        show(a: int) returns nothing { print(a); }
+        indirect(a: int) returns int { show(a); return twice(a); }
+        cast(a: string) returns int { return to_int(a) + find_max(1, 2); }
+        main() returns int { return indirect(1); }
+        """
+        assert find_pure_functions(parse(code)) == {"square", "twice", "cast"}
+
+    def test_same_results(self):
+        program = parse(FIBONACCI_CODE)
+        memo_caches = install_memo_caches(program, 10)
+        assert Interpreter(program, 100).execute() == 75025
+        assert memo_caches["fibonacci"].hits == 23
+        assert len(memo_caches["fibonacci"]) == 10
+        assert format_memo_statistics(memo_caches) == \
+            "Memoized function fibonacci: 23 hits, 26 misses, 10 cached results."
+
+    def test_argument_types_are_distinguished(self):
+        code = """
+        double(a: float) returns float { return a * 2; }
+        main() returns string {
+            var a: int = double(1);
+            var b: float = double(1.0);
+            return to_string(b) * a;
+        }
+        """
+        program = parse(code)
+        install_memo_caches(program, 10)
+        assert Interpreter(program).execute() == "2.02.0"
+
+    @pytest.mark.parametrize("memoize", (False, True))
+    def test_cached_result_does_not_exceed_recursion_limit(self, memoize, capsys):
+        program = parse(NESTED_RECURSION_CODE)
+        if memoize:
+            memo_caches = install_memo_caches(program, 10)
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException):
+            Interpreter(program, 24).execute()
+        assert capsys.readouterr().out == "10\n"
+        assert Interpreter(program, 25).execute() == 0
+        assert capsys.readouterr().out == "10\n10\n"
+        if memoize:
+            assert memo_caches["g"].hits == 3
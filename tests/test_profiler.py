@@ -0,0 +1,97 @@
+import itertools
+import json
+
+import pytest
+
+from interpreter.interpreter import Interpreter
+from interpreter.memoization import install_memo_caches
+from interpreter.profiler import Profiler, format_profile, format_profile_json
+from parser.syntax_tree.statements import FunctionCall
+from test_virtual_machine import CODE_SAMPLES, EXCEPTION_SAMPLES, execute, parse
+
+RECURSION_CODE = """
+g() returns int { return 1; }
+f(n: int) returns int { if (n <= 0) { return g(); } return f(n - 1) + g(); }
+main() returns int { print(f(3)); return 0; }
+"""
+
+
+class ProfilingInterpreter(Interpreter):
+    def __init__(self, program, recursion_limit=1000, input_output=None):
+        super().__init__(program, recursion_limit, input_output, Profiler())
+
+
+def profile(code, program=None):
+    # Every reading of the clock advances it by a second
+    profiler = Profiler(clock=itertools.count().__next__)
+    Interpreter(program or parse(code), 100, profiler=profiler).execute()
+    return profiler
+
+
+class TestProfilerParity:
+    def test_same_results(self):
+        for code in CODE_SAMPLES + (RECURSION_CODE,):
+            assert execute(ProfilingInterpreter, code) == execute(Interpreter, code)
+
+    def test_same_exceptions(self):
+        for code in EXCEPTION_SAMPLES:
+            assert execute(ProfilingInterpreter, code) == execute(Interpreter, code)
+
+
+class TestProfiler:
+    def test_calls_and_depth(self, capsys):
+        profiles = profile(RECURSION_CODE).profiles
+        assert {name: (profile.calls, profile.max_depth) for name, profile in profiles.items()} == {
+            "main": (1, 1), "f": (4, 4), "g": (4, 1), "print": (1, 1),
+        }
+        assert capsys.readouterr().out == "4\n"
+
+    def test_times(self):
+        profiles = profile(RECURSION_CODE).profiles
+        # Time of every call is counted once, either as exclusive time of the called function or of its caller
+        assert sum(profile.exclusive_time for profile in profiles.values()) == profiles["main"].inclusive_time
+        # Recursive calls are within the outermost one
+        assert profiles["f"].inclusive_time < profiles["main"].inclusive_time
+        assert profiles["f"].exclusive_time + profiles["g"].inclusive_time == profiles["f"].inclusive_time
+        assert all(profile.exclusive_time > 0 for profile in profiles.values())
+
+    def test_exception_leaves_calls(self):
+        profiler = Profiler()
+        with pytest.raises(Exception):
+            Interpreter(parse(EXCEPTION_SAMPLES[9]), 100, profiler=profiler).execute()
+        assert all(profile.depth == 0 for profile in profiler.profiles.values())
+        assert profiler.profiles["g"].calls == 1
+
+    def test_memoized_functions(self):
+        program = parse(RECURSION_CODE)
+        memo_caches = install_memo_caches(program, 0)
+        profile(RECURSION_CODE, program)
+        assert memo_caches["g"].hits == 3
+
+    def test_disabled_after_profiling(self):
+        program = parse(RECURSION_CODE)
+        profile(RECURSION_CODE, program)
+        Interpreter(program, 100).execute()
+        calls = [node for node in program.iterate_nodes() if isinstance(node, FunctionCall)]
+        assert all(call.execute != call.execute_profiled_function for call in calls)
+
+    def test_calls_are_linked_once(self):
+        program = parse(RECURSION_CODE)
+        Interpreter(program, 100).execute()
+        calls = [node for node in program.iterate_nodes() if isinstance(node, FunctionCall)]
+        linked_calls = [call.execute for call in calls]
+        profile(RECURSION_CODE, program)
+        # Runs which are not profiled can be made while profiling, as profiled calls are chosen by their contexts
+        assert [call.execute for call in calls] == linked_calls
+
+    def test_format(self):
+        profiler = profile(RECURSION_CODE)
+        lines = format_profile(profiler, "calls").splitlines()
+        assert lines[0].split() == ["Function", "Calls", "Inclusive", "[s]", "Exclusive", "[s]", "Max", "depth"]
+        assert [line.split()[0] for line in lines[1:]] == ["f", "g", "main", "print"]
+        assert list(json.loads(format_profile_json(profiler, "inclusive"))) == ["main", "f", "g", "print"]
+        assert format_profile(Profiler()) == "No function has been profiled."
+
+    def test_unknown_sort_key(self):
+        with pytest.raises(ValueError):
+            Profiler().get_sorted_profiles("name")
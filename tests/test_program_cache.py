@@ -0,0 +1,68 @@
+from interpreter.interpreter import Interpreter
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from parser.program_cache import load_compiled_program, store_compiled_program, get_compiled_path
+from utils.source_hash import hash_source_file
+from utils.source_reader.source_reader import FileSourceReader
+
+CODE = """fibonacci(n: int) returns int {
+    if (n <= 1) { return n; }
+    else {
+        var a: int = fibonacci(n-1);
+        var b: int = fibonacci(n-2);
+        return a+b;
+    }
+}
+
+main() returns int {
+    var text: string = "result";
+    while (not fibonacci(3) == 2 or -1 > 2 and 1 / 2 != 0.5) { text = "loop"; }
+    return fibonacci(12);
+}
+"""
+
+
+def write_and_parse(tmp_path, code=CODE):
+    path = tmp_path / "script.mnm"
+    path.write_text(code, encoding="utf-8")
+    with FileSourceReader(str(path)) as source:
+        program = Parser(Lexer(source)).parse_program()
+    return str(path), program
+
+
+class TestProgramCache:
+    def test_compiled_path(self):
+        assert get_compiled_path("scripts/fibonacci.mnm") == "scripts/fibonacci.mnmc"
+
+    def test_loaded_program_is_equal(self, tmp_path):
+        path, program = write_and_parse(tmp_path)
+        source_hash = hash_source_file(path)
+
+        assert store_compiled_program(path, source_hash, 1000, program)
+        loaded_program = load_compiled_program(path, source_hash, 1000)
+        assert loaded_program == program
+        assert repr(loaded_program.function_definitions["main"].position) == "l: 10, c: 1"
+
+    def test_loaded_program_executes(self, tmp_path):
+        path, program = write_and_parse(tmp_path)
+        source_hash = hash_source_file(path)
+        store_compiled_program(path, source_hash, 1000, program)
+
+        assert Interpreter(load_compiled_program(path, source_hash, 1000)).execute() == 144
+
+    def test_outdated_program_is_not_loaded(self, tmp_path):
+        path, program = write_and_parse(tmp_path)
+        store_compiled_program(path, hash_source_file(path), 1000, program)
+        path, _ = write_and_parse(tmp_path, CODE.replace("12", "13"))
+
+        assert load_compiled_program(path, hash_source_file(path), 1000) is None
+        assert load_compiled_program(path, hash_source_file(path), 100) is None
+
+    def test_corrupted_program_is_not_loaded(self, tmp_path):
+        path, program = write_and_parse(tmp_path)
+        source_hash = hash_source_file(path)
+        store_compiled_program(path, source_hash, 1000, program)
+        with open(get_compiled_path(path), "r+b") as file:
+            file.truncate(100)
+
+        assert load_compiled_program(path, source_hash, 1000) is None
@@ -0,0 +1,59 @@
+import pytest
+
+from interpreter.interpreter import Interpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException
+from test_virtual_machine import execute, parse
+from transpiler.python_transpiler import PythonTranspiler, TranspilingInterpreter
+
+
+class TestTranspilingInterpreter:
+    def test_evaluation_order(self):
+        code = """
+        f() returns int { print('f'); return 1; }
+        main() returns int { return 'a' + f(); }
+        """
+        assert execute(TranspilingInterpreter, code) == execute(Interpreter, code)
+
+    def test_recursion_limit(self):
+        code = "f(n: int) returns int { if (n <= 0) { return 0; } return f(n - 1) + 1; } " \
+               "main() returns int { return f(50); }"
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException, match=r"reached \(51\)"):
+            TranspilingInterpreter(parse(code), 51).execute()
+        assert TranspilingInterpreter(parse(code), 52).execute() == 50
+
+
+class TestPythonTranspiler:
+    def test_functions_become_python_functions(self):
+        code = """
+        square(a: int) returns int {
+            return a * a;
+        }
+
+        main() returns int {
+            var b: int = square(3);
+            return b;
+        }
+        """
+        source = PythonTranspiler(parse(code)).transpile()
+        assert "def f_square(calls, v_a):" in source
+        assert "v_b = t_" in source
+        compile(source, "<misnomer>", "exec")
+
+    def test_non_ascii_names(self):
+        code = "żółw(ą: int) returns int { return ą; } main() returns int { var ę: int = żółw(2); return ę; }"
+        assert TranspilingInterpreter(parse(code), 20).execute() == 2
+
+    def test_returned_call_is_made_once(self):
+        code = "f(n: int) returns int { if (n <= 0) { return 0; } return f(n - 1); } " \
+               "main() returns int { return f(3); }"
+        source = PythonTranspiler(parse(code)).transpile()
+        function_source = source.split("def f_main")[0]
+        assert function_source.count("= f_f(calls, ") == 1
+
+    def test_returned_value_of_loop_is_computed_once(self):
+        code = """
+        f(n: int) returns int { print(n); return n; }
+        g() returns int { var i: int = 0; while (i < 2) { i = i + 1; return f(i) + 1; } return 0; }
+        main() returns int { return g() + f(2); }
+        """
+        assert execute(TranspilingInterpreter, code) == execute(Interpreter, code) == (4, "1\n2\n")
@@ -0,0 +1,105 @@
+import pytest
+
+from lexer.lexer import Lexer
+from lexer.regex_lexer import RegexLexer
+from lexer.token.token_type import TokenType
+from utils.exceptions import MisnomerException
+from utils.source_reader.source_reader import StringSourceReader
+
+CODE_SAMPLES = (
+    """fibonacci(n: int) returns int {
+    if (n <= 1) { return n; }
+    else {
+        var a: int = fibonacci(n-1);
+        var b: int = fibonacci(n-2);
+        return a+b;
+    }
+}""",
+    """
+    check_pythagoras(a: int, b: int, c: int) returns nothing {
+        if (a*a + b*b > c*c) {
+            print("This is acute triangle.");
+        } else if (a*a + b*b == c*c and not a != b or !(a >= c)) {
+            print('This is right triangle.');
+        }
+        while (a <= 0 or b <= 0) { a = to_int(input("a: ")); continue; break; }
+    }
+    """,
+    "\n\nmain() returns float {\r\n\treturn 0.5 + 12.25 / 3. - 0;\r\n}\r\n",
+    "var a: string = 'He said \\'hi\\'\\n\\t\\\\ \"quoted\" \\0 end';",
+    'var b: string = "single \' inside";',
+    "a==b!=c<=d>=e<f>g=h!i",
+    "<== !== =!= >=>",
+    "returnsx returns return varx var_1 _var 1abc",
+    "zażółć gęślą jaźń Łódź x²y ² Ⅷ ٣٤ x٣",
+    "@ # $ % ^ & | ~ ` ? [ ] . \\",
+    "a\0b",
+    "\n",
+    "",
+    "   \t\x0b\x0c\xa0  ok",
+    "123456789012345678901234567890 0.000001 7.",
+)
+
+EXCEPTION_SAMPLES = (
+    "var a: string = 'Testing unterminated string;",
+    f"var a: string = '{'s' * 1001}'",
+    "var a: string = 'Something longer than anticipated';",
+    "var a: string = 'escaped quotes \\'\\'\\'\\'\\'\\'\\'\\'\\'\\' make it too long';",
+    "var a: int = 0012",
+    "var a: int = 00.12",
+    "var a: int = 00.x12",
+    "var a: int = 00.",
+    "var a: float = 1.2.3",
+    "var a: string = 'wrong \\escape';",
+    "var a: string = 'escape at the end \\",
+    "var a: string = 'terminated by \0 character';",
+)
+
+
+def tokenize(lexer_class, code, max_string_length=20):
+    with StringSourceReader(code, chunk_size=4) as source:
+        lexer = lexer_class(source, max_string_length)
+        tokens = []
+        while True:
+            token = lexer.get_next_token()
+            tokens.append((token.get_type(), token.get_value(), token.get_position()))
+            if token.get_type() == TokenType.EOF and len(tokens) > 1 and tokens[-2][0] == TokenType.EOF:
+                return tokens
+
+
+def tokenize_or_fail(lexer_class, code, max_string_length=20):
+    try:
+        return tokenize(lexer_class, code, max_string_length)
+    except MisnomerException as exception:
+        return type(exception), str(exception)
+
+
+def tokenize_with_exception(lexer_class, code):
+    with pytest.raises(MisnomerException) as exception_info:
+        tokenize(lexer_class, code)
+    return type(exception_info.value), str(exception_info.value)
+
+
+class TestRegexLexerParity:
+    def test_same_tokens(self):
+        for code in CODE_SAMPLES:
+            assert tokenize(RegexLexer, code, 1000) == tokenize(Lexer, code, 1000)
+
+    def test_same_tokens_with_short_strings(self):
+        for code in CODE_SAMPLES:
+            assert tokenize_or_fail(RegexLexer, code) == tokenize_or_fail(Lexer, code)
+
+    def test_same_value_types(self):
+        code = "1 1.5 0 0.0 3. 'str' name"
+        for regex_token, token in zip(tokenize(RegexLexer, code), tokenize(Lexer, code)):
+            assert type(regex_token[1]) == type(token[1])
+
+    def test_same_exceptions(self):
+        for code in EXCEPTION_SAMPLES:
+            assert tokenize_with_exception(RegexLexer, code) == tokenize_with_exception(Lexer, code)
+
+    def test_code_examples(self):
+        for path in ("code_examples/fibonacci.mnm", "code_examples/triangle.mnm"):
+            with open(path, encoding="utf-8") as file:
+                code = file.read()
+            assert tokenize(RegexLexer, code, 1000) == tokenize(Lexer, code, 1000)
@@ -0,0 +1,45 @@
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from utils.source_reader.source_reader import StringSourceReader
+
+
+def parse(code):
+    with StringSourceReader(code) as source:
+        return Parser(Lexer(source)).parse_program()
+
+
+class TestVariableResolver:
+    def test_parameters_take_first_slots(self):
+        code = "f(a: int, b: int) returns int { var c: int = b; return a; }"
+        function = parse(code).function_definitions["f"]
+        initialisation, return_statement = function.statement_block.statements
+        assert function.variables_number == 3
+        assert initialisation.slot == 2
+        assert initialisation.value.slot == 1
+        assert return_statement.value.slot == 0
+
+    def test_same_name_same_slot(self):
+        code = """
+        f(a: int) returns int {
+            if (a) { var x: int = 1; } else { var x: int = 2; }
+            x = x + 1;
+            return x;
+        }
+        """
+        function = parse(code).function_definitions["f"]
+        if_statement, assignment, return_statement = function.statement_block.statements
+        slots = {if_statement.instructions.statements[0].slot, if_statement.else_statement.statements[0].slot,
+                 assignment.slot, assignment.value.expressions[0].slot, return_statement.value.slot}
+        assert slots == {1}
+        assert function.variables_number == 2
+
+    def test_slots_are_per_function(self):
+        code = "f(a: int) returns int { return a; } g() returns int { var b: int = 1; return b; }"
+        program = parse(code)
+        assert program.function_definitions["f"].statement_block.statements[0].value.slot == 0
+        assert program.function_definitions["g"].statement_block.statements[0].slot == 0
+
+    def test_undeclared_variable_gets_slot(self):
+        function = parse("f() returns int { return x; }").function_definitions["f"]
+        assert function.statement_block.statements[0].value.slot == 0
+        assert function.variables_number == 1
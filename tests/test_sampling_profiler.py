@@ -0,0 +1,70 @@
+import sys
+from collections import Counter
+
+from interpreter.interpreter import Interpreter
+from interpreter.sampling_profiler import SamplingProfiler, get_misnomer_stack, format_folded_stacks
+from test_virtual_machine import parse
+
+NESTED_CODE = """g(a: int) returns int {
+    print(a);
+    return a;
+}
+f(n: int) returns int {
+    if (n <= 0) { return g(5); }
+    return f(n - 1);
+}
+main() returns int { var x: int = 1; return f(1) + x; }"""
+LOOP_CODE = """
+f(n: int) returns int { if (n <= 1) { return n; } return f(n - 1) + f(n - 2); }
+main() returns int { var i: int = 0; while (i < 3) { f(17); i = i + 1; } return 0; }
+"""
+
+
+class StackRecordingInputOutput:
+    """
+    Records the Misnomer stack whenever the program prints.
+    """
+    def __init__(self):
+        self.stacks = []
+
+    def print(self, *values):
+        self.stacks.append(get_misnomer_stack(sys._getframe()))
+
+    def input(self, prompt=""):
+        return ""
+
+    def flush(self):
+        pass
+
+
+class TestMisnomerStack:
+    def test_nested_calls(self):
+        input_output = StackRecordingInputOutput()
+        Interpreter(parse(NESTED_CODE), 100, input_output).execute()
+        assert input_output.stacks == [(
+            "main (l: 9, c: 45)", "f (l: 7, c: 12)", "f (l: 6, c: 26)", "g (l: 2, c: 5)"
+        )]
+
+    def test_outside_of_program(self):
+        assert get_misnomer_stack(sys._getframe()) == ()
+
+
+class TestSamplingProfiler:
+    def test_samples(self):
+        with SamplingProfiler(interval=0.0005) as profiler:
+            Interpreter(parse(LOOP_CODE), 100).execute()
+        assert profiler.samples
+        assert all(stack[0].startswith("main (") for stack in profiler.samples)
+        assert any(len(stack) > 1 and stack[1].startswith("f (") for stack in profiler.samples)
+
+    def test_no_samples_when_idle(self):
+        profiler = SamplingProfiler()
+        profiler.start()
+        profiler.sample()
+        profiler.stop()
+        assert not profiler.samples
+
+    def test_folded_stacks(self):
+        samples = Counter({("main (l: 1, c: 2)", "f (l: 3, c: 4)"): 3, ("main (l: 1, c: 5)",): 1})
+        assert format_folded_stacks(samples) == "main (l: 1, c: 2);f (l: 3, c: 4) 3\nmain (l: 1, c: 5) 1\n"
+        assert format_folded_stacks(Counter()) == ""
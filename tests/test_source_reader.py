@@ -0,0 +1,110 @@
+import pickle
+from copy import copy
+
+import pytest
+
+from lexer.dictionaries import EOF
+from utils.exceptions import MisnomerExecutiveNotFoundError, MisnomerEncodingError, MisnomerChunkSizeError
+from utils.position import Position
+from utils.source_reader.source_reader import StringSourceReader, FileSourceReader, MemoryMappedFileSourceReader
+
+
+def read_all_characters(source):
+    characters = [source.get_first_character()]
+    while characters[-1] != EOF:
+        characters.append(source.get_next_character())
+    return characters
+
+
+class TestSourceReader:
+    def test_chunk_sizes_give_same_characters(self):
+        code = "main() returns int {\n    print(\"zażółć\");\r\n    return 0;\n}\n"
+        with StringSourceReader(code) as source:
+            correct_characters = read_all_characters(source)
+
+        for chunk_size in (1, 2, 3, 7, 64, -1):
+            with StringSourceReader(code, chunk_size) as source:
+                assert read_all_characters(source) == correct_characters
+
+    @pytest.mark.parametrize("chunk_size", (0, -2))
+    def test_invalid_chunk_size(self, chunk_size, tmp_path):
+        with pytest.raises(MisnomerChunkSizeError):
+            StringSourceReader("main", chunk_size)
+        path = tmp_path / "source.mnm"
+        path.write_text("main")
+        with pytest.raises(MisnomerChunkSizeError):
+            MemoryMappedFileSourceReader(str(path), chunk_size)
+
+    def test_chunk_sizes_give_same_positions(self):
+        code = "a\nbc\n\ndef"
+        correct_positions = [Position(2, 0, 2), Position(2, 1, 3), Position(2, 2, 4), Position(3, 0, 5),
+                             Position(4, 0, 6), Position(4, 1, 7), Position(4, 2, 8), Position(4, 3, 9),
+                             Position(4, 4, 10), Position(4, 5, 11)]
+        for chunk_size in (1, 2, 5, -1):
+            with StringSourceReader(code, chunk_size) as source:
+                source.get_first_character()
+                positions = []
+                for _ in range(len(correct_positions)):
+                    source.get_next_character()
+                    positions.append(source.get_position())
+
+            assert positions == correct_positions
+
+    def test_eof_is_repeated(self):
+        with StringSourceReader("ab", 1) as source:
+            assert source.get_first_character() == "a"
+            assert source.get_next_character() == "b"
+            assert source.get_next_character() == EOF
+            assert source.get_next_character() == EOF
+
+
+class TestMemoryMappedFileSourceReader:
+    def test_same_characters_as_file_reader(self, tmp_path):
+        path = tmp_path / "script.mnm"
+        path.write_bytes("main() returns int {\r\n    print(\"zażółć 😀\");\r    return 0;\n}\r\n".encode("utf-8"))
+        with FileSourceReader(str(path)) as source:
+            correct_characters = read_all_characters(source)
+
+        for chunk_size in (1, 2, 3, 5, 64, -1):
+            with MemoryMappedFileSourceReader(str(path), chunk_size) as source:
+                assert read_all_characters(source) == correct_characters
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.mnm"
+        path.write_bytes(b"")
+        with MemoryMappedFileSourceReader(str(path)) as source:
+            assert source.get_first_character() == EOF
+
+    def test_file_not_found(self, tmp_path):
+        with pytest.raises(MisnomerExecutiveNotFoundError):
+            MemoryMappedFileSourceReader(str(tmp_path / "missing.mnm"))
+
+    def test_wrong_encoding(self, tmp_path):
+        path = tmp_path / "latin.mnm"
+        path.write_bytes("zażółć".encode("iso8859_2"))
+        with MemoryMappedFileSourceReader(str(path)) as source:
+            with pytest.raises(MisnomerEncodingError):
+                read_all_characters(source)
+
+
+class TestSourcePosition:
+    def test_position_resolved_after_further_reading(self):
+        with StringSourceReader("ab\ncd\nef", 2) as source:
+            source.get_first_character()
+            source.get_next_character()
+            position = source.get_position()
+            while source.get_next_character() != EOF:
+                pass
+
+        assert position == Position(1, 2, 2)
+        assert repr(position) == "l: 1, c: 2"
+
+    def test_position_copy_and_pickle(self):
+        with StringSourceReader("a\nb") as source:
+            source.get_first_character()
+            source.get_next_character()
+            source.get_next_character()
+            position = source.get_position()
+
+        assert copy(position) == Position(2, 1, 3)
+        assert pickle.loads(pickle.dumps(position)) == Position(2, 1, 3)
@@ -21,7 +21,13 @@ class TestToken:
         assert token.get_position() == Position(1, 1, 1)
         assert token.get_value() == "Something"
 
+    def test_token_has_no_instance_dictionary(self):
+        token = Token("Something", Position(1, 1, 1), TokenType.IDENTIFIER)
 
+        assert not hasattr(token, "__dict__")
+
+
+@pytest.mark.skipif(not __debug__, reason="tokens are not checked in optimised (python -O) runs")
 class TestTokenExceptions:
     def test_token_value_and_type_check(self):
         with pytest.raises(MisnomerTokenInappropriateTypeException):
@@ -38,3 +44,12 @@ class TestTokenExceptions:
     def test_token_value_and_type_check_4(self):
         with pytest.raises(MisnomerTokenInappropriateTypeException):
             Token(155.3746, Position(1, 1, 1), TokenType.COLON)
+
+
+@pytest.mark.skipif(__debug__, reason="tokens are checked unless run optimised (python -O)")
+class TestOptimisedToken:
+    def test_token_value_and_type_are_not_checked(self):
+        token = Token("Something", Position(1, 1, 1), TokenType.NUMERIC_LITERAL)
+
+        assert token.get_type() == TokenType.NUMERIC_LITERAL
+        assert token.get_value() == "Something"
@@ -0,0 +1,85 @@
+import os
+
+from lexer.lexer import Lexer
+from lexer.token_cache import TokenCache
+from parser.parser import Parser
+from utils.source_hash import hash_source_file
+from utils.source_reader.source_reader import FileSourceReader
+
+CODE = """fibonacci(n: int) returns int {
+    if (n <= 1) { return n; }
+    else {
+        var a: int = fibonacci(n-1);
+        var b: int = fibonacci(n-2);
+        return a+b;
+    }
+}
+
+main() returns int {
+    print("The Fibonacci number is:", fibonacci(10), 1.5);
+    return 0;
+}
+"""
+
+
+def read_tokens(lexer, count):
+    return [(token.get_type(), token.get_value(), token.get_position())
+            for token in (lexer.get_next_token() for _ in range(count))]
+
+
+def write_source(tmp_path, code=CODE):
+    path = tmp_path / "script.mnm"
+    path.write_text(code, encoding="utf-8")
+    return str(path)
+
+
+def store_tokens(cache, path, max_string_length=1000):
+    with FileSourceReader(path) as source:
+        return cache.store(path, hash_source_file(path), max_string_length, Lexer(source, max_string_length))
+
+
+class TestTokenCache:
+    def test_cached_tokens_match_lexer(self, tmp_path):
+        path = write_source(tmp_path)
+        cache = TokenCache(str(tmp_path / "cache"))
+        stored_lexer = store_tokens(cache, path)
+        loaded_lexer = cache.load(path, hash_source_file(path), 1000)
+        with FileSourceReader(path) as source:
+            correct_tokens = read_tokens(Lexer(source), 80)
+
+        assert read_tokens(stored_lexer, 80) == correct_tokens
+        assert read_tokens(loaded_lexer, 80) == correct_tokens
+
+    def test_cached_tokens_give_same_program(self, tmp_path):
+        path = write_source(tmp_path)
+        cache = TokenCache(str(tmp_path / "cache"))
+        store_tokens(cache, path)
+        with FileSourceReader(path) as source:
+            correct_program = Parser(Lexer(source)).parse_program()
+
+        assert Parser(cache.load(path, hash_source_file(path), 1000)).parse_program() == correct_program
+
+    def test_changed_source_is_not_loaded(self, tmp_path):
+        path = write_source(tmp_path)
+        cache = TokenCache(str(tmp_path / "cache"))
+        store_tokens(cache, path)
+        write_source(tmp_path, CODE.replace("10", "11"))
+
+        assert cache.load(path, hash_source_file(path), 1000) is None
+
+    def test_different_max_string_length_is_not_loaded(self, tmp_path):
+        path = write_source(tmp_path)
+        cache = TokenCache(str(tmp_path / "cache"))
+        store_tokens(cache, path)
+
+        assert cache.load(path, hash_source_file(path), 10) is None
+
+    def test_corrupted_entry_is_not_loaded(self, tmp_path):
+        path = write_source(tmp_path)
+        cache = TokenCache(str(tmp_path / "cache"))
+        store_tokens(cache, path)
+        cache_path = cache.get_cache_path(path)
+        with open(cache_path, "r+b") as file:
+            file.truncate(os.path.getsize(cache_path) // 2)
+
+        assert cache.load(path, hash_source_file(path), 1000) is None
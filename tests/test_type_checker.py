@@ -0,0 +1,110 @@
+import pytest
+
+from checker.checker_exceptions import MisnomerCheckerVariableTypeException, MisnomerCheckerParameterTypeException, \
+    MisnomerCheckerReturnTypeException, MisnomerCheckerOperandTypeException, MisnomerCheckerArgumentsNumberException
+from checker.type_checker import StaticTypeChecker
+from test_virtual_machine import parse
+
+
+def get_statements(program, function_name="main"):
+    return program.function_definitions[function_name].statement_block.statements
+
+
+class TestStaticTypeChecker:
+    def test_fibonacci_is_well_typed(self):
+        with open("code_examples/fibonacci.mnm", encoding="utf-8") as file:
+            program = parse(file.read())
+        StaticTypeChecker(program, strict=True).check()
+        fibonacci = program.function_definitions["fibonacci"]
+        assert not fibonacci.check_return_type
+        else_block = fibonacci.statement_block.statements[0].else_statement
+        assert not else_block.statements[0].check_type
+        assert not else_block.statements[0].value.check_arguments
+
+    def test_proven_checks_are_disabled(self):
+        code = """
+        half(a: float) returns float {
+            return a / 2;
+        }
+        main() returns int {
+            var a: int = 1;
+            var b: float = half(a);
+            a = a * 3 - 1;
+            return a;
+        }
+        """
+        program = parse(code)
+        StaticTypeChecker(program).check()
+        initialisation, float_initialisation, assignment, _ = get_statements(program)
+        assert not initialisation.check_type
+        assert not float_initialisation.check_type
+        assert not float_initialisation.value.check_arguments
+        assert not assignment.check_type
+        assert not program.function_definitions["half"].check_return_type
+        assert not program.function_definitions["main"].check_return_type
+
+    def test_unproven_checks_are_kept(self):
+        code = """
+        main() returns int {
+            var a: float = 1;
+            var b: float = 1.5;
+            var c: int = 1 < 2;
+            a = b;
+            if (a) { return 1; }
+        }
+        """
+        program = parse(code)
+        StaticTypeChecker(program).check()
+        _, _, bool_initialisation, assignment, _ = get_statements(program)
+        assert bool_initialisation.check_type
+        assert assignment.check_type
+        assert program.function_definitions["main"].check_return_type
+
+    def test_variable_types_depend_on_other_variables(self):
+        code = """
+        main() returns int {
+            var a: int = 0;
+            while (a < 10) {
+                var b: int = c;
+                a = a + 1;
+            }
+            var c: int = a;
+            return a;
+        }
+        """
+        program = parse(code)
+        StaticTypeChecker(program, strict=True).check()
+        assert not get_statements(program)[1].instructions.statements[0].check_type
+
+    def test_endless_loop_returns(self):
+        program = parse("main() returns int { while (1) { return 5; } }")
+        StaticTypeChecker(program, strict=True).check()
+        assert not program.function_definitions["main"].check_return_type
+
+    def test_values_returned_after_return_flag(self):
+        code = """
+        g() returns string { return "x"; }
+        f() returns int { return; g(); return 3; }
+        main() returns int { return f(); }
+        """
+        with pytest.raises(MisnomerCheckerReturnTypeException):
+            StaticTypeChecker(parse(code), strict=True).check()
+
+    def test_strict_mode_rejects_ill_typed_programs(self):
+        test_cases = (
+            ("main() returns int { var a: int = 1.5; return 0; }", MisnomerCheckerVariableTypeException),
+            ("main() returns int { var a: int = 1; a = 'x'; return 0; }", MisnomerCheckerVariableTypeException),
+            ("f(n: int) returns int { return n; } main() returns int { return f('x'); }",
+             MisnomerCheckerParameterTypeException),
+            ("f(n: int) returns int { return n; } main() returns int { return f(1, 2); }",
+             MisnomerCheckerArgumentsNumberException),
+            ("main() returns int { return 'a'; }", MisnomerCheckerReturnTypeException),
+            ("main() returns int { if (1) { return 1; } }", MisnomerCheckerReturnTypeException),
+            ("main() returns int { return 'a' + 1; }", MisnomerCheckerOperandTypeException),
+            ("main() returns int { return 1 < 'a'; }", MisnomerCheckerOperandTypeException),
+            ("main() returns int { return find_max(1, 'a'); }", MisnomerCheckerOperandTypeException),
+            ("main() returns int { return to_int(1, 2); }", MisnomerCheckerArgumentsNumberException),
+        )
+        for code, exception in test_cases:
+            with pytest.raises(exception):
+                StaticTypeChecker(parse(code), strict=True).check()
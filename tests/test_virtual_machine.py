@@ -0,0 +1,214 @@
+import io
+import sys
+
+import pytest
+
+from interpreter.interpreter import Interpreter
+from interpreter.interpreter_exceptions import MisnomerInterpreterExceededMaximumDepthException, \
+    MisnomerInterpreterNoMainFunctionException, MisnomerInterpreterVariableDoesNotExistException
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from utils.source_reader.source_reader import StringSourceReader
+from vm.compiler import Compiler
+from vm.opcodes import CHECK_LOCAL, TAIL_CALL, CALL
+from vm.virtual_machine import VirtualMachine, StackMachine
+
+CODE_SAMPLES = (
+    "main() returns int { return 5; }",
+    "main() returns int { var a: int = 0; while (a < 10) { a = a + 1; } return a; }",
+    "main() returns float { var a: float = 1; a = a / 4 - 0.5 * 2; return a; }",
+    "main() returns int { return 'ab' * 3; }",
+    "main() returns int { return -(-(3)) - -2; }",
+    "main() returns int { return 1 or 0; }",
+    "main() returns int { if (0 or '' or 3) { return 1; } else { return 2; } }",
+    "main() returns int { if (1 and 0) return 1; else if (1) return 7; }",
+    "main() returns int { if ('a' == 'a') return 3 != 0; }",
+    "main() returns float { return (1 or 0) + 1; }",
+    "main() returns float { return (2 < 3) * 4 - 1; }",
+    "main() returns int { print('a', 1, 2.5); return find_min(3, 1, 2) + find_max(4, 5); }",
+    "main() returns int { return to_int('12') + to_int(1.7); }",
+    "main() returns int { var c: int = 1; if (c) { var x: int = 1; } x = 2; return x; }",
+    "main(a: int) returns int { return 3; }",
+    # Return without a value does not leave the function
+    "g() returns int { return 7; } f() returns int { return; print('after'); g(); return 3; }"
+    "main() returns int { return f(); }",
+    "g() returns int { return 5; } f() returns int { g(); return; } main() returns int { return f(); }",
+    "f() returns int { if (1) return; return 3; } main() returns int { return f(); }",
+    # Loops are left as soon as their instruction gives a value
+    "f() returns int { return 4; } main() returns int { var i: int = 0; while (i < 5) f(); return i; }",
+    "f() returns int { return 4; }"
+    "main() returns int { var i: int = 0; while (i < 5) { i = i + 1; f(); } return i; }",
+    "f() returns int { var i: int = 0; while (i < 3) { i = i + 1; if (i == 2) return i * 10; } return 0; }"
+    "main() returns int { return f(); }",
+    "f() returns int { while (1) { return 5; } } main() returns int { return f() + 1; }",
+    "f(n: int) returns int { if (n <= 0) { return 0; } return f(n - 1) + 1; } main() returns int { return f(15); }",
+    # Returned values are computed once
+    "f(n: int) returns int { print(n); if (n <= 0) { return 0; } return f(n - 1); } main() returns int { return f(3); }",
+)
+
+EXCEPTION_SAMPLES = (
+    "main() returns int { return 'ab' * 'c'; }",
+    "main() returns int { return 'ab' + 1; }",
+    "main() returns int { return 1 - 'a'; }",
+    "main() returns int { return 1 / 'a'; }",
+    "main() returns int { return 1 / 0; }",
+    "main() returns int { return 1 / ''; }",
+    "main() returns int { return 1 < 'a'; }",
+    "main() returns int { return !find_max(''); }",
+    "main() returns int { return find_max(1, 'a') + 1; }",
+    "g(a: int) returns int { return 1 < 'a'; } main() returns int { return 2 - g(1); }",
+    "g(a: int) returns int { return 1 + 'a'; } main() returns int { return 2 * g(1); }",
+    "f() returns nothing { return; } main() returns int { f(); return 1 + f(); }",
+    "f(n: int) returns int { return f(n + 1); } main() returns int { return f(0); }",
+    "main() returns int { main(); }",
+    "f(n: int) returns int { return 'x'; } main() returns int { return f(0); }",
+    "f() returns int { if (0) return 2; } main() returns int { return f(); }",
+    "f(n: int) returns int { return 1; } main() returns int { return f('x'); }",
+    "f(n: int) returns int { return 1; } main() returns int { return f(1, 2); }",
+    "main() returns int { return g(1, x); }",
+    "main() returns int { if (0) { print(g()); } return 1; }",
+    "main() returns int { return x; }",
+    "main() returns int { x = 3; }",
+    "main() returns int { var a: int = 1; var a: int = 2; }",
+    "main() returns int { var a: int = 0; while (a < 3) { var b: int = a; a = a + 1; } return a; }",
+    "main() returns int { var c: int = 0; if (c) { var x: int = 1; } else { x = 2; } return 1; }",
+    "main() returns int { var a: int = 1.5; }",
+    "main() returns int { var a: float = 1; a = 2.5; }",
+    "main() returns int { var a: int = 1; a = 'x'; }",
+    "main() returns int { return to_int('abc'); }",
+    "print() returns int { return 1; } main() returns int { return 1; }",
+    "f() returns int { return 1; }",
+)
+
+
+def parse(code):
+    with StringSourceReader(code) as source:
+        return Parser(Lexer(source)).parse_program()
+
+
+def execute(engine_class, code, recursion_limit=20):
+    program = parse(code)
+    stdout = sys.stdout
+    sys.stdout = output = io.StringIO()
+    try:
+        result = engine_class(program, recursion_limit).execute()
+    except Exception as exception:
+        result = type(exception), str(exception)
+    finally:
+        sys.stdout = stdout
+    return result, output.getvalue()
+
+
+class TestVirtualMachine:
+    def test_deep_recursion(self):
+        code = """
+        count(n: int) returns int {
+            if (n <= 0) { return 0; }
+            return count(n - 1) + 1;
+        }
+
+        main() returns int {
+            return count(5000);
+        }
+        """
+        assert VirtualMachine(parse(code), 6000).execute() == 5000
+
+    def test_recursion_limit(self):
+        code = """
+        count(n: int) returns int {
+            if (n <= 0) { return 0; }
+            return count(n - 1) + 1;
+        }
+
+        main() returns int {
+            return count(50);
+        }
+        """
+        with pytest.raises(MisnomerInterpreterExceededMaximumDepthException):
+            VirtualMachine(parse(code), 51).execute()
+        assert VirtualMachine(parse(code), 52).execute() == 50
+        assert Interpreter(parse(code), 52).execute() == 50
+
+    def test_no_main(self):
+        with pytest.raises(MisnomerInterpreterNoMainFunctionException):
+            VirtualMachine(parse("f() returns int { return 1; }")).execute()
+
+    def test_variable_initialised_in_branch(self):
+        code = """
+        main() returns int {
+            var c: int = 0;
+            if (c) { var x: int = 1; }
+            x = 2;
+        }
+        """
+        with pytest.raises(MisnomerInterpreterVariableDoesNotExistException):
+            VirtualMachine(parse(code)).execute()
+
+    def test_initialised_variables_are_not_checked(self):
+        code = """
+        main() returns int {
+            var a: int = 0;
+            while (a < 10) {
+                a = a + 1;
+            }
+            return a;
+        }
+        """
+        compiled_program = Compiler(parse(code)).compile_program()
+        assert CHECK_LOCAL not in [opcode for opcode, _ in compiled_program.main.code]
+
+
+class TestStackMachine:
+    def test_same_results(self):
+        for code in CODE_SAMPLES:
+            assert execute(StackMachine, code) == execute(Interpreter, code)
+
+    def test_same_exceptions(self):
+        for code in EXCEPTION_SAMPLES:
+            expected = execute(Interpreter, code)
+            # Programs recursing endlessly would run out of memory instead
+            if expected[0][0] is not MisnomerInterpreterExceededMaximumDepthException:
+                assert execute(StackMachine, code) == expected
+
+    def test_deep_recursion(self):
+        code = """
+        count(n: int) returns int {
+            if (n <= 0) { return 0; }
+            return count(n - 1) + 1;
+        }
+
+        main() returns int {
+            return count(100000);
+        }
+        """
+        assert StackMachine(parse(code), 10).execute() == 100000
+
+    def test_tail_recursion(self):
+        code = """
+        count(n: int, total: int) returns int {
+            if (n <= 0) { return total; }
+            return count(n - 1, total + 2);
+        }
+
+        main() returns int {
+            return count(200000, 0);
+        }
+        """
+        compiled_program = Compiler(parse(code), tail_calls=True).compile_program()
+        assert TAIL_CALL in [opcode for opcode, _ in compiled_program.functions["count"].code]
+        assert StackMachine(parse(code)).execute() == 400000
+
+    def test_tail_call_keeps_return_type_check(self):
+        code = """
+        g() returns float { return 1.5; }
+        f() returns int { return g(); }
+        main() returns int { return f(); }
+        """
+        compiled_program = Compiler(parse(code), tail_calls=True).compile_program()
+        assert CALL in [opcode for opcode, _ in compiled_program.functions["f"].code]
+        assert TAIL_CALL not in [opcode for opcode, _ in compiled_program.functions["f"].code]
+        assert execute(StackMachine, code) == execute(Interpreter, code)
+
+    def test_tail_call_from_main(self):
+        code = "f() returns int { return 'x'; } main() returns float { return f(); }"
+        assert execute(StackMachine, code) == execute(Interpreter, code)